@@ -1 +1,3 @@
 """ The ``ncsw_chemistry`` package initialization module. """
+
+__version__ = "2025.5.1"
@@ -0,0 +1,5 @@
+""" The ``ncsw_chemistry.aio`` package initialization module. """
+
+from ncsw_chemistry.aio.batching import AsyncMicroBatcher
+
+from ncsw_chemistry.aio.service import AsyncChemistryService
@@ -0,0 +1,215 @@
+""" The ``ncsw_chemistry.aio`` package ``batching`` module. """
+
+from asyncio import AbstractEventLoop, Future, Semaphore, Task, TimerHandle, gather, get_running_loop
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+
+class AsyncMicroBatcher:
+    """ The asynchronous micro-batcher class. """
+
+    def __init__(
+            self,
+            batch_function: Callable[[List[Any]], List[Any]],
+            executor: Optional[Executor] = None,
+            max_batch_size: int = 64,
+            max_wait_time: float = 0.005,
+            max_number_of_pending_items: int = 1024,
+            max_number_of_concurrent_batches: int = 4
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter batch_function: The function that processes a batch of items and returns a result per item. The
+            exception instances among the results are raised for the respective items. The function should be picklable
+            if the executor is a process pool.
+        :parameter executor: The executor that runs the batch function. The value `None` indicates that the default
+            executor of the event loop should be utilized.
+        :parameter max_batch_size: The maximum number of items per batch. A batch is submitted immediately once it is
+            full.
+        :parameter max_wait_time: The maximum time in seconds that the first item of a batch waits for other items.
+        :parameter max_number_of_pending_items: The maximum number of items that are waiting for a result. The
+            submission of additional items is suspended until the number of pending items decreases.
+        :parameter max_number_of_concurrent_batches: The maximum number of batches that run concurrently.
+        """
+
+        if max_batch_size < 1 or max_number_of_pending_items < 1 or max_number_of_concurrent_batches < 1:
+            raise ValueError(
+                "The maximum batch size, number of pending items and number of concurrent batches should be positive."
+            )
+
+        self.batch_function = batch_function
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self.max_number_of_pending_items = max_number_of_pending_items
+        self.max_number_of_concurrent_batches = max_number_of_concurrent_batches
+
+        self.number_of_items = 0
+        self.number_of_batches = 0
+
+        self._pending_items: List[Tuple[Any, Future]] = list()
+        self._pending_item_semaphore: Optional[Semaphore] = None
+        self._batch_semaphore: Optional[Semaphore] = None
+        self._flush_timer_handle: Optional[TimerHandle] = None
+        self._batch_tasks: Set[Task] = set()
+        self._loop: Optional[AbstractEventLoop] = None
+
+    @property
+    def average_batch_size(
+            self
+    ) -> float:
+        """
+        Get the average number of items per submitted batch.
+
+        :returns: The average number of items per submitted batch.
+        """
+
+        return self.number_of_items / self.number_of_batches if self.number_of_batches > 0 else 0.0
+
+    def _bind_loop(
+            self
+    ) -> AbstractEventLoop:
+        """
+        Bind the micro-batcher to the running event loop on the first submission.
+
+        :returns: The running event loop.
+        """
+
+        if self._loop is None:
+            self._loop = get_running_loop()
+
+            self._pending_item_semaphore = Semaphore(
+                value=self.max_number_of_pending_items
+            )
+
+            self._batch_semaphore = Semaphore(
+                value=self.max_number_of_concurrent_batches
+            )
+
+        return self._loop
+
+    async def submit(
+            self,
+            item: Any
+    ) -> Any:
+        """
+        Submit an item and wait for its result.
+
+        :parameter item: The item that should be processed.
+
+        :returns: The result of the item.
+        """
+
+        loop = self._bind_loop()
+
+        async with self._pending_item_semaphore:
+            future = loop.create_future()
+
+            self._pending_items.append((item, future, ))
+
+            if len(self._pending_items) >= self.max_batch_size:
+                self._flush()
+
+            elif self._flush_timer_handle is None:
+                self._flush_timer_handle = loop.call_later(
+                    self.max_wait_time,
+                    self._flush
+                )
+
+            return await future
+
+    def _flush(
+            self
+    ) -> None:
+        """ Submit the pending items as a batch. """
+
+        if self._flush_timer_handle is not None:
+            self._flush_timer_handle.cancel()
+
+            self._flush_timer_handle = None
+
+        if len(self._pending_items) == 0:
+            return
+
+        batch_items, self._pending_items = self._pending_items, list()
+
+        batch_task = self._loop.create_task(
+            self._run_batch(
+                batch_items=batch_items
+            )
+        )
+
+        self._batch_tasks.add(
+            batch_task
+        )
+
+        batch_task.add_done_callback(
+            self._batch_tasks.discard
+        )
+
+    async def _run_batch(
+            self,
+            batch_items: List[Tuple[Any, Future]]
+    ) -> None:
+        """
+        Run the batch function on a batch of items and resolve the futures of the items.
+
+        :parameter batch_items: The items and futures of the batch.
+        """
+
+        async with self._batch_semaphore:
+            batch_items = [(item, future, ) for item, future in batch_items if not future.cancelled()]
+
+            if len(batch_items) == 0:
+                return
+
+            self.number_of_items += len(batch_items)
+            self.number_of_batches += 1
+
+            try:
+                batch_results = await self._loop.run_in_executor(
+                    self.executor,
+                    self.batch_function,
+                    [item for item, _ in batch_items]
+                )
+
+                if len(batch_results) != len(batch_items):
+                    raise RuntimeError(
+                        "The number of batch results ({number_of_results}) does not match the number of batch items "
+                        "({number_of_items}).".format(
+                            number_of_results=len(batch_results),
+                            number_of_items=len(batch_items)
+                        )
+                    )
+
+            except Exception as exception:
+                for _, future in batch_items:
+                    if not future.done():
+                        future.set_exception(exception)
+
+                return
+
+            for (_, future), batch_result in zip(batch_items, batch_results):
+                if future.done():
+                    continue
+
+                if isinstance(batch_result, BaseException):
+                    future.set_exception(batch_result)
+
+                else:
+                    future.set_result(batch_result)
+
+    async def drain(
+            self
+    ) -> None:
+        """ Submit the pending items and wait for all running batches to finish. """
+
+        if self._loop is not None:
+            self._flush()
+
+        while len(self._batch_tasks) > 0:
+            await gather(
+                *self._batch_tasks,
+                return_exceptions=True
+            )
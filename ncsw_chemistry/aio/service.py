@@ -0,0 +1,404 @@
+""" The ``ncsw_chemistry.aio`` package ``service`` module. """
+
+from asyncio import AbstractServer, StreamReader, StreamWriter, ensure_future, get_running_loop, start_server
+from concurrent.futures import Executor, ProcessPoolExecutor
+from json import dumps, loads
+from os import cpu_count
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from rdchiral.main import rdchiralReactants, rdchiralRun
+
+from ncsw_chemistry.aio.batching import AsyncMicroBatcher
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.execution.worker import get_cached_rdchiral_reaction, get_picklable_exception
+from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
+from ncsw_chemistry.reaction.utility.standardization import ReactionStandardizationUtility
+
+
+def _canonicalize_compound_smiles_strings(
+        compound_smiles_strings: Sequence[str]
+) -> List[Union[str, Exception]]:
+    """
+    Canonicalize a batch of chemical compound SMILES strings.
+
+    :parameter compound_smiles_strings: The SMILES strings of the chemical compounds.
+
+    :returns: The canonical SMILES strings of the chemical compounds without the atom map numbers, or the exceptions
+        of the chemical compounds that could not be canonicalized.
+    """
+
+    results = list()
+
+    for compound_smiles in compound_smiles_strings:
+        try:
+            compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                compound_smiles=compound_smiles
+            )
+
+            if compound_mol is None:
+                raise ValueError(
+                    "The chemical compound SMILES string '{compound_smiles}' could not be parsed.".format(
+                        compound_smiles=compound_smiles
+                    )
+                )
+
+            results.append(
+                CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                    compound_mol=compound_mol,
+                    remove_compound_atom_map_numbers=True
+                )
+            )
+
+        except Exception as exception:
+            results.append(
+                get_picklable_exception(
+                    exception=exception
+                )
+            )
+
+    return results
+
+
+def _standardize_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str]
+) -> List[Union[str, Exception]]:
+    """
+    Standardize a batch of chemical reaction SMILES strings.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+    :returns: The SMILES strings of the sanitized chemical reactions, or the exceptions of the chemical reactions that
+        could not be standardized.
+    """
+
+    results = list()
+
+    for reaction_smiles in reaction_smiles_strings:
+        try:
+            reaction_rxn = ReactionFormattingUtility.convert_reaction_smiles_to_rxn(
+                reaction_smiles=reaction_smiles,
+                useSmiles=True
+            )
+
+            if reaction_rxn is None:
+                raise ValueError(
+                    "The chemical reaction SMILES string '{reaction_smiles}' could not be parsed.".format(
+                        reaction_smiles=reaction_smiles
+                    )
+                )
+
+            results.append(
+                ReactionFormattingUtility.convert_reaction_rxn_to_smiles(
+                    reaction_rxn=ReactionStandardizationUtility.sanitize_reaction(
+                        reaction_rxn=reaction_rxn,
+                        deep_copy=False
+                    )
+                )
+            )
+
+        except Exception as exception:
+            results.append(
+                get_picklable_exception(
+                    exception=exception
+                )
+            )
+
+    return results
+
+
+def _apply_retro_templates(
+        retro_template_applications: Sequence[Tuple[str, str]]
+) -> List[Union[List[str], Exception]]:
+    """
+    Apply a batch of chemical reaction retro templates on chemical compounds using the RDChiral library. The compiled
+    chemical reaction retro templates are cached in the current thread.
+
+    :parameter retro_template_applications: The chemical reaction retro template SMARTS strings and chemical compound
+        SMILES strings.
+
+    :returns: The outcomes of the applications of the chemical reaction retro templates, or the exceptions of the
+        applications that failed.
+    """
+
+    results = list()
+
+    for retro_template_smarts, compound_smiles in retro_template_applications:
+        try:
+            results.append(
+                rdchiralRun(
+                    rxn=get_cached_rdchiral_reaction(
+                        retro_template_smarts=retro_template_smarts
+                    ),
+                    reactants=rdchiralReactants(
+                        reactant_smiles=compound_smiles
+                    )
+                )
+            )
+
+        except Exception as exception:
+            results.append(
+                get_picklable_exception(
+                    exception=exception
+                )
+            )
+
+    return results
+
+
+class AsyncChemistryService:
+    """ The asynchronous chemistry service class. """
+
+    def __init__(
+            self,
+            executor: Optional[Executor] = None,
+            max_workers: Optional[int] = None,
+            max_batch_size: int = 64,
+            max_wait_time: float = 0.005,
+            max_number_of_pending_requests: int = 1024
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter executor: The executor that runs the batches of requests. The value `None` indicates that a process
+            pool managed by the service should be utilized.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the number of processors should be utilized.
+        :parameter max_batch_size: The maximum number of requests per batch.
+        :parameter max_wait_time: The maximum time in seconds that a request waits for other requests of the same kind
+            before its batch is submitted.
+        :parameter max_number_of_pending_requests: The maximum number of pending requests per kind. The additional
+            requests are suspended until the number of pending requests decreases.
+        """
+
+        self._is_executor_managed = executor is None
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers
+        ) if executor is None else executor
+
+        self._micro_batchers = {
+            method_name: AsyncMicroBatcher(
+                batch_function=batch_function,
+                executor=self.executor,
+                max_batch_size=max_batch_size,
+                max_wait_time=max_wait_time,
+                max_number_of_pending_items=max_number_of_pending_requests,
+                max_number_of_concurrent_batches=max_workers or cpu_count() or 1
+            ) for method_name, batch_function in (
+                ("canonicalize_compound_smiles", _canonicalize_compound_smiles_strings, ),
+                ("standardize_reaction_smiles", _standardize_reaction_smiles_strings, ),
+                ("apply_retro_template", _apply_retro_templates, ),
+            )
+        }
+
+    async def __aenter__(
+            self
+    ) -> "AsyncChemistryService":
+        """
+        Enter the asynchronous runtime context of the service.
+
+        :returns: The asynchronous chemistry service.
+        """
+
+        return self
+
+    async def __aexit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the asynchronous runtime context of the service and shut down the managed process pool. """
+
+        await self.close()
+
+    async def close(
+            self
+    ) -> None:
+        """ Wait for the pending requests and shut down the managed process pool of the service. """
+
+        for micro_batcher in self._micro_batchers.values():
+            await micro_batcher.drain()
+
+        # The worker processes are joined in a separate thread, as the shutdown would otherwise block the event loop.
+        if self._is_executor_managed:
+            await get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    def get_statistics(
+            self
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Get the batching statistics of the service.
+
+        :returns: The number of requests, number of batches and average batch size per kind of request.
+        """
+
+        return {
+            method_name: {
+                "number_of_requests": micro_batcher.number_of_items,
+                "number_of_batches": micro_batcher.number_of_batches,
+                "average_batch_size": micro_batcher.average_batch_size,
+            } for method_name, micro_batcher in self._micro_batchers.items()
+        }
+
+    async def canonicalize_compound_smiles(
+            self,
+            compound_smiles: str
+    ) -> str:
+        """
+        Canonicalize a chemical compound SMILES string without blocking the event loop.
+
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+
+        :returns: The canonical SMILES string of the chemical compound without the atom map numbers.
+        """
+
+        return await self._micro_batchers["canonicalize_compound_smiles"].submit(
+            item=compound_smiles
+        )
+
+    async def standardize_reaction_smiles(
+            self,
+            reaction_smiles: str
+    ) -> str:
+        """
+        Standardize a chemical reaction SMILES string without blocking the event loop.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The SMILES string of the sanitized chemical reaction.
+        """
+
+        return await self._micro_batchers["standardize_reaction_smiles"].submit(
+            item=reaction_smiles
+        )
+
+    async def apply_retro_template(
+            self,
+            retro_template_smarts: str,
+            compound_smiles: str
+    ) -> List[str]:
+        """
+        Apply a chemical reaction retro template on a chemical compound using the RDChiral library without blocking the
+        event loop.
+
+        :parameter retro_template_smarts: The chemical reaction retro template SMARTS string.
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+
+        :returns: The outcomes of the application of the chemical reaction retro template on the chemical compound.
+        """
+
+        return await self._micro_batchers["apply_retro_template"].submit(
+            item=(retro_template_smarts, compound_smiles, )
+        )
+
+    async def _handle_request(
+            self,
+            request_line: bytes,
+            writer: StreamWriter
+    ) -> None:
+        """
+        Handle a single request of the line-delimited JSON protocol.
+
+        :parameter request_line: The request line in the format ``{"id": ..., "method": ..., "arguments": {...}}``.
+        :parameter writer: The stream writer of the connection.
+        """
+
+        request_id = None
+
+        try:
+            request = loads(request_line)
+            request_id = request.get("id", None)
+
+            if request["method"] not in self._micro_batchers.keys():
+                raise ValueError(
+                    "The method '{method}' is not supported.".format(
+                        method=request["method"]
+                    )
+                )
+
+            response: Dict[str, Any] = {
+                "id": request_id,
+                "result": await getattr(self, request["method"])(**request.get("arguments", dict())),
+            }
+
+        except Exception as exception:
+            response = {
+                "id": request_id,
+                "error": "{exception_name}: {exception}".format(
+                    exception_name=type(exception).__name__,
+                    exception=exception
+                ),
+            }
+
+        writer.write(
+            dumps(response).encode() + b"\n"
+        )
+
+    async def _handle_connection(
+            self,
+            reader: StreamReader,
+            writer: StreamWriter
+    ) -> None:
+        """
+        Handle a connection of the line-delimited JSON protocol. The requests of a connection are handled concurrently,
+        which is why the responses should be matched to the requests using the request IDs.
+
+        :parameter reader: The stream reader of the connection.
+        :parameter writer: The stream writer of the connection.
+        """
+
+        request_tasks = set()
+
+        try:
+            while True:
+                request_line = await reader.readline()
+
+                if len(request_line) == 0:
+                    break
+
+                if len(request_line.strip()) == 0:
+                    continue
+
+                request_task = ensure_future(
+                    self._handle_request(
+                        request_line=request_line,
+                        writer=writer
+                    )
+                )
+
+                request_tasks.add(
+                    request_task
+                )
+
+                request_task.add_done_callback(
+                    request_tasks.discard
+                )
+
+                await writer.drain()
+
+            for request_task in list(request_tasks):
+                await request_task
+
+            await writer.drain()
+
+        finally:
+            writer.close()
+
+    async def start_server(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0
+    ) -> AbstractServer:
+        """
+        Start a local server of the line-delimited JSON protocol, for example, to test the service in process.
+
+        :parameter host: The host of the server.
+        :parameter port: The port of the server. The value `0` indicates that a free port should be selected.
+
+        :returns: The started server.
+        """
+
+        return await start_server(
+            self._handle_connection,
+            host=host,
+            port=port
+        )
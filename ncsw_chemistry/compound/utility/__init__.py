@@ -2,16 +2,26 @@
 
 from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
 
+from ncsw_chemistry.compound.utility.batch import CompoundBatchUtility
+
 from ncsw_chemistry.compound.utility.bond import CompoundBondUtility
 
-from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.compound.utility.caching import CompoundStandardizationCache
+
+from ncsw_chemistry.compound.utility.formatting import (
+    CompoundFormattingHandle,
+    CompoundFormattingUtility,
+)
 
 from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
 
+from ncsw_chemistry.compound.utility.stock import CompoundStockLookup
+
 from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
 
 from ncsw_chemistry.compound.utility.typing_ import (
     CompoundAtomPropertyIDTuple,
     CompoundBondPropertyIDTuple,
+    CompoundPropertyKeysOrProfile,
     CompoundSubstructurePropertyIDTuple,
 )
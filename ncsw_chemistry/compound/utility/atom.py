@@ -1,19 +1,80 @@
 """ The ``ncsw_chemistry.compound.utility`` package ``atom`` module. """
 
-from typing import Container, Dict, Optional, Sequence, Union
+from typing import Any, Callable, Collection, Dict, Optional, Tuple, Union
 
-from rdkit.Chem.rdchem import Atom, Mol
+from numpy import fromiter, int32, ndarray
 
-from ncsw_chemistry.compound.utility.typing_ import CompoundAtomPropertyIDTuple
+from rdkit.Chem.rdchem import Atom, Mol
+from rdkit.Chem.rdChemReactions import ChemicalReaction, RemoveMappingNumbersFromReactions
+
+from ncsw_chemistry.compound.utility.typing_ import CompoundAtomPropertyIDTuple, CompoundPropertyKeysOrProfile
+
+
+_integer_atom_property_getters = {
+    "atomic_number": Atom.GetAtomicNum,
+    "chiral_tag": Atom.GetChiralTag,
+    "degree": Atom.GetDegree,
+    "explicit_valence": Atom.GetExplicitValence,
+    "formal_charge": Atom.GetFormalCharge,
+    "hybridization": Atom.GetHybridization,
+    "implicit_valence": Atom.GetImplicitValence,
+    "is_aromatic": Atom.GetIsAromatic,
+    "is_in_ring": Atom.IsInRing,
+    "isotope": Atom.GetIsotope,
+    "number_of_explicit_hydrogen_atoms": Atom.GetNumExplicitHs,
+    "number_of_implicit_hydrogen_atoms": Atom.GetNumImplicitHs,
+    "number_of_radical_electrons": Atom.GetNumRadicalElectrons,
+    "total_degree": Atom.GetTotalDegree,
+    "total_number_of_hydrogen_atoms": Atom.GetTotalNumHs,
+    "total_valence": Atom.GetTotalValence,
+}
 
 
 class CompoundAtomUtility:
     """ The chemical compound atom utility class. """
 
+    # The property profiles consist only of the integer properties, which are retrieved without the string conversions
+    # of the enumerations and are safe to hash.
+    atom_property_profiles = {
+        "topology": ("atomic_number", "degree", "is_aromatic", "is_in_ring", ),
+        "reaction_center": (
+            "atomic_number", "chiral_tag", "degree", "formal_charge", "is_aromatic", "total_number_of_hydrogen_atoms",
+        ),
+        "full": tuple(_integer_atom_property_getters.keys()),
+    }
+
+    _atom_property_profile_getters = {
+        atom_property_profile: tuple(
+            _integer_atom_property_getters[atom_property_key]
+            for atom_property_key in atom_property_keys
+        ) for atom_property_profile, atom_property_keys in atom_property_profiles.items()
+    }
+
+    @staticmethod
+    def _get_atom_property_profile_getters(
+            atom_property_profile: str
+    ) -> Tuple[Callable[[Atom], Any], ...]:
+        """
+        Get the getters of the integer chemical compound atom properties of a property profile.
+
+        :parameter atom_property_profile: The name of the chemical compound atom property profile.
+
+        :returns: The getters of the integer chemical compound atom properties.
+        """
+
+        if atom_property_profile not in CompoundAtomUtility._atom_property_profile_getters.keys():
+            raise ValueError(
+                "The chemical compound atom property profile should be one of {atom_property_profiles}.".format(
+                    atom_property_profiles=tuple(CompoundAtomUtility.atom_property_profiles.keys())
+                )
+            )
+
+        return CompoundAtomUtility._atom_property_profile_getters[atom_property_profile]
+
     @staticmethod
     def remove_atom_map_numbers(
             compound_mol: Mol,
-            atom_indices: Optional[Container[int]] = None,
+            atom_indices: Optional[Collection[int]] = None,
             deep_copy: bool = True
     ) -> Mol:
         """
@@ -31,29 +92,77 @@ class CompoundAtomUtility:
         if deep_copy:
             compound_mol = Mol(compound_mol)
 
-        for atom in compound_mol.GetAtoms():
-            if atom_indices is None or atom.GetIdx() in atom_indices:
-                atom.ClearProp(
-                    key="molAtomMapNumber"
-                )
+        if atom_indices is None:
+            # The chemical reaction container shares the RDKit Mol object, which allows the atom map numbers to be
+            # removed in a single native call instead of a per-atom loop.
+            compound_mol_container = ChemicalReaction()
+
+            compound_mol_container.AddReactantTemplate(
+                compound_mol
+            )
+
+            RemoveMappingNumbersFromReactions(
+                compound_mol_container
+            )
+
+        else:
+            number_of_atoms = compound_mol.GetNumAtoms()
+
+            for atom_index in atom_indices:
+                if 0 <= atom_index < number_of_atoms:
+                    compound_mol.GetAtomWithIdx(atom_index).ClearProp(
+                        key="molAtomMapNumber"
+                    )
 
         return compound_mol
 
+    @staticmethod
+    def get_atom_map_numbers(
+            compound_mol: Mol
+    ) -> ndarray:
+        """
+        Get the atom map numbers of a chemical compound in a single pass.
+
+        :parameter compound_mol: The RDKit Mol object of the chemical compound.
+
+        :returns: The atom map numbers of the chemical compound indexed by the atom indices, where the value `0`
+            indicates an unmapped atom.
+        """
+
+        return fromiter(
+            (atom.GetAtomMapNum() for atom in compound_mol.GetAtoms()),
+            dtype=int32,
+            count=compound_mol.GetNumAtoms()
+        )
+
     @staticmethod
     def get_atom_properties(
             atom: Atom,
-            atom_property_keys: Optional[Sequence[str]] = None
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
     ) -> Dict[str, Union[bool, int, float, str]]:
         """
         Get the properties of a chemical compound atom.
 
         :parameter atom: The RDKit Atom object of the chemical compound atom.
-        :parameter atom_property_keys: The keys of the chemical compound atom properties that should be retrieved. The
-            value `None` indicates that all chemical compound atom properties should be retrieved.
+        :parameter atom_property_keys: The keys of the chemical compound atom properties that should be retrieved, or
+            the name of a chemical compound atom property profile, which is one of `topology`, `reaction_center` or
+            `full`. The properties of a profile are retrieved as integers. The value `None` indicates that all chemical
+            compound atom properties should be retrieved.
 
         :returns: The properties of the chemical compound atom.
         """
 
+        if isinstance(atom_property_keys, str):
+            atom_property_id = CompoundAtomUtility.get_atom_property_id(
+                atom=atom,
+                atom_property_keys=atom_property_keys
+            )
+
+            return dict(zip(
+                CompoundAtomUtility.atom_property_profiles[atom_property_keys],
+                atom_property_id
+            ))
+
         atom_property_getters = {
             "atomic_number": atom.GetAtomicNum,
             "chiral_tag": lambda: str(atom.GetChiralTag()),
@@ -85,19 +194,28 @@ class CompoundAtomUtility:
     @staticmethod
     def get_atom_property_id(
             atom: Atom,
-            atom_property_keys: Optional[Sequence[str]] = None
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
     ) -> CompoundAtomPropertyIDTuple:
         """
         Get the property ID of a chemical compound atom.
 
         :parameter atom: The RDKit Atom object of the chemical compound atom.
         :parameter atom_property_keys: The keys of the chemical compound atom properties that should be utilized in the
-            property ID. The value `None` indicates that all chemical compound atom properties should be utilized in the
-            property ID.
+            property ID, or the name of a chemical compound atom property profile, which is one of `topology`,
+            `reaction_center` or `full`. The value `None` indicates that all chemical compound atom properties should be
+            utilized in the property ID.
 
         :returns: The property ID of the chemical compound atom.
         """
 
+        if isinstance(atom_property_keys, str):
+            return tuple([
+                int(atom_property_getter(atom))
+                for atom_property_getter in CompoundAtomUtility._get_atom_property_profile_getters(
+                    atom_property_profile=atom_property_keys
+                )
+            ])
+
         return tuple(
             CompoundAtomUtility.get_atom_properties(
                 atom=atom,
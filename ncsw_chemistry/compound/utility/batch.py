@@ -0,0 +1,421 @@
+""" The ``ncsw_chemistry.compound.utility`` package ``batch`` module. """
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Collection, Iterable, List, Optional, Tuple
+
+from numpy import bool_, empty, fromiter, ndarray
+
+from rdkit.Chem.rdchem import Mol
+
+from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
+from ncsw_chemistry.execution.parallel import map_in_chunks
+from ncsw_chemistry.execution.transport import map_in_chunks_using_shared_memory
+
+
+def _process_compound(
+        compound: Any,
+        input_format: str,
+        output_format: str,
+        sanitize_compounds: bool,
+        compound_sanitization_operation_keys: Optional[Collection[str]],
+        remove_compound_atom_map_numbers: bool
+) -> Optional[Any]:
+    """
+    Process a single chemical compound by parsing, sanitizing and formatting it.
+
+    :parameter compound: The SMILES string, SMARTS string or RDKit Mol object of the chemical compound.
+    :parameter input_format: The format of the chemical compound, which is one of `mol`, `smarts` or `smiles`.
+    :parameter output_format: The format of the processed chemical compound, which is one of `mol`, `smarts` or
+        `smiles`.
+    :parameter sanitize_compounds: The indicator of whether the chemical compound should be sanitized.
+    :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations.
+    :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed.
+
+    :returns: The processed chemical compound, or the value `None` if the chemical compound could not be processed.
+    """
+
+    if input_format == "mol":
+        if not isinstance(compound, Mol):
+            return None
+
+        # The input RDKit Mol objects are never modified, which is why the processing starts from a copy.
+        compound_mol = Mol(compound)
+
+        if remove_compound_atom_map_numbers:
+            CompoundAtomUtility.remove_atom_map_numbers(
+                compound_mol=compound_mol,
+                deep_copy=False
+            )
+
+    else:
+        if not isinstance(compound, str):
+            return None
+
+        if input_format == "smiles":
+            compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                compound_smiles=compound,
+                remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+                sanitize=False
+            )
+
+        else:
+            compound_mol = CompoundFormattingUtility.convert_compound_smarts_to_mol(
+                compound_smarts=compound,
+                remove_compound_atom_map_numbers=remove_compound_atom_map_numbers
+            )
+
+        if compound_mol is None:
+            return None
+
+    if sanitize_compounds:
+        CompoundStandardizationUtility.sanitize_compound(
+            compound_mol=compound_mol,
+            compound_sanitization_operation_keys=compound_sanitization_operation_keys,
+            deep_copy=False
+        )
+
+    if output_format == "smiles":
+        return CompoundFormattingUtility.convert_compound_mol_to_smiles(
+            compound_mol=compound_mol
+        )
+
+    if output_format == "smarts":
+        return CompoundFormattingUtility.convert_compound_mol_to_smarts(
+            compound_mol=compound_mol
+        )
+
+    return compound_mol
+
+
+def _try_to_process_compound(
+        compound: Any,
+        **kwargs
+) -> Optional[Any]:
+    """
+    Try to process a single chemical compound in the current or a worker process.
+
+    :parameter compound: The SMILES string, SMARTS string or RDKit Mol object of the chemical compound.
+    :parameter kwargs: The keyword arguments of the processing of the chemical compound.
+
+    :returns: The processed chemical compound, or the value `None` if the chemical compound could not be processed.
+    """
+
+    try:
+        return _process_compound(
+            compound=compound,
+            **kwargs
+        )
+
+    except Exception:
+        return None
+
+
+def _process_compound_chunk(
+        compounds: List[Any],
+        **kwargs
+) -> List[Optional[Any]]:
+    """
+    Process a chunk of chemical compounds in the current or a worker process.
+
+    :parameter compounds: The SMILES strings, SMARTS strings or RDKit Mol objects of the chemical compounds.
+    :parameter kwargs: The keyword arguments of the processing of each chemical compound.
+
+    :returns: The processed chemical compounds, or the values `None` for the chemical compounds that could not be
+        processed.
+    """
+
+    return [
+        _try_to_process_compound(
+            compound=compound,
+            **kwargs
+        ) for compound in compounds
+    ]
+
+
+class CompoundBatchUtility:
+    """ The chemical compound batch utility class. """
+
+    compound_formats = ("mol", "smarts", "smiles", )
+
+    @staticmethod
+    def process_compounds(
+            compounds: Iterable[Any],
+            input_format: str = "smiles",
+            output_format: str = "smiles",
+            sanitize_compounds: bool = True,
+            compound_sanitization_operation_keys: Collection[str] = None,
+            remove_compound_atom_map_numbers: bool = False,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            use_shared_memory: bool = False
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Process a batch of chemical compounds by parsing, sanitizing and formatting them in chunks.
+
+        :parameter compounds: The SMILES strings, SMARTS strings or RDKit Mol objects of the chemical compounds as a
+            sequence, NumPy object array or pandas Series. The entries of other types, such as the missing values,
+            are marked as errors.
+        :parameter input_format: The format of the chemical compounds, which is one of `mol`, `smarts` or `smiles`.
+        :parameter output_format: The format of the processed chemical compounds, which is one of `mol`, `smarts` or
+            `smiles`.
+        :parameter sanitize_compounds: The indicator of whether the chemical compounds should be sanitized.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter chunk_size: The number of chemical compounds per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical compounds should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks. The value `None` indicates that a process pool
+            managed by the method should be utilized if the number of worker processes is specified.
+        :parameter use_shared_memory: The indicator of whether the RDKit Mol objects should be transferred to and from
+            the worker processes in shared memory arenas instead of being pickled.
+
+        :returns: The NumPy object array of the processed chemical compounds in the order of the input, where the
+            chemical compounds that could not be processed are set to the value `None`, and the boolean error mask.
+        """
+
+        if input_format not in CompoundBatchUtility.compound_formats or \
+                output_format not in CompoundBatchUtility.compound_formats:
+            raise ValueError(
+                "The chemical compound formats should be one of {compound_formats}.".format(
+                    compound_formats=CompoundBatchUtility.compound_formats
+                )
+            )
+
+        processing_arguments = {
+            "input_format": input_format,
+            "output_format": output_format,
+            "sanitize_compounds": sanitize_compounds,
+            "compound_sanitization_operation_keys": compound_sanitization_operation_keys,
+            "remove_compound_atom_map_numbers": remove_compound_atom_map_numbers,
+        }
+
+        if use_shared_memory and (max_workers is not None or executor is not None) and "mol" in (
+            input_format, output_format,
+        ):
+            processed_compound_chunks = map_in_chunks_using_shared_memory(
+                item_function=partial(
+                    _try_to_process_compound,
+                    **processing_arguments
+                ),
+                items=compounds,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                executor=executor,
+                pack_items=input_format == "mol",
+                pack_results=output_format == "mol"
+            )
+
+        else:
+            processed_compound_chunks = map_in_chunks(
+                chunk_function=partial(
+                    _process_compound_chunk,
+                    **processing_arguments
+                ),
+                items=compounds,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                executor=executor
+            )
+
+        processed_compounds = list()
+
+        for processed_compound_chunk in processed_compound_chunks:
+            processed_compounds.extend(
+                processed_compound_chunk
+            )
+
+        processed_compound_array = empty(
+            shape=len(processed_compounds),
+            dtype=object
+        )
+
+        processed_compound_array[:] = processed_compounds
+
+        return processed_compound_array, fromiter(
+            (processed_compound is None for processed_compound in processed_compounds),
+            dtype=bool_,
+            count=len(processed_compounds)
+        )
+
+    @staticmethod
+    def canonicalize_compound_strings(
+            compound_strings: Iterable[Any],
+            compound_string_format: str = "smiles",
+            output_compound_string_format: str = "smiles",
+            sanitize_compounds: bool = True,
+            compound_sanitization_operation_keys: Collection[str] = None,
+            remove_compound_atom_map_numbers: bool = False,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Canonicalize a batch of chemical compound SMILES or SMARTS strings in chunks.
+
+        :parameter compound_strings: The SMILES or SMARTS strings of the chemical compounds as a sequence, NumPy object
+            array or pandas Series.
+        :parameter compound_string_format: The format of the chemical compound strings, which is `smarts` or `smiles`.
+        :parameter output_compound_string_format: The format of the canonical chemical compound strings, which is
+            `smarts` or `smiles`.
+        :parameter sanitize_compounds: The indicator of whether the chemical compounds should be sanitized.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter chunk_size: The number of chemical compounds per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical compounds should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+
+        :returns: The NumPy object array of the canonical chemical compound strings in the order of the input and the
+            boolean error mask.
+        """
+
+        return CompoundBatchUtility.process_compounds(
+            compounds=compound_strings,
+            input_format=compound_string_format,
+            output_format=output_compound_string_format,
+            sanitize_compounds=sanitize_compounds,
+            compound_sanitization_operation_keys=compound_sanitization_operation_keys,
+            remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor
+        )
+
+    @staticmethod
+    def convert_compound_strings_to_mols(
+            compound_strings: Iterable[Any],
+            compound_string_format: str = "smiles",
+            sanitize_compounds: bool = True,
+            compound_sanitization_operation_keys: Collection[str] = None,
+            remove_compound_atom_map_numbers: bool = False,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            use_shared_memory: bool = False
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Convert a batch of chemical compound SMILES or SMARTS strings to RDKit Mol objects in chunks.
+
+        :parameter compound_strings: The SMILES or SMARTS strings of the chemical compounds as a sequence, NumPy object
+            array or pandas Series.
+        :parameter compound_string_format: The format of the chemical compound strings, which is `smarts` or `smiles`.
+        :parameter sanitize_compounds: The indicator of whether the chemical compounds should be sanitized.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter chunk_size: The number of chemical compounds per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical compounds should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+        :parameter use_shared_memory: The indicator of whether the RDKit Mol objects should be transferred to and from
+            the worker processes in shared memory arenas instead of being pickled.
+
+        :returns: The NumPy object array of the RDKit Mol objects of the chemical compounds in the order of the input
+            and the boolean error mask.
+        """
+
+        return CompoundBatchUtility.process_compounds(
+            compounds=compound_strings,
+            input_format=compound_string_format,
+            output_format="mol",
+            sanitize_compounds=sanitize_compounds,
+            compound_sanitization_operation_keys=compound_sanitization_operation_keys,
+            remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+            use_shared_memory=use_shared_memory
+        )
+
+    @staticmethod
+    def convert_compound_mols_to_strings(
+            compound_mols: Iterable[Any],
+            compound_string_format: str = "smiles",
+            remove_compound_atom_map_numbers: bool = False,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            use_shared_memory: bool = False
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Convert a batch of chemical compound RDKit Mol objects to SMILES or SMARTS strings in chunks.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compounds as a sequence, NumPy object array or
+            pandas Series.
+        :parameter compound_string_format: The format of the chemical compound strings, which is `smarts` or `smiles`.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter chunk_size: The number of chemical compounds per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical compounds should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+        :parameter use_shared_memory: The indicator of whether the RDKit Mol objects should be transferred to and from
+            the worker processes in shared memory arenas instead of being pickled.
+
+        :returns: The NumPy object array of the chemical compound strings in the order of the input and the boolean
+            error mask.
+        """
+
+        return CompoundBatchUtility.process_compounds(
+            compounds=compound_mols,
+            input_format="mol",
+            output_format=compound_string_format,
+            sanitize_compounds=False,
+            remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+            use_shared_memory=use_shared_memory
+        )
+
+    @staticmethod
+    def sanitize_compounds(
+            compound_mols: Iterable[Any],
+            compound_sanitization_operation_keys: Collection[str] = None,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            use_shared_memory: bool = False
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Sanitize a batch of chemical compounds in chunks without modifying the input RDKit Mol objects.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compounds as a sequence, NumPy object array or
+            pandas Series.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter chunk_size: The number of chemical compounds per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical compounds should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+        :parameter use_shared_memory: The indicator of whether the RDKit Mol objects should be transferred to and from
+            the worker processes in shared memory arenas instead of being pickled.
+
+        :returns: The NumPy object array of the sanitized RDKit Mol objects of the chemical compounds in the order of
+            the input and the boolean error mask.
+        """
+
+        return CompoundBatchUtility.process_compounds(
+            compounds=compound_mols,
+            input_format="mol",
+            output_format="mol",
+            sanitize_compounds=True,
+            compound_sanitization_operation_keys=compound_sanitization_operation_keys,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor,
+            use_shared_memory=use_shared_memory
+        )
@@ -1,31 +1,120 @@
 """ The ``ncsw_chemistry.compound.utility`` package ``bond`` module. """
 
-from typing import Dict, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from rdkit.Chem.rdchem import Bond
 
 from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
-from ncsw_chemistry.compound.utility.typing_ import CompoundBondPropertyIDTuple
+from ncsw_chemistry.compound.utility.typing_ import CompoundBondPropertyIDTuple, CompoundPropertyKeysOrProfile
+
+
+_integer_bond_property_getters = {
+    "direction": Bond.GetBondDir,
+    "is_aromatic": Bond.GetIsAromatic,
+    "is_conjugated": Bond.GetIsConjugated,
+    "is_in_ring": Bond.IsInRing,
+    "stereo_configuration": Bond.GetStereo,
+    "type": Bond.GetBondType,
+}
 
 
 class CompoundBondUtility:
     """ The chemical compound bond utility class. """
 
+    # The property profiles consist only of the integer properties, which are retrieved without the string conversions
+    # of the enumerations and are safe to hash.
+    bond_property_profiles = {
+        "topology": ("is_in_ring", "type", ),
+        "reaction_center": ("is_in_ring", "stereo_configuration", "type", ),
+        "full": tuple(_integer_bond_property_getters.keys()),
+    }
+
+    _bond_property_profile_getters = {
+        bond_property_profile: tuple(
+            _integer_bond_property_getters[bond_property_key]
+            for bond_property_key in bond_property_keys
+        ) for bond_property_profile, bond_property_keys in bond_property_profiles.items()
+    }
+
+    @staticmethod
+    def _get_bond_property_profile_getters(
+            bond_property_profile: str
+    ) -> Tuple[Callable[[Bond], Any], ...]:
+        """
+        Get the getters of the integer chemical compound bond properties of a property profile.
+
+        :parameter bond_property_profile: The name of the chemical compound bond property profile.
+
+        :returns: The getters of the integer chemical compound bond properties.
+        """
+
+        if bond_property_profile not in CompoundBondUtility._bond_property_profile_getters.keys():
+            raise ValueError(
+                "The chemical compound bond property profile should be one of {bond_property_profiles}.".format(
+                    bond_property_profiles=tuple(CompoundBondUtility.bond_property_profiles.keys())
+                )
+            )
+
+        return CompoundBondUtility._bond_property_profile_getters[bond_property_profile]
+
+    @staticmethod
+    def _get_bond_property_values(
+            bond: Bond,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile]
+    ) -> Tuple[Union[bool, int, str], ...]:
+        """
+        Get the property values of a chemical compound bond.
+
+        :parameter bond: The RDKit Bond object of the chemical compound bond.
+        :parameter bond_property_keys: The keys of the chemical compound bond properties or the name of a chemical
+            compound bond property profile.
+
+        :returns: The property values of the chemical compound bond.
+        """
+
+        if isinstance(bond_property_keys, str):
+            return tuple([
+                int(bond_property_getter(bond))
+                for bond_property_getter in CompoundBondUtility._get_bond_property_profile_getters(
+                    bond_property_profile=bond_property_keys
+                )
+            ])
+
+        return tuple(
+            CompoundBondUtility.get_bond_properties(
+                bond=bond,
+                bond_property_keys=bond_property_keys
+            ).values()
+        )
+
     @staticmethod
     def get_bond_properties(
             bond: Bond,
-            bond_property_keys: Optional[Sequence[str]] = None
-    ) -> Dict[str, Union[bool, str]]:
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
+    ) -> Dict[str, Union[bool, int, str]]:
         """
         Get the properties of a chemical compound bond.
 
         :parameter bond: The RDKit Bond object of the chemical compound bond.
-        :parameter bond_property_keys: The keys of the chemical compound bond properties that should be retrieved. The
-            value `None` indicates that all chemical compound bond properties should be retrieved.
+        :parameter bond_property_keys: The keys of the chemical compound bond properties that should be retrieved, or
+            the name of a chemical compound bond property profile, which is one of `topology`, `reaction_center` or
+            `full`. The properties of a profile are retrieved as integers. The value `None` indicates that all chemical
+            compound bond properties should be retrieved.
 
         :returns: The properties of the chemical compound bond.
         """
 
+        if isinstance(bond_property_keys, str):
+            bond_property_values = CompoundBondUtility._get_bond_property_values(
+                bond=bond,
+                bond_property_keys=bond_property_keys
+            )
+
+            return dict(zip(
+                CompoundBondUtility.bond_property_profiles[bond_property_keys],
+                bond_property_values
+            ))
+
         bond_property_getters = {
             "direction": lambda: str(bond.GetBondDir()),
             "is_aromatic": bond.GetIsAromatic,
@@ -45,19 +134,20 @@ class CompoundBondUtility:
     @staticmethod
     def get_bond_property_id(
             bond: Bond,
-            bond_atom_property_keys: Optional[Sequence[str]] = None,
-            bond_property_keys: Optional[Sequence[str]] = None
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
     ) -> CompoundBondPropertyIDTuple:
         """
         Get the property ID of a chemical compound bond.
 
         :parameter bond: The RDKit Bond object of the chemical compound bond.
         :parameter bond_atom_property_keys: The keys of the chemical compound bond atom properties that should be
-            utilized in the property ID. The value `None` indicates that all chemical compound bond atom properties
-            should be utilized in the property ID.
+            utilized in the property ID, or the name of a chemical compound atom property profile. The value `None`
+            indicates that all chemical compound bond atom properties should be utilized in the property ID.
         :parameter bond_property_keys: The keys of the chemical compound bond properties that should be utilized in the
-            property ID. The value `None` indicates that all chemical compound bond properties should be utilized in the
-            property ID.
+            property ID, or the name of a chemical compound bond property profile, which is one of `topology`,
+            `reaction_center` or `full`. The value `None` indicates that all chemical compound bond properties should be
+            utilized in the property ID.
 
         :returns: The property ID of the chemical compound bond.
         """
@@ -73,10 +163,8 @@ class CompoundBondUtility:
                     atom_property_keys=bond_atom_property_keys
                 ),
             }),
-            tuple(
-                CompoundBondUtility.get_bond_properties(
-                    bond=bond,
-                    bond_property_keys=bond_property_keys
-                ).values()
+            CompoundBondUtility._get_bond_property_values(
+                bond=bond,
+                bond_property_keys=bond_property_keys
             ),
         )
@@ -0,0 +1,117 @@
+""" The ``ncsw_chemistry.compound.utility`` package ``caching`` module. """
+
+from typing import Collection, Iterable, List, Optional
+
+from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
+from ncsw_chemistry.execution.caching import PersistentResultCache
+
+
+class CompoundStandardizationCache:
+    """ The persistent chemical compound standardization cache class. """
+
+    def __init__(
+            self,
+            database_file_path: str,
+            compound_sanitization_operation_keys: Collection[str] = None,
+            remove_compound_atom_map_numbers: bool = False,
+            max_number_of_entries: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter database_file_path: The path to the SQLite database file of the cache.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter max_number_of_entries: The maximum number of entries of the cache. The value `None` indicates that
+            the number of entries should not be limited.
+        """
+
+        self.compound_sanitization_operation_keys = None if compound_sanitization_operation_keys is None else sorted(
+            compound_sanitization_operation_keys
+        )
+
+        self.remove_compound_atom_map_numbers = remove_compound_atom_map_numbers
+
+        self.result_cache = PersistentResultCache(
+            database_file_path=database_file_path,
+            configuration={
+                "pipeline": "standardize_compound_smiles",
+                "compound_sanitization_operation_keys": self.compound_sanitization_operation_keys,
+                "remove_compound_atom_map_numbers": self.remove_compound_atom_map_numbers,
+            },
+            max_number_of_entries=max_number_of_entries
+        )
+
+    def __enter__(
+            self
+    ) -> "CompoundStandardizationCache":
+        """
+        Enter the runtime context of the cache.
+
+        :returns: The persistent chemical compound standardization cache.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the cache and close the database connection. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Close the database connection of the cache. """
+
+        self.result_cache.close()
+
+    def standardize_compound_smiles_strings(
+            self,
+            compound_smiles_strings: Iterable[str]
+    ) -> List[Optional[str]]:
+        """
+        Standardize chemical compound SMILES strings, of which only the ones that are not cached are recomputed.
+
+        :parameter compound_smiles_strings: The SMILES strings of the chemical compounds.
+
+        :returns: The canonical SMILES strings of the standardized chemical compounds, or the values `None` for the
+            chemical compounds that could not be standardized.
+        """
+
+        compound_smiles_strings = list(compound_smiles_strings)
+
+        cached_results = self.result_cache.get_many(
+            input_strings=compound_smiles_strings
+        )
+
+        computed_results = dict()
+
+        for compound_smiles in compound_smiles_strings:
+            if compound_smiles not in cached_results.keys() and compound_smiles not in computed_results.keys():
+                standardized_compound_smiles = CompoundStandardizationUtility.standardize_compound_smiles(
+                    compound_smiles=compound_smiles,
+                    compound_sanitization_operation_keys=self.compound_sanitization_operation_keys,
+                    remove_compound_atom_map_numbers=self.remove_compound_atom_map_numbers
+                )
+
+                computed_results[compound_smiles] = None if standardized_compound_smiles is None else (
+                    standardized_compound_smiles.encode()
+                )
+
+        if len(computed_results) > 0:
+            self.result_cache.set_many(
+                results=computed_results.items()
+            )
+
+        cached_results.update(computed_results)
+
+        return [
+            None if cached_results[compound_smiles] is None else cached_results[compound_smiles].decode()
+            for compound_smiles in compound_smiles_strings
+        ]
@@ -1,9 +1,20 @@
 """ The ``ncsw_chemistry.compound.utility`` package ``formatting`` module. """
 
-from typing import Optional
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from numpy import argsort, fromiter, int32
 
 from rdkit.Chem.rdchem import Mol
-from rdkit.Chem.rdmolfiles import MolFromSmarts, MolFromSmiles, MolToSmarts, MolToSmiles
+from rdkit.Chem.rdmolfiles import (
+    CanonicalRankAtoms,
+    MolFragmentToSmarts,
+    MolFragmentToSmiles,
+    MolFromSmarts,
+    MolFromSmiles,
+    MolToSmarts,
+    MolToSmiles,
+)
+from rdkit.Chem.rdmolops import FastFindRings, RenumberAtoms
 
 from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
 
@@ -67,6 +78,60 @@ class CompoundFormattingUtility:
             **kwargs
         )
 
+    @staticmethod
+    def convert_compound_mols_to_smarts(
+            compound_mols: Iterable[Optional[Mol]],
+            remove_compound_atom_map_numbers: bool = False,
+            **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Convert multiple chemical compound RDKit Mol objects to SMARTS strings.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compounds. The value `None` entries are
+            converted to the value `None`.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolToSmarts` }.
+
+        :returns: The SMARTS strings of the chemical compounds.
+        """
+
+        return [
+            None if compound_mol is None else CompoundFormattingUtility.convert_compound_mol_to_smarts(
+                compound_mol=compound_mol,
+                remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+                **kwargs
+            ) for compound_mol in compound_mols
+        ]
+
+    @staticmethod
+    def convert_compound_mols_to_smiles(
+            compound_mols: Iterable[Optional[Mol]],
+            remove_compound_atom_map_numbers: bool = False,
+            **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Convert multiple chemical compound RDKit Mol objects to SMILES strings.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compounds. The value `None` entries are
+            converted to the value `None`.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compounds.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolToSmiles` }.
+
+        :returns: The SMILES strings of the chemical compounds.
+        """
+
+        return [
+            None if compound_mol is None else CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                compound_mol=compound_mol,
+                remove_compound_atom_map_numbers=remove_compound_atom_map_numbers,
+                **kwargs
+            ) for compound_mol in compound_mols
+        ]
+
     @staticmethod
     def convert_compound_smarts_to_mol(
             compound_smarts: str,
@@ -128,3 +193,223 @@ class CompoundFormattingUtility:
             )
 
         return compound_mol
+
+
+class CompoundFormattingHandle:
+    """ The prepared chemical compound formatting handle class. """
+
+    def __init__(
+            self,
+            compound_mol: Mol,
+            remove_compound_atom_map_numbers: bool = False
+    ) -> None:
+        """
+        The constructor method of the class, which prepares a copy of the chemical compound and computes its canonical
+        atom ranks once. The SMILES and SMARTS strings of the chemical compound and its substructures are then written
+        from the prepared copy and memoized, which pays off when many strings are written for the same chemical
+        compound.
+
+        :parameter compound_mol: The RDKit Mol object of the chemical compound, which is never modified.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the prepared chemical compound.
+        """
+
+        self.compound_mol = Mol(compound_mol)
+
+        if remove_compound_atom_map_numbers:
+            CompoundAtomUtility.remove_atom_map_numbers(
+                compound_mol=self.compound_mol,
+                deep_copy=False
+            )
+
+        # The writers compute the valences and rings of their own copies of the unprepared chemical compounds on each
+        # call, which is why they are computed once here.
+        self.compound_mol.UpdatePropertyCache(
+            strict=False
+        )
+
+        try:
+            self.compound_mol.GetRingInfo().NumRings()
+
+        except RuntimeError:
+            FastFindRings(
+                self.compound_mol
+            )
+
+        self.canonical_atom_ranks = fromiter(
+            CanonicalRankAtoms(
+                self.compound_mol
+            ),
+            dtype=int32,
+            count=self.compound_mol.GetNumAtoms()
+        )
+
+        # The canonically renumbered copy is written in the atom order, which reproduces the canonical SMILES string
+        # without ranking the atoms again.
+        self.canonical_atom_order = argsort(self.canonical_atom_ranks)
+
+        # The chemical compounds without atoms, such as the parsed empty SMILES strings, cannot be renumbered.
+        self.canonical_compound_mol = RenumberAtoms(
+            self.compound_mol,
+            self.canonical_atom_order.tolist()
+        ) if self.compound_mol.GetNumAtoms() > 0 else self.compound_mol
+
+        self._strings = dict()
+
+    def _get_string(
+            self,
+            string_key: Tuple,
+            string_function: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """
+        Get a memoized string of the chemical compound or write it.
+
+        :parameter string_key: The key of the string.
+        :parameter string_function: The function that writes the string.
+
+        :returns: The string.
+        """
+
+        if string_key not in self._strings.keys():
+            self._strings[string_key] = string_function()
+
+        return self._strings[string_key]
+
+    def get_smiles(
+            self,
+            **kwargs
+    ) -> Optional[str]:
+        """
+        Get the SMILES string of the chemical compound.
+
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolToSmiles` }. The precomputed canonical atom ranks are reused only if no
+            keyword arguments are specified.
+
+        :returns: The SMILES string of the chemical compound.
+        """
+
+        if len(kwargs) == 0:
+            # The canonical SMILES strings of the disconnected chemical compound fragments are sorted by the writer.
+            return self._get_string(
+                string_key=("smiles", ),
+                string_function=lambda: ".".join(sorted(MolToSmiles(
+                    mol=self.canonical_compound_mol,
+                    canonical=False
+                ).split(".")))
+            )
+
+        return self._get_string(
+            string_key=("smiles", tuple(sorted(kwargs.items())), ),
+            string_function=lambda: MolToSmiles(
+                mol=self.compound_mol,
+                **kwargs
+            )
+        )
+
+    def get_smarts(
+            self,
+            **kwargs
+    ) -> Optional[str]:
+        """
+        Get the SMARTS string of the chemical compound in the canonical atom order.
+
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolToSmarts` }.
+
+        :returns: The SMARTS string of the chemical compound.
+        """
+
+        return self._get_string(
+            string_key=("smarts", tuple(sorted(kwargs.items())), ),
+            string_function=lambda: MolToSmarts(
+                mol=self.canonical_compound_mol,
+                **kwargs
+            )
+        )
+
+    def get_substructure_smarts(
+            self,
+            substructure_atom_indices: Iterable[int],
+            **kwargs
+    ) -> Optional[str]:
+        """
+        Get the SMARTS string of a chemical compound substructure in the canonical atom order, which is independent of
+        the order of the substructure atom indices.
+
+        :parameter substructure_atom_indices: The indices of the chemical compound substructure atoms.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolFragmentToSmarts` }.
+
+        :returns: The SMARTS string of the chemical compound substructure.
+        """
+
+        canonical_substructure_atom_indices = sorted({
+            int(self.canonical_atom_ranks[substructure_atom_index])
+            for substructure_atom_index in substructure_atom_indices
+        })
+
+        return self._get_string(
+            string_key=(
+                "substructure_smarts", tuple(canonical_substructure_atom_indices), tuple(sorted(kwargs.items())),
+            ),
+            string_function=lambda: MolFragmentToSmarts(
+                mol=self.canonical_compound_mol,
+                atomsToUse=canonical_substructure_atom_indices,
+                **kwargs
+            )
+        )
+
+    def get_substructure_smiles(
+            self,
+            substructure_atom_indices: Iterable[int],
+            use_canonical_atom_ranks: bool = False,
+            **kwargs
+    ) -> Optional[str]:
+        """
+        Get the SMILES string of a chemical compound substructure.
+
+        :parameter substructure_atom_indices: The indices of the chemical compound substructure atoms.
+        :parameter use_canonical_atom_ranks: The indicator of whether the substructure should be written in the
+            canonical atom order of the chemical compound instead of being canonicalized on its own. This is faster
+            and independent of the order of the substructure atom indices, but the same substructure of different
+            chemical compounds can be written differently.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdmolfiles.MolFragmentToSmiles` }.
+
+        :returns: The SMILES string of the chemical compound substructure.
+        """
+
+        canonical_substructure_atom_indices = sorted({
+            int(self.canonical_atom_ranks[substructure_atom_index])
+            for substructure_atom_index in substructure_atom_indices
+        })
+
+        if use_canonical_atom_ranks:
+            return self._get_string(
+                string_key=(
+                    "substructure_smiles", tuple(canonical_substructure_atom_indices), True,
+                    tuple(sorted(kwargs.items())),
+                ),
+                string_function=lambda: MolFragmentToSmiles(
+                    mol=self.canonical_compound_mol,
+                    atomsToUse=canonical_substructure_atom_indices,
+                    canonical=False,
+                    **kwargs
+                )
+            )
+
+        # The substructures are canonicalized on their own in the original atom order, since the stereochemistry of
+        # the substructure atoms whose neighbors become equivalent is written depending on the atom order.
+        return self._get_string(
+            string_key=(
+                "substructure_smiles", tuple(canonical_substructure_atom_indices), False, tuple(sorted(kwargs.items())),
+            ),
+            string_function=lambda: MolFragmentToSmiles(
+                mol=self.compound_mol,
+                atomsToUse=sorted(
+                    self.canonical_atom_order[canonical_substructure_atom_indices].tolist()
+                ),
+                **kwargs
+            )
+        )
@@ -6,6 +6,8 @@ from typing import Collection, Dict, Optional
 from rdkit.Chem.rdchem import Mol
 from rdkit.Chem.rdmolops import SanitizeFlags, SanitizeMol
 
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+
 
 class CompoundStandardizationUtility:
     """ The chemical compound standardization utility class. """
@@ -85,3 +87,43 @@ class CompoundStandardizationUtility:
             )
 
         return compound_mol
+
+    @staticmethod
+    def standardize_compound_smiles(
+            compound_smiles: str,
+            compound_sanitization_operation_keys: Collection[str] = None,
+            remove_compound_atom_map_numbers: bool = False
+    ) -> Optional[str]:
+        """
+        Standardize a chemical compound SMILES string by parsing, sanitizing and canonicalizing the chemical compound.
+
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+        :parameter compound_sanitization_operation_keys: The keys of the chemical compound sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_compound_atom_map_numbers: The indicator of whether the atom map numbers should be removed
+            from the chemical compound.
+
+        :returns: The canonical SMILES string of the standardized chemical compound, or the value `None` if the chemical
+            compound could not be standardized.
+        """
+
+        try:
+            compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                compound_smiles=compound_smiles
+            )
+
+            if compound_mol is None:
+                return None
+
+            return CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                compound_mol=CompoundStandardizationUtility.sanitize_compound(
+                    compound_mol=compound_mol,
+                    compound_sanitization_operation_keys=compound_sanitization_operation_keys,
+                    deep_copy=False
+                ),
+                remove_compound_atom_map_numbers=remove_compound_atom_map_numbers
+            )
+
+        except Exception:
+            return None
@@ -0,0 +1,479 @@
+""" The ``ncsw_chemistry.compound.utility`` package ``stock`` module. """
+
+from hashlib import blake2b
+from json import dump, load
+from math import log
+from os import makedirs
+from os.path import exists, join
+from typing import Iterable, Optional
+
+from numpy import (
+    array, bitwise_and, bitwise_or, bool_, concatenate, fromiter, left_shift, ndarray, ones, right_shift, save, uint8,
+    uint64, zeros,
+)
+from numpy import load as np_load
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+
+
+class CompoundStockLookup:
+    """ The chemical compound stock lookup class. """
+
+    # The Bloom filter bit indices are computed for chunks of the digests, which bounds the temporary memory of the
+    # large chemical compound stocks.
+    _bloom_filter_chunk_size = 2 ** 20
+
+    def __init__(
+            self,
+            compound_smiles_digests: ndarray,
+            bloom_filter: Optional[ndarray] = None,
+            number_of_bloom_filter_hash_functions: int = 0
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter compound_smiles_digests: The sorted unique 64-bit digests of the canonical chemical compound SMILES
+            strings in the stock.
+        :parameter bloom_filter: The bit array of the Bloom filter stored as unsigned 8-bit integers. The value `None`
+            indicates that the Bloom filter front-end should not be utilized.
+        :parameter number_of_bloom_filter_hash_functions: The number of hash functions of the Bloom filter.
+        """
+
+        self.compound_smiles_digests = compound_smiles_digests
+        self.bloom_filter = bloom_filter
+        self.number_of_bloom_filter_hash_functions = number_of_bloom_filter_hash_functions
+
+        self._bloom_filter_view = None if bloom_filter is None else memoryview(bloom_filter)
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of chemical compounds in the stock.
+
+        :returns: The number of chemical compounds in the stock.
+        """
+
+        return len(self.compound_smiles_digests)
+
+    def __contains__(
+            self,
+            compound_smiles: str
+    ) -> bool:
+        """
+        Check whether a canonical chemical compound SMILES string is in the stock.
+
+        :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+
+        :returns: The indicator of whether the chemical compound is in the stock.
+        """
+
+        return self.contains_compound_smiles(
+            compound_smiles=compound_smiles
+        )
+
+    @staticmethod
+    def get_compound_smiles_digest(
+            compound_smiles: str
+    ) -> int:
+        """
+        Get the 64-bit digest of a chemical compound SMILES string.
+
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+
+        :returns: The 64-bit digest of the chemical compound SMILES string.
+        """
+
+        return int.from_bytes(
+            bytes=blake2b(
+                compound_smiles.encode(),
+                digest_size=8
+            ).digest(),
+            byteorder="little"
+        )
+
+    @staticmethod
+    def get_compound_smiles_digests(
+            compound_smiles_strings: Iterable[str]
+    ) -> ndarray:
+        """
+        Get the 64-bit digests of chemical compound SMILES strings.
+
+        :parameter compound_smiles_strings: The SMILES strings of the chemical compounds.
+
+        :returns: The 64-bit digests of the chemical compound SMILES strings.
+        """
+
+        return fromiter(
+            map(CompoundStockLookup.get_compound_smiles_digest, compound_smiles_strings),
+            dtype=uint64
+        )
+
+    @staticmethod
+    def canonicalize_compound_smiles(
+            compound_smiles: str
+    ) -> Optional[str]:
+        """
+        Canonicalize a chemical compound SMILES string in the same way as the chemical compound stock.
+
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+
+        :returns: The canonical SMILES string of the chemical compound without the atom map numbers, or `None` if the
+            chemical compound SMILES string cannot be parsed.
+        """
+
+        compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+            compound_smiles=compound_smiles
+        )
+
+        if compound_mol is None:
+            return None
+
+        return CompoundFormattingUtility.convert_compound_mol_to_smiles(
+            compound_mol=compound_mol,
+            remove_compound_atom_map_numbers=True
+        )
+
+    @staticmethod
+    def _get_bloom_filter_bit_indices(
+            compound_smiles_digests: ndarray,
+            number_of_bloom_filter_bits: int,
+            number_of_bloom_filter_hash_functions: int
+    ) -> ndarray:
+        """
+        Get the Bloom filter bit indices of the chemical compound SMILES string digests using double hashing.
+
+        :parameter compound_smiles_digests: The 64-bit digests of the chemical compound SMILES strings.
+        :parameter number_of_bloom_filter_bits: The number of bits of the Bloom filter.
+        :parameter number_of_bloom_filter_hash_functions: The number of hash functions of the Bloom filter.
+
+        :returns: The Bloom filter bit indices with the shape (number of digests, number of hash functions).
+        """
+
+        first_hashes = bitwise_and(compound_smiles_digests, uint64(0xFFFFFFFF))
+        second_hashes = right_shift(compound_smiles_digests, uint64(32)) | uint64(1)
+
+        return (
+            first_hashes[:, None] +
+            second_hashes[:, None] * array(range(number_of_bloom_filter_hash_functions), dtype=uint64)[None, :]
+        ) % uint64(number_of_bloom_filter_bits)
+
+    @classmethod
+    def from_compound_smiles_strings(
+            cls,
+            compound_smiles_strings: Iterable[str],
+            canonicalize: bool = True,
+            number_of_bloom_filter_bits_per_compound: int = 0
+    ) -> "CompoundStockLookup":
+        """
+        Construct the chemical compound stock lookup from chemical compound SMILES strings.
+
+        :parameter compound_smiles_strings: The SMILES strings of the chemical compounds.
+        :parameter canonicalize: The indicator of whether the chemical compound SMILES strings should be canonicalized.
+            The unparsable chemical compound SMILES strings are skipped.
+        :parameter number_of_bloom_filter_bits_per_compound: The number of Bloom filter bits per chemical compound. The
+            value `0` indicates that the Bloom filter front-end should not be constructed.
+
+        :returns: The chemical compound stock lookup.
+        """
+
+        if canonicalize:
+            compound_smiles_strings = (
+                canonical_compound_smiles
+                for canonical_compound_smiles in map(cls.canonicalize_compound_smiles, compound_smiles_strings)
+                if canonical_compound_smiles is not None
+            )
+
+        compound_smiles_digests = cls.get_compound_smiles_digests(
+            compound_smiles_strings=compound_smiles_strings
+        )
+
+        # The digests are sorted in place and deduplicated, as the construction of the large chemical compound stocks
+        # is bounded by the memory.
+        compound_smiles_digests.sort()
+
+        if len(compound_smiles_digests) > 1:
+            compound_smiles_digests = compound_smiles_digests[concatenate((
+                array([True, ]),
+                compound_smiles_digests[1:] != compound_smiles_digests[:-1],
+            ))]
+
+        if number_of_bloom_filter_bits_per_compound <= 0 or len(compound_smiles_digests) == 0:
+            return cls(
+                compound_smiles_digests=compound_smiles_digests
+            )
+
+        number_of_bloom_filter_bytes = -(-len(compound_smiles_digests) * number_of_bloom_filter_bits_per_compound // 8)
+        number_of_bloom_filter_hash_functions = max(1, round(number_of_bloom_filter_bits_per_compound * log(2)))
+
+        bloom_filter = zeros(
+            shape=number_of_bloom_filter_bytes,
+            dtype=uint8
+        )
+
+        for chunk_start_index in range(0, len(compound_smiles_digests), cls._bloom_filter_chunk_size):
+            bloom_filter_bit_indices = cls._get_bloom_filter_bit_indices(
+                compound_smiles_digests=compound_smiles_digests[
+                    chunk_start_index:chunk_start_index + cls._bloom_filter_chunk_size
+                ],
+                number_of_bloom_filter_bits=number_of_bloom_filter_bytes * 8,
+                number_of_bloom_filter_hash_functions=number_of_bloom_filter_hash_functions
+            ).ravel()
+
+            bitwise_or.at(
+                bloom_filter,
+                bloom_filter_bit_indices >> uint64(3),
+                left_shift(1, bloom_filter_bit_indices & uint64(7)).astype(uint8)
+            )
+
+        return cls(
+            compound_smiles_digests=compound_smiles_digests,
+            bloom_filter=bloom_filter,
+            number_of_bloom_filter_hash_functions=number_of_bloom_filter_hash_functions
+        )
+
+    @classmethod
+    def from_compound_smiles_file(
+            cls,
+            file_path: str,
+            canonicalize: bool = True,
+            number_of_bloom_filter_bits_per_compound: int = 0
+    ) -> "CompoundStockLookup":
+        """
+        Construct the chemical compound stock lookup from a file with a chemical compound SMILES string as the first
+        whitespace-separated token of each line.
+
+        :parameter file_path: The path to the file.
+        :parameter canonicalize: The indicator of whether the chemical compound SMILES strings should be canonicalized.
+            The unparsable chemical compound SMILES strings are skipped.
+        :parameter number_of_bloom_filter_bits_per_compound: The number of Bloom filter bits per chemical compound. The
+            value `0` indicates that the Bloom filter front-end should not be constructed.
+
+        :returns: The chemical compound stock lookup.
+        """
+
+        with open(file_path) as file_handle:
+            return cls.from_compound_smiles_strings(
+                compound_smiles_strings=(
+                    line.split()[0]
+                    for line in file_handle
+                    if line.strip() != ""
+                ),
+                canonicalize=canonicalize,
+                number_of_bloom_filter_bits_per_compound=number_of_bloom_filter_bits_per_compound
+            )
+
+    def contains_compound_smiles_digests(
+            self,
+            compound_smiles_digests: ndarray
+    ) -> ndarray:
+        """
+        Check whether the chemical compound SMILES string digests are in the stock.
+
+        :parameter compound_smiles_digests: The 64-bit digests of the canonical chemical compound SMILES strings.
+
+        :returns: The indicators of whether the chemical compounds are in the stock.
+        """
+
+        compound_smiles_digests = array(compound_smiles_digests, dtype=uint64, ndmin=1)
+
+        is_in_stock = ones(
+            shape=len(compound_smiles_digests),
+            dtype=bool_
+        )
+
+        if self.bloom_filter is not None:
+            for chunk_start_index in range(0, len(compound_smiles_digests), self._bloom_filter_chunk_size):
+                bloom_filter_bit_indices = self._get_bloom_filter_bit_indices(
+                    compound_smiles_digests=compound_smiles_digests[
+                        chunk_start_index:chunk_start_index + self._bloom_filter_chunk_size
+                    ],
+                    number_of_bloom_filter_bits=len(self.bloom_filter) * 8,
+                    number_of_bloom_filter_hash_functions=self.number_of_bloom_filter_hash_functions
+                )
+
+                is_in_stock[chunk_start_index:chunk_start_index + self._bloom_filter_chunk_size] = (
+                    (
+                        self.bloom_filter[bloom_filter_bit_indices >> uint64(3)] >>
+                        (bloom_filter_bit_indices & uint64(7))
+                    ) & 1
+                ).astype(bool_).all(axis=1)
+
+        if len(self.compound_smiles_digests) == 0:
+            is_in_stock[:] = False
+
+            return is_in_stock
+
+        candidate_digests = compound_smiles_digests[is_in_stock]
+
+        candidate_digest_positions = self.compound_smiles_digests.searchsorted(
+            candidate_digests
+        ).clip(
+            max=len(self.compound_smiles_digests) - 1
+        )
+
+        is_in_stock[is_in_stock] = self.compound_smiles_digests[candidate_digest_positions] == candidate_digests
+
+        return is_in_stock
+
+    def contains_compound_smiles(
+            self,
+            compound_smiles: str,
+            canonicalize: bool = False
+    ) -> bool:
+        """
+        Check whether a chemical compound SMILES string is in the stock. A single check takes several microseconds,
+        which is dominated by the hashing and the per-call overhead of the Python interpreter. For sub-microsecond
+        checks per chemical compound, the digests of the chemical compound SMILES strings should be computed once and
+        checked in batches using the ``contains_compound_smiles_digests`` method.
+
+        :parameter compound_smiles: The SMILES string of the chemical compound.
+        :parameter canonicalize: The indicator of whether the chemical compound SMILES string should be canonicalized.
+
+        :returns: The indicator of whether the chemical compound is in the stock.
+        """
+
+        if canonicalize:
+            compound_smiles = self.canonicalize_compound_smiles(
+                compound_smiles=compound_smiles
+            )
+
+            if compound_smiles is None:
+                return False
+
+        compound_smiles_digest = self.get_compound_smiles_digest(
+            compound_smiles=compound_smiles
+        )
+
+        # The Python integer arithmetic and the memory view mirror the wrapping unsigned 64-bit arithmetic of the
+        # vectorized variant while avoiding the overhead of the NumPy scalar operations.
+        if self.bloom_filter is not None:
+            first_hash = compound_smiles_digest & 0xFFFFFFFF
+            second_hash = (compound_smiles_digest >> 32) | 1
+            number_of_bloom_filter_bits = len(self.bloom_filter) * 8
+
+            for hash_function_index in range(self.number_of_bloom_filter_hash_functions):
+                bloom_filter_bit_index = (
+                    (first_hash + second_hash * hash_function_index) & 0xFFFFFFFFFFFFFFFF
+                ) % number_of_bloom_filter_bits
+
+                if not (self._bloom_filter_view[bloom_filter_bit_index >> 3] >> (bloom_filter_bit_index & 7)) & 1:
+                    return False
+
+        compound_smiles_digest_position = int(self.compound_smiles_digests.searchsorted(
+            uint64(compound_smiles_digest)
+        ))
+
+        return bool(
+            compound_smiles_digest_position < len(self.compound_smiles_digests) and
+            int(self.compound_smiles_digests[compound_smiles_digest_position]) == compound_smiles_digest
+        )
+
+    def contains_compound_smiles_strings(
+            self,
+            compound_smiles_strings: Iterable[str],
+            canonicalize: bool = False
+    ) -> ndarray:
+        """
+        Check whether the chemical compound SMILES strings are in the stock.
+
+        :parameter compound_smiles_strings: The SMILES strings of the chemical compounds, for example, as a NumPy
+            object array.
+        :parameter canonicalize: The indicator of whether the chemical compound SMILES strings should be canonicalized.
+            The unparsable chemical compound SMILES strings are reported as not in the stock.
+
+        :returns: The indicators of whether the chemical compounds are in the stock.
+        """
+
+        if canonicalize:
+            compound_smiles_strings = [
+                self.canonicalize_compound_smiles(
+                    compound_smiles=compound_smiles
+                ) for compound_smiles in compound_smiles_strings
+            ]
+
+            is_parsable = array([
+                compound_smiles is not None
+                for compound_smiles in compound_smiles_strings
+            ], dtype=bool_)
+
+            return self.contains_compound_smiles_digests(
+                compound_smiles_digests=self.get_compound_smiles_digests(
+                    compound_smiles_strings=(
+                        "" if compound_smiles is None else compound_smiles
+                        for compound_smiles in compound_smiles_strings
+                    )
+                )
+            ) & is_parsable
+
+        return self.contains_compound_smiles_digests(
+            compound_smiles_digests=self.get_compound_smiles_digests(
+                compound_smiles_strings=compound_smiles_strings
+            )
+        )
+
+    def save(
+            self,
+            directory_path: str
+    ) -> None:
+        """
+        Save the chemical compound stock lookup to a directory.
+
+        :parameter directory_path: The path to the directory.
+        """
+
+        makedirs(
+            name=directory_path,
+            exist_ok=True
+        )
+
+        save(
+            file=join(directory_path, "compound_smiles_digests.npy"),
+            arr=self.compound_smiles_digests
+        )
+
+        if self.bloom_filter is not None:
+            save(
+                file=join(directory_path, "bloom_filter.npy"),
+                arr=self.bloom_filter
+            )
+
+        with open(join(directory_path, "metadata.json"), mode="w") as file_handle:
+            dump(
+                obj={
+                    "number_of_bloom_filter_hash_functions": self.number_of_bloom_filter_hash_functions,
+                },
+                fp=file_handle
+            )
+
+    @classmethod
+    def load(
+            cls,
+            directory_path: str,
+            memory_map: bool = True
+    ) -> "CompoundStockLookup":
+        """
+        Load the chemical compound stock lookup from a directory.
+
+        :parameter directory_path: The path to the directory.
+        :parameter memory_map: The indicator of whether the digests should be memory-mapped instead of read into
+            memory. The Bloom filter is always read into memory.
+
+        :returns: The chemical compound stock lookup.
+        """
+
+        with open(join(directory_path, "metadata.json")) as file_handle:
+            metadata = load(
+                fp=file_handle
+            )
+
+        return cls(
+            compound_smiles_digests=np_load(
+                file=join(directory_path, "compound_smiles_digests.npy"),
+                mmap_mode="r" if memory_map else None
+            ),
+            bloom_filter=np_load(
+                file=join(directory_path, "bloom_filter.npy")
+            ) if exists(join(directory_path, "bloom_filter.npy")) else None,
+            number_of_bloom_filter_hash_functions=metadata["number_of_bloom_filter_hash_functions"]
+        )
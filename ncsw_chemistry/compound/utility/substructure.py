@@ -1,14 +1,15 @@
 """ The ``ncsw_chemistry.compound.utility`` package ``substructure`` module. """
 
 from collections import Counter
-from typing import Container, Optional, Sequence
+from hashlib import blake2b
+from typing import Any, Container, Optional
 
 from rdkit.Chem.rdchem import Mol
 from rdkit.Chem.rdmolfiles import MolFragmentToSmarts, MolFragmentToSmiles
 
 from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
 from ncsw_chemistry.compound.utility.bond import CompoundBondUtility
-from ncsw_chemistry.compound.utility.typing_ import CompoundSubstructurePropertyIDTuple
+from ncsw_chemistry.compound.utility.typing_ import CompoundPropertyKeysOrProfile, CompoundSubstructurePropertyIDTuple
 
 
 class CompoundSubstructureUtility:
@@ -18,20 +19,20 @@ class CompoundSubstructureUtility:
     def get_substructure_property_id(
             compound_mol: Mol,
             substructure_atom_indices: Container[int],
-            substructure_atom_property_keys: Optional[Sequence[str]] = None,
-            substructure_bond_property_keys: Optional[Sequence[str]] = None
+            substructure_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            substructure_bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
     ) -> CompoundSubstructurePropertyIDTuple:
         """
         Get the property ID of a chemical compound substructure.
 
         :parameter compound_mol: The RDKit Mol object of the chemical compound.
         :parameter substructure_atom_indices: The indices of the chemical compound substructure atoms.
-        :parameter substructure_atom_property_keys: The keys of the chemical compound substructure atom properties that
-            should be utilized in the property ID. The value `None` indicates that all chemical compound substructure
-            atom properties should be utilized in the property ID.
-        :parameter substructure_bond_property_keys: The keys of the chemical compound substructure bond properties that
-            should be utilized in the property ID. The value `None` indicates that all chemical compound substructure
-            bond properties should be utilized in the property ID.
+        :parameter substructure_atom_property_keys: The keys or the property profile name of the chemical compound
+            substructure atom properties that should be utilized in the property ID. The value `None` indicates that all
+            chemical compound substructure atom properties should be utilized in the property ID.
+        :parameter substructure_bond_property_keys: The keys or the property profile name of the chemical compound
+            substructure bond properties that should be utilized in the property ID. The value `None` indicates that all
+            chemical compound substructure bond properties should be utilized in the property ID.
 
         :returns: The property ID of the chemical compound substructure.
         """
@@ -72,6 +73,99 @@ class CompoundSubstructureUtility:
             frozenset(Counter(substructure_bond_atom_indices_to_property_id.values()).items()),
         )
 
+    @staticmethod
+    def _get_canonical_property_id_string(
+            property_id: Any
+    ) -> str:
+        """
+        Get the canonical string of a property ID, which is independent of the iteration order of the frozen sets.
+
+        :parameter property_id: The property ID.
+
+        :returns: The canonical string of the property ID.
+        """
+
+        if isinstance(property_id, (frozenset, set, )):
+            return "{{{elements}}}".format(
+                elements=",".join(sorted(
+                    CompoundSubstructureUtility._get_canonical_property_id_string(
+                        property_id=element
+                    ) for element in property_id
+                ))
+            )
+
+        if isinstance(property_id, tuple):
+            # The integer-only property IDs of the property profiles are converted without the recursion, which yields
+            # the same canonical string.
+            if all(type(element) is int for element in property_id):
+                return "({elements})".format(
+                    elements=",".join(map(repr, property_id))
+                )
+
+            return "({elements})".format(
+                elements=",".join(
+                    CompoundSubstructureUtility._get_canonical_property_id_string(
+                        property_id=element
+                    ) for element in property_id
+                )
+            )
+
+        return repr(property_id)
+
+    @staticmethod
+    def get_property_id_hash(
+            property_id: Any
+    ) -> int:
+        """
+        Get the 64-bit hash of a property ID, which is stable across processes and interpreter sessions.
+
+        :parameter property_id: The property ID of a chemical compound atom, bond or substructure.
+
+        :returns: The 64-bit hash of the property ID.
+        """
+
+        return int.from_bytes(
+            bytes=blake2b(
+                CompoundSubstructureUtility._get_canonical_property_id_string(
+                    property_id=property_id
+                ).encode(),
+                digest_size=8
+            ).digest(),
+            byteorder="little"
+        )
+
+    @staticmethod
+    def get_substructure_property_id_hash(
+            compound_mol: Mol,
+            substructure_atom_indices: Container[int],
+            substructure_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            substructure_bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
+    ) -> int:
+        """
+        Get the 64-bit hash of the property ID of a chemical compound substructure, which is stable across processes
+        and interpreter sessions.
+
+        :parameter compound_mol: The RDKit Mol object of the chemical compound.
+        :parameter substructure_atom_indices: The indices of the chemical compound substructure atoms.
+        :parameter substructure_atom_property_keys: The keys or the property profile name of the chemical compound
+            substructure atom properties that should be utilized in the property ID. The value `None` indicates that all
+            chemical compound substructure atom properties should be utilized in the property ID.
+        :parameter substructure_bond_property_keys: The keys or the property profile name of the chemical compound
+            substructure bond properties that should be utilized in the property ID. The value `None` indicates that all
+            chemical compound substructure bond properties should be utilized in the property ID.
+
+        :returns: The 64-bit hash of the property ID of the chemical compound substructure.
+        """
+
+        return CompoundSubstructureUtility.get_property_id_hash(
+            property_id=CompoundSubstructureUtility.get_substructure_property_id(
+                compound_mol=compound_mol,
+                substructure_atom_indices=substructure_atom_indices,
+                substructure_atom_property_keys=substructure_atom_property_keys,
+                substructure_bond_property_keys=substructure_bond_property_keys
+            )
+        )
+
     @staticmethod
     def get_substructure_smarts(
             compound_mol: Mol,
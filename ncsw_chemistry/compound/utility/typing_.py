@@ -1,16 +1,18 @@
 """ The ``ncsw_chemistry.compound.utility`` package ``typing_`` module. """
 
-from typing import FrozenSet, Tuple, Union
+from typing import FrozenSet, Sequence, Tuple, Union
 
 
 CompoundAtomPropertyIDTuple = Tuple[Union[bool, int, float, str], ...]
 
 CompoundBondPropertyIDTuple = Tuple[
     FrozenSet[CompoundAtomPropertyIDTuple],
-    Tuple[Union[bool, str], ...]
+    Tuple[Union[bool, int, str], ...]
 ]
 
 CompoundSubstructurePropertyIDTuple = Tuple[
     FrozenSet[Tuple[CompoundAtomPropertyIDTuple, int]],
     FrozenSet[Tuple[CompoundBondPropertyIDTuple, int]]
 ]
+
+CompoundPropertyKeysOrProfile = Union[Sequence[str], str]
@@ -0,0 +1,26 @@
+""" The ``ncsw_chemistry.execution`` package initialization module. """
+
+from ncsw_chemistry.execution.caching import PersistentResultCache
+
+from ncsw_chemistry.execution.guarding import GuardedExecutor
+
+from ncsw_chemistry.execution.parallel import (
+    iterate_chunks,
+    map_in_chunks,
+)
+
+from ncsw_chemistry.execution.scheduling import MicroBatchScheduler
+
+from ncsw_chemistry.execution.soaking import SoakTestHarness
+
+from ncsw_chemistry.execution.transport import (
+    SharedMolArena,
+    benchmark_shared_memory_transport,
+    map_in_chunks_using_shared_memory,
+)
+
+from ncsw_chemistry.execution.worker import (
+    get_cached_rdchiral_reaction,
+    get_picklable_exception,
+    get_process_rss,
+)
@@ -0,0 +1,335 @@
+""" The ``ncsw_chemistry.execution`` package ``caching`` module. """
+
+from hashlib import blake2b
+from importlib.metadata import PackageNotFoundError, version
+from json import dumps
+from sqlite3 import Connection, connect
+from time import time
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from rdkit import rdBase
+
+from ncsw_chemistry import __version__
+
+
+class PersistentResultCache:
+    """ The persistent result cache class. """
+
+    cache_format_version = 1
+
+    def __init__(
+            self,
+            database_file_path: str,
+            configuration: Optional[Mapping[str, Any]] = None,
+            max_number_of_entries: Optional[int] = None,
+            access_time_resolution: float = 3600.0,
+            timeout: float = 60.0
+    ) -> None:
+        """
+        The constructor method of the class. The results are stored in an SQLite database file in the write-ahead
+        logging mode, which allows concurrent readers and writers across processes on the same machine.
+
+        :parameter database_file_path: The path to the SQLite database file of the cache.
+        :parameter configuration: The JSON-serializable configuration that the results depend on. The results of
+            different configurations are stored side by side.
+        :parameter max_number_of_entries: The maximum number of entries of the cache, beyond which the least recently
+            used entries are evicted. The value `None` indicates that the number of entries should not be limited.
+        :parameter access_time_resolution: The minimum age in seconds of the access time of an entry before it is
+            refreshed by a hit, which keeps the hits of the recently used entries free of writes.
+        :parameter timeout: The time in seconds that a connection waits for a lock of the database.
+        """
+
+        self.database_file_path = database_file_path
+        self.configuration = dict() if configuration is None else dict(configuration)
+        self.max_number_of_entries = max_number_of_entries
+        self.access_time_resolution = access_time_resolution
+
+        self.version_fingerprint = self.get_version_fingerprint()
+
+        self.configuration_fingerprint = self._get_digest(
+            value=dumps(
+                obj=self.configuration,
+                sort_keys=True
+            )
+        )
+
+        self.number_of_hits = 0
+        self.number_of_misses = 0
+
+        self._connection: Connection = connect(
+            database=database_file_path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key BLOB PRIMARY KEY, "
+            "version_fingerprint TEXT NOT NULL, "
+            "value BLOB, "
+            "access_time REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_access_time ON entries (access_time)"
+        )
+
+        # The number of entries is maintained by the triggers in the same transactions as the entries, as counting the
+        # entries on every insertion is linear in the size of the cache.
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entry_count ("
+            "id INTEGER PRIMARY KEY CHECK (id = 0), "
+            "number_of_entries INTEGER NOT NULL"
+            ")"
+        )
+
+        self._connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN "
+            "UPDATE entry_count SET number_of_entries = number_of_entries + 1 WHERE id = 0; "
+            "END"
+        )
+
+        self._connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN "
+            "UPDATE entry_count SET number_of_entries = number_of_entries - 1 WHERE id = 0; "
+            "END"
+        )
+
+        self._connection.execute(
+            "INSERT OR IGNORE INTO entry_count (id, number_of_entries) VALUES (0, (SELECT COUNT(*) FROM entries))"
+        )
+
+        # The entries of the other library versions can never be hit again, which is why they are removed on opening.
+        self._connection.execute(
+            "DELETE FROM entries WHERE version_fingerprint != ?",
+            (self.version_fingerprint, )
+        )
+
+    def __enter__(
+            self
+    ) -> "PersistentResultCache":
+        """
+        Enter the runtime context of the cache.
+
+        :returns: The persistent result cache.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the cache and close the database connection. """
+
+        self.close()
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of entries of the cache across all configurations.
+
+        :returns: The number of entries of the cache.
+        """
+
+        return self._connection.execute(
+            "SELECT number_of_entries FROM entry_count WHERE id = 0"
+        ).fetchone()[0]
+
+    def close(
+            self
+    ) -> None:
+        """ Close the database connection of the cache. """
+
+        self._connection.close()
+
+    @staticmethod
+    def _get_digest(
+            value: str
+    ) -> str:
+        """
+        Get the hexadecimal 128-bit digest of a string.
+
+        :parameter value: The string.
+
+        :returns: The hexadecimal digest of the string.
+        """
+
+        return blake2b(
+            value.encode(),
+            digest_size=16
+        ).hexdigest()
+
+    @classmethod
+    def get_version_fingerprint(
+            cls
+    ) -> str:
+        """
+        Get the fingerprint of the versions of the cache format and the libraries that the results depend on.
+
+        :returns: The fingerprint of the versions.
+        """
+
+        # The version of the package is read from the package itself, as the installed distribution metadata is not
+        # available when running from a source checkout.
+        library_versions = {
+            "cache_format": str(cls.cache_format_version),
+            "ncsw_chemistry": __version__,
+            "rdkit": rdBase.rdkitVersion,
+        }
+
+        try:
+            library_versions["rdchiral"] = version("rdchiral")
+
+        except PackageNotFoundError:
+            library_versions["rdchiral"] = "unknown"
+
+        return cls._get_digest(
+            value=dumps(
+                obj=library_versions,
+                sort_keys=True
+            )
+        )
+
+    def _get_key(
+            self,
+            input_string: str
+    ) -> bytes:
+        """
+        Get the key of an input string under the configuration of the cache.
+
+        :parameter input_string: The input string.
+
+        :returns: The 128-bit key of the input string.
+        """
+
+        return blake2b(
+            "{configuration_fingerprint}\t{input_string}".format(
+                configuration_fingerprint=self.configuration_fingerprint,
+                input_string=input_string
+            ).encode(),
+            digest_size=16
+        ).digest()
+
+    def get_many(
+            self,
+            input_strings: Iterable[str]
+    ) -> Dict[str, Optional[bytes]]:
+        """
+        Get the cached results of multiple input strings.
+
+        :parameter input_strings: The input strings.
+
+        :returns: The cached results of the input strings that were found in the cache. The value `None` represents a
+            cached failure.
+        """
+
+        input_string_keys = {
+            self._get_key(
+                input_string=input_string
+            ): input_string for input_string in input_strings
+        }
+
+        cached_results, stale_keys = dict(), list()
+
+        keys = list(input_string_keys.keys())
+
+        access_time = time()
+
+        # The number of SQL variables per statement is limited, which is why the keys are looked up in chunks.
+        for chunk_start_index in range(0, len(keys), 500):
+            chunk_keys = keys[chunk_start_index:chunk_start_index + 500]
+
+            for key, value, entry_access_time in self._connection.execute(
+                "SELECT key, value, access_time FROM entries WHERE key IN ({placeholders}) AND "
+                "version_fingerprint = ?".format(
+                    placeholders=", ".join("?" * len(chunk_keys))
+                ),
+                (*chunk_keys, self.version_fingerprint, )
+            ):
+                cached_results[input_string_keys[key]] = value
+
+                if access_time - entry_access_time >= self.access_time_resolution:
+                    stale_keys.append(key)
+
+        # The access times are refreshed in a single transaction, as each statement would otherwise be committed
+        # separately.
+        if len(stale_keys) > 0:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                self._connection.executemany(
+                    "UPDATE entries SET access_time = ? WHERE key = ?",
+                    [(access_time, key, ) for key in stale_keys]
+                )
+
+                self._connection.execute("COMMIT")
+
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+
+                raise
+
+        self.number_of_hits += len(cached_results)
+        self.number_of_misses += len(input_string_keys) - len(cached_results)
+
+        return cached_results
+
+    def set_many(
+            self,
+            results: Iterable[Tuple[str, Optional[bytes]]]
+    ) -> None:
+        """
+        Set the results of multiple input strings and evict the least recently used entries if the cache is full.
+
+        :parameter results: The input strings and their results. The value `None` represents a failure.
+        """
+
+        access_time = time()
+
+        self._connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            # The existing entries are updated in place instead of replaced, as the deletions of the replacements do not
+            # fire the triggers that maintain the number of entries.
+            self._connection.executemany(
+                "INSERT INTO entries (key, version_fingerprint, value, access_time) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET version_fingerprint = excluded.version_fingerprint, "
+                "value = excluded.value, access_time = excluded.access_time",
+                [
+                    (self._get_key(
+                        input_string=input_string
+                    ), self.version_fingerprint, value, access_time, ) for input_string, value in results
+                ]
+            )
+
+            if self.max_number_of_entries is not None:
+                number_of_excess_entries = len(self) - self.max_number_of_entries
+
+                if number_of_excess_entries > 0:
+                    self._connection.execute(
+                        "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY access_time LIMIT ?)",
+                        (number_of_excess_entries, )
+                    )
+
+            self._connection.execute("COMMIT")
+
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+
+            raise
+
+    def clear(
+            self
+    ) -> None:
+        """ Remove all of the entries of the cache. """
+
+        self._connection.execute(
+            "DELETE FROM entries"
+        )
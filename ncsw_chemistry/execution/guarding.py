@@ -0,0 +1,378 @@
+""" The ``ncsw_chemistry.execution`` package ``guarding`` module. """
+
+from collections import deque
+from json import dumps, loads
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from os import cpu_count
+from os.path import exists
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ncsw_chemistry.execution.worker import get_picklable_exception, get_process_rss
+
+
+def _run_guarded_worker(
+        connection: Connection
+) -> None:
+    """
+    Run the guarded worker process, which calls the received functions until it receives the value `None`.
+
+    :parameter connection: The connection of the worker process to the guarded executor.
+    """
+
+    while True:
+        try:
+            message = connection.recv()
+
+        except EOFError:
+            return
+
+        if message is None:
+            return
+
+        item_index, function, arguments = message
+
+        try:
+            result = (item_index, True, function(**arguments), )
+
+        except Exception as exception:
+            result = (item_index, False, get_picklable_exception(
+                exception=exception
+            ), )
+
+        try:
+            connection.send(result)
+
+        except Exception as exception:
+            connection.send((item_index, False, get_picklable_exception(
+                exception=exception
+            ), ))
+
+
+class _GuardedWorker:
+    """ The guarded worker process class. """
+
+    def __init__(
+            self,
+            process_context: Any
+    ) -> None:
+        """
+        The constructor method of the class, which starts the worker process.
+
+        :parameter process_context: The multiprocessing context of the worker process.
+        """
+
+        self.connection, worker_connection = process_context.Pipe()
+
+        self.process = process_context.Process(
+            target=_run_guarded_worker,
+            args=(worker_connection, ),
+            daemon=True
+        )
+
+        self.process.start()
+
+        worker_connection.close()
+
+        self.item_index: Optional[int] = None
+        self.item_start_time = 0.0
+        self.item_start_rss = 0
+
+    def kill(
+            self
+    ) -> None:
+        """ Kill the worker process. """
+
+        self.process.kill()
+        self.process.join()
+
+        self.connection.close()
+
+    def stop(
+            self
+    ) -> None:
+        """ Stop the worker process gracefully. """
+
+        try:
+            self.connection.send(None)
+
+        except OSError:
+            pass
+
+        self.process.join(
+            timeout=5.0
+        )
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.connection.close()
+
+
+class GuardedExecutor:
+    """ The guarded executor class. """
+
+    result_statuses = ("success", "error", "timeout", "memory", "crash", "quarantined", )
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            max_time_per_item: Optional[float] = 60.0,
+            max_memory_per_worker: Optional[int] = None,
+            quarantine_file_path: Optional[str] = None,
+            poll_interval: float = 0.05
+    ) -> None:
+        """
+        The constructor method of the class. The items are processed one by one in dedicated worker processes, which
+        are killed and respawned if an item exceeds the limits, without affecting the other items.
+
+        :parameter max_workers: The number of worker processes. The value `None` indicates that the number of
+            processors should be utilized.
+        :parameter max_time_per_item: The maximum wall time in seconds per item. The value `None` indicates that the
+            wall time should not be limited.
+        :parameter max_memory_per_worker: The maximum growth of the resident set size in bytes of a worker process
+            while it processes an item, above which the item is quarantined. The worker processes whose resident set
+            size exceeds the same value after an item are replaced without quarantining the item, as the freed memory
+            is rarely returned to the operating system. The value `None` indicates that the memory should not be
+            limited. The limit is enforced only on the platforms with the ``/proc`` file system.
+        :parameter quarantine_file_path: The path to the JSON Lines file of the quarantined items, which is read on
+            construction and appended on each offence. The value `None` indicates that the quarantine should be kept
+            in memory only.
+        :parameter poll_interval: The interval in seconds at which the limits are checked.
+        """
+
+        self.max_workers = max_workers or cpu_count() or 1
+        self.max_time_per_item = max_time_per_item
+        self.max_memory_per_worker = max_memory_per_worker
+        self.quarantine_file_path = quarantine_file_path
+        self.poll_interval = poll_interval
+
+        self.quarantine: Dict[str, str] = dict()
+
+        if quarantine_file_path is not None and exists(quarantine_file_path):
+            with open(quarantine_file_path) as file_handle:
+                for line in file_handle:
+                    if len(line.strip()) > 0:
+                        quarantine_entry = loads(line)
+
+                        self.quarantine[quarantine_entry["item_key"]] = quarantine_entry["reason"]
+
+        self.number_of_respawned_workers = 0
+
+        self._process_context = get_context()
+        self._workers: List[_GuardedWorker] = list()
+
+    def __enter__(
+            self
+    ) -> "GuardedExecutor":
+        """
+        Enter the runtime context of the executor.
+
+        :returns: The guarded executor.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the executor and stop the worker processes. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Stop the worker processes of the executor. """
+
+        for worker in self._workers:
+            worker.stop()
+
+        self._workers = list()
+
+    @staticmethod
+    def get_item_key(
+            function: Callable,
+            arguments: Dict[str, Any]
+    ) -> str:
+        """
+        Get the default quarantine key of an item.
+
+        :parameter function: The function of the item.
+        :parameter arguments: The keyword arguments of the item.
+
+        :returns: The quarantine key of the item.
+        """
+
+        return "{function_name}\t{arguments}".format(
+            function_name=getattr(function, "__qualname__", repr(function)),
+            arguments=repr(sorted(arguments.items()))
+        )
+
+    def _add_to_quarantine(
+            self,
+            item_key: str,
+            reason: str
+    ) -> None:
+        """
+        Add an item to the quarantine.
+
+        :parameter item_key: The quarantine key of the item.
+        :parameter reason: The reason of the quarantine.
+        """
+
+        self.quarantine[item_key] = reason
+
+        if self.quarantine_file_path is not None:
+            with open(self.quarantine_file_path, mode="a") as file_handle:
+                file_handle.write(
+                    dumps({
+                        "item_key": item_key,
+                        "reason": reason,
+                    }) + "\n"
+                )
+
+    def _replace_worker(
+            self,
+            worker: _GuardedWorker
+    ) -> None:
+        """
+        Kill a worker process and replace it with a new one.
+
+        :parameter worker: The worker process.
+        """
+
+        worker.kill()
+
+        self._workers[self._workers.index(worker)] = _GuardedWorker(
+            process_context=self._process_context
+        )
+
+        self.number_of_respawned_workers += 1
+
+    def map(
+            self,
+            function: Callable,
+            arguments: Iterable[Dict[str, Any]],
+            item_keys: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, Any]]:
+        """
+        Call a function on multiple items under the limits of the executor. The suitable functions include, for example,
+        the ``ReactionReactivityUtility.extract_retro_template_using_rdchiral``,
+        ``ReactionReactivityUtility.apply_retro_template_using_rdchiral``,
+        ``CompoundStandardizationUtility.standardize_compound_smiles`` and
+        ``ReactionStandardizationUtility.standardize_reaction_smiles`` methods.
+
+        :parameter function: The picklable function that should be called.
+        :parameter arguments: The picklable keyword arguments of the function per item.
+        :parameter item_keys: The quarantine keys of the items. The value `None` indicates that the keys should be
+            constructed from the function and the keyword arguments.
+
+        :returns: The statuses and results of the items in the order of the input. The status is one of `success` with
+            the result, `error` with the exception, or `timeout`, `memory`, `crash` and `quarantined` with the value
+            `None`.
+        """
+
+        arguments = list(arguments)
+
+        if item_keys is None:
+            item_keys = [
+                self.get_item_key(
+                    function=function,
+                    arguments=item_arguments
+                ) for item_arguments in arguments
+            ]
+
+        results: List[Optional[Tuple[str, Any]]] = [None] * len(arguments)
+
+        pending_item_indices = deque()
+
+        for item_index, item_key in enumerate(item_keys):
+            if item_key in self.quarantine.keys():
+                results[item_index] = ("quarantined", None, )
+
+            else:
+                pending_item_indices.append(item_index)
+
+        while len(self._workers) < min(self.max_workers, max(len(pending_item_indices), 1)):
+            self._workers.append(
+                _GuardedWorker(
+                    process_context=self._process_context
+                )
+            )
+
+        while len(pending_item_indices) > 0 or any(worker.item_index is not None for worker in self._workers):
+            for worker in self._workers:
+                if worker.item_index is None and len(pending_item_indices) > 0:
+                    worker.item_index = pending_item_indices.popleft()
+                    worker.item_start_time = monotonic()
+
+                    if self.max_memory_per_worker is not None:
+                        worker.item_start_rss = get_process_rss(worker.process.pid) or 0
+
+                    worker.connection.send((worker.item_index, function, arguments[worker.item_index], ))
+
+            busy_workers = {
+                worker.connection: worker
+                for worker in self._workers
+                if worker.item_index is not None
+            }
+
+            for connection in wait(
+                list(busy_workers.keys()),
+                timeout=self.poll_interval
+            ):
+                worker = busy_workers[connection]
+
+                try:
+                    item_index, is_successful, result = connection.recv()
+
+                except (EOFError, OSError):
+                    continue
+
+                results[item_index] = ("success" if is_successful else "error", result, )
+
+                worker.item_index = None
+
+                if self.max_memory_per_worker is not None and \
+                        (get_process_rss(worker.process.pid) or 0) > self.max_memory_per_worker:
+                    self._replace_worker(
+                        worker=worker
+                    )
+
+            current_time = monotonic()
+
+            for worker in list(self._workers):
+                if worker.item_index is None:
+                    continue
+
+                if not worker.process.is_alive():
+                    reason = "crash"
+
+                elif self.max_time_per_item is not None and \
+                        current_time - worker.item_start_time > self.max_time_per_item:
+                    reason = "timeout"
+
+                elif self.max_memory_per_worker is not None and (
+                    (get_process_rss(worker.process.pid) or 0) - worker.item_start_rss > self.max_memory_per_worker
+                ):
+                    reason = "memory"
+
+                else:
+                    continue
+
+                results[worker.item_index] = (reason, None, )
+
+                self._add_to_quarantine(
+                    item_key=item_keys[worker.item_index],
+                    reason=reason
+                )
+
+                self._replace_worker(
+                    worker=worker
+                )
+
+        return results
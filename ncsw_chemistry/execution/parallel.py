@@ -0,0 +1,100 @@
+""" The ``ncsw_chemistry.execution`` package ``parallel`` module. """
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+
+def iterate_chunks(
+        items: Iterable[Any],
+        chunk_size: int
+) -> Iterator[List[Any]]:
+    """
+    Iterate over consecutive chunks of items.
+
+    :parameter items: The items.
+    :parameter chunk_size: The maximum number of items per chunk.
+
+    :returns: The iterator over the chunks of items.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(
+            "The chunk size should be positive."
+        )
+
+    items = iter(items)
+
+    return iter(
+        lambda: list(islice(items, chunk_size)),
+        list()
+    )
+
+
+def map_in_chunks(
+        chunk_function: Callable[[List[Any]], List[Any]],
+        items: Iterable[Any],
+        chunk_size: int = 10000,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_number_of_pending_chunks: Optional[int] = None
+) -> Iterator[List[Any]]:
+    """
+    Apply a function on consecutive chunks of items in the current process or in parallel while preserving the order
+    of the chunks. Only a bounded number of chunks is submitted at once, which bounds the memory usage for large inputs.
+
+    :parameter chunk_function: The function that processes a chunk of items and returns a result per item. The
+        function should be picklable if the chunks are processed in worker processes.
+    :parameter items: The items.
+    :parameter chunk_size: The maximum number of items per chunk.
+    :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates that
+        the chunks should be processed in the current process unless an executor is specified.
+    :parameter executor: The executor that processes the chunks. The value `None` indicates that a process pool managed
+        by the function should be utilized if the number of worker processes is specified.
+    :parameter max_number_of_pending_chunks: The maximum number of chunks that are submitted at once. The value `None`
+        indicates that twice the number of worker processes should be utilized.
+
+    :returns: The iterator over the results of the chunks in the order of the chunks.
+    """
+
+    chunks = iterate_chunks(
+        items=items,
+        chunk_size=chunk_size
+    )
+
+    if executor is None and max_workers is None:
+        for chunk in chunks:
+            yield chunk_function(chunk)
+
+        return
+
+    is_executor_managed = executor is None
+
+    if is_executor_managed:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers
+        )
+
+    if max_number_of_pending_chunks is None:
+        max_number_of_pending_chunks = 2 * (max_workers or getattr(executor, "_max_workers", 1))
+
+    try:
+        pending_chunk_futures = deque()
+
+        for chunk in chunks:
+            if len(pending_chunk_futures) >= max_number_of_pending_chunks:
+                yield pending_chunk_futures.popleft().result()
+
+            pending_chunk_futures.append(
+                executor.submit(chunk_function, chunk)
+            )
+
+        while len(pending_chunk_futures) > 0:
+            yield pending_chunk_futures.popleft().result()
+
+    finally:
+        if is_executor_managed:
+            executor.shutdown(
+                cancel_futures=True
+            )
@@ -0,0 +1,433 @@
+""" The ``ncsw_chemistry.execution`` package ``scheduling`` module. """
+
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from threading import Condition, Thread
+from time import monotonic
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+from numpy import array, mean, percentile
+
+from rdchiral.main import rdchiralReactants, rdchiralRun
+
+from ncsw_chemistry.execution.worker import get_cached_rdchiral_reaction, get_picklable_exception
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+
+
+def _apply_retro_template_using_rdchiral_in_worker(
+        group_arguments: Dict[str, Any],
+        call_arguments: Sequence[Dict[str, Any]]
+) -> List[Tuple[bool, Any]]:
+    """
+    Apply a single chemical reaction retro template on a batch of chemical compounds using the RDChiral library. The
+    compiled chemical reaction retro template is cached in the worker thread.
+
+    :parameter group_arguments: The keyword arguments shared by the batch, which include the chemical reaction retro
+        template SMARTS string.
+    :parameter call_arguments: The keyword arguments of each call of the batch, which include the chemical compound
+        SMILES string.
+
+    :returns: The success indicators and results or exceptions of the calls.
+    """
+
+    group_arguments = dict(group_arguments)
+
+    retro_template_smarts = group_arguments.pop("retro_template_smarts")
+
+    try:
+        retro_template_rxn = get_cached_rdchiral_reaction(
+            retro_template_smarts=retro_template_smarts
+        )
+
+    except Exception as exception:
+        return [(False, exception, ), ] * len(call_arguments)
+
+    results = list()
+
+    for arguments in call_arguments:
+        arguments = dict(arguments)
+
+        try:
+            results.append((
+                True,
+                rdchiralRun(
+                    rxn=retro_template_rxn,
+                    reactants=rdchiralReactants(
+                        reactant_smiles=arguments.pop("compound_smiles")
+                    ),
+                    **group_arguments,
+                    **arguments
+                ),
+            ))
+
+        except Exception as exception:
+            results.append((
+                False,
+                exception,
+            ))
+
+    return results
+
+
+# The batch functions are keyed by the function objects, which are preserved by the pickling of the functions.
+_worker_batch_functions = {
+    ReactionReactivityUtility.apply_retro_template_using_rdchiral: (
+        "retro_template_smarts",
+        _apply_retro_template_using_rdchiral_in_worker,
+    ),
+}
+
+
+def _run_batch_in_worker(
+        function: Callable,
+        group_arguments: Dict[str, Any],
+        call_arguments: Sequence[Dict[str, Any]]
+) -> List[Tuple[bool, Any]]:
+    """
+    Run a batch of calls of the same function with the same group arguments in the worker process.
+
+    :parameter function: The function of the batch.
+    :parameter group_arguments: The keyword arguments shared by the batch.
+    :parameter call_arguments: The keyword arguments of each call of the batch.
+
+    :returns: The success indicators and results or exceptions of the calls.
+    """
+
+    results = None
+
+    if function in _worker_batch_functions.keys():
+        required_group_argument_name, batch_function = _worker_batch_functions[function]
+
+        if required_group_argument_name in group_arguments.keys():
+            results = batch_function(
+                group_arguments,
+                call_arguments
+            )
+
+    if results is None:
+        results = list()
+
+        for arguments in call_arguments:
+            try:
+                results.append((
+                    True,
+                    function(
+                        **group_arguments,
+                        **arguments
+                    ),
+                ))
+
+            except Exception as exception:
+                results.append((
+                    False,
+                    exception,
+                ))
+
+    return [
+        (is_successful, result if is_successful else get_picklable_exception(
+            exception=result
+        ), ) for is_successful, result in results
+    ]
+
+
+class MicroBatchScheduler:
+    """ The micro-batch scheduler class. """
+
+    def __init__(
+            self,
+            executor: Optional[Executor] = None,
+            max_workers: Optional[int] = None,
+            max_batch_size: int = 64,
+            max_wait_time: float = 0.005,
+            max_number_of_latency_samples: int = 100000
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter executor: The executor that runs the batches. The value `None` indicates that a process pool managed
+            by the scheduler should be utilized, whose worker processes stay warm across batches.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the number of processors should be utilized.
+        :parameter max_batch_size: The maximum number of calls per batch. A batch is dispatched immediately once it is
+            full.
+        :parameter max_wait_time: The maximum time in seconds that the first call of a batch waits for other calls of
+            the same group.
+        :parameter max_number_of_latency_samples: The maximum number of the most recent call latencies that are kept for
+            the metrics.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError(
+                "The maximum batch size should be positive."
+            )
+
+        self._is_executor_managed = executor is None
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers
+        ) if executor is None else executor
+
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+
+        self.number_of_calls = 0
+        self.number_of_failed_calls = 0
+        self.number_of_batches = 0
+
+        self._call_latencies = deque(
+            maxlen=max_number_of_latency_samples
+        )
+
+        self._batch_sizes = deque(
+            maxlen=max_number_of_latency_samples
+        )
+
+        self._pending_batches = OrderedDict()
+        self._condition = Condition()
+        self._is_closed = False
+
+        self._dispatcher_thread = Thread(
+            target=self._dispatch,
+            name="MicroBatchSchedulerDispatcher",
+            daemon=True
+        )
+
+        self._dispatcher_thread.start()
+
+    def __enter__(
+            self
+    ) -> "MicroBatchScheduler":
+        """
+        Enter the runtime context of the scheduler.
+
+        :returns: The micro-batch scheduler.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the scheduler and shut down the worker processes. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Dispatch the pending calls, wait for the running batches and shut down the managed process pool. """
+
+        with self._condition:
+            self._is_closed = True
+
+            self._condition.notify()
+
+        self._dispatcher_thread.join()
+
+        if self._is_executor_managed:
+            self.executor.shutdown()
+
+    def submit(
+            self,
+            function: Callable,
+            group_argument_names: Collection[str] = (),
+            **kwargs
+    ) -> Future:
+        """
+        Submit a call of a library function to be executed as part of a batch. The calls of the same function with the
+        same group argument values are batched together, for example, all of the calls of the
+        ``ReactionReactivityUtility.apply_retro_template_using_rdchiral`` method with the same chemical reaction retro
+        template, which is compiled only once per batch in the worker process.
+
+        :parameter function: The function that should be called. The function should be picklable.
+        :parameter group_argument_names: The names of the keyword arguments whose values should be shared by a batch.
+            The values should be hashable.
+        :parameter kwargs: The keyword arguments of the function.
+
+        :returns: The future of the result of the call.
+        """
+
+        group_key = (function, tuple(sorted(
+            (group_argument_name, kwargs[group_argument_name], )
+            for group_argument_name in group_argument_names
+        )), )
+
+        call_arguments = {
+            argument_name: argument_value
+            for argument_name, argument_value in kwargs.items()
+            if argument_name not in group_argument_names
+        }
+
+        future = Future()
+
+        with self._condition:
+            if self._is_closed:
+                raise RuntimeError(
+                    "The calls cannot be submitted after the scheduler is closed."
+                )
+
+            if group_key not in self._pending_batches.keys():
+                self._pending_batches[group_key] = (monotonic() + self.max_wait_time, list(), )
+
+                self._condition.notify()
+
+            pending_calls = self._pending_batches[group_key][1]
+
+            pending_calls.append((call_arguments, future, monotonic(), ))
+
+            if len(pending_calls) >= self.max_batch_size:
+                self._condition.notify()
+
+        return future
+
+    def _dispatch(
+            self
+    ) -> None:
+        """ Dispatch the full and expired batches to the executor until the scheduler is closed. """
+
+        running_batch_futures = list()
+
+        while True:
+            with self._condition:
+                while True:
+                    current_time = monotonic()
+
+                    ready_group_keys = [
+                        group_key
+                        for group_key, (deadline, pending_calls) in self._pending_batches.items()
+                        if self._is_closed or deadline <= current_time or len(pending_calls) >= self.max_batch_size
+                    ]
+
+                    if len(ready_group_keys) > 0 or (self._is_closed and len(self._pending_batches) == 0):
+                        break
+
+                    self._condition.wait(
+                        timeout=min(
+                            deadline for deadline, _ in self._pending_batches.values()
+                        ) - current_time if len(self._pending_batches) > 0 else None
+                    )
+
+                ready_batches = [
+                    (group_key, self._pending_batches.pop(group_key)[1], )
+                    for group_key in ready_group_keys
+                ]
+
+                is_closed = self._is_closed
+
+            for (function, group_arguments), pending_calls in ready_batches:
+                pending_calls = [
+                    (call_arguments, future, submission_time, )
+                    for call_arguments, future, submission_time in pending_calls
+                    if future.set_running_or_notify_cancel()
+                ]
+
+                for batch_start_index in range(0, len(pending_calls), self.max_batch_size):
+                    batch_calls = pending_calls[batch_start_index:batch_start_index + self.max_batch_size]
+
+                    try:
+                        batch_future = self.executor.submit(
+                            _run_batch_in_worker,
+                            function,
+                            dict(group_arguments),
+                            [call_arguments for call_arguments, _, _ in batch_calls]
+                        )
+
+                    except Exception as exception:
+                        for _, future, _ in batch_calls:
+                            future.set_exception(exception)
+
+                        continue
+
+                    batch_future.add_done_callback(
+                        partial(self._resolve_batch, batch_calls)
+                    )
+
+                    running_batch_futures.append(
+                        batch_future
+                    )
+
+            running_batch_futures = [
+                batch_future for batch_future in running_batch_futures if not batch_future.done()
+            ]
+
+            if is_closed and len(ready_batches) == 0:
+                for batch_future in running_batch_futures:
+                    batch_future.exception()
+
+                return
+
+    def _resolve_batch(
+            self,
+            batch_calls: List[Tuple[Dict[str, Any], Future, float]],
+            batch_future: Future
+    ) -> None:
+        """
+        Resolve the futures of the calls of a finished batch and record the metrics.
+
+        :parameter batch_calls: The keyword arguments, futures and submission times of the calls of the batch.
+        :parameter batch_future: The future of the batch.
+        """
+
+        try:
+            batch_results = batch_future.result()
+
+        except Exception as exception:
+            batch_results = [(False, exception, ), ] * len(batch_calls)
+
+        completion_time = monotonic()
+
+        with self._condition:
+            self.number_of_batches += 1
+            self.number_of_calls += len(batch_calls)
+            self.number_of_failed_calls += sum(not is_successful for is_successful, _ in batch_results)
+
+            self._batch_sizes.append(
+                len(batch_calls)
+            )
+
+            self._call_latencies.extend(
+                completion_time - submission_time for _, _, submission_time in batch_calls
+            )
+
+        for (_, future, _), (is_successful, result) in zip(batch_calls, batch_results):
+            if is_successful:
+                future.set_result(result)
+
+            else:
+                future.set_exception(result)
+
+    def get_metrics(
+            self
+    ) -> Dict[str, float]:
+        """
+        Get the latency and batch fill metrics of the scheduler.
+
+        :returns: The number of calls, failed calls and batches, the average batch size and fill ratio, and the mean,
+            median, 95th and 99th percentile of the recent call latencies in seconds.
+        """
+
+        with self._condition:
+            call_latencies = array(self._call_latencies)
+            batch_sizes = array(self._batch_sizes)
+
+            metrics = {
+                "number_of_calls": self.number_of_calls,
+                "number_of_failed_calls": self.number_of_failed_calls,
+                "number_of_batches": self.number_of_batches,
+            }
+
+        if len(batch_sizes) > 0:
+            metrics["average_batch_size"] = float(mean(batch_sizes))
+            metrics["average_batch_fill"] = metrics["average_batch_size"] / self.max_batch_size
+
+        if len(call_latencies) > 0:
+            metrics["mean_latency"] = float(mean(call_latencies))
+
+            for latency_percentile in (50, 95, 99, ):
+                metrics["p{latency_percentile:d}_latency".format(
+                    latency_percentile=latency_percentile
+                )] = float(percentile(call_latencies, latency_percentile))
+
+        return metrics
@@ -0,0 +1,256 @@
+""" The ``ncsw_chemistry.execution`` package ``soaking`` module. """
+
+from gc import collect
+from itertools import cycle
+from os import getpid
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from numpy import array, float64, polyfit
+
+from ncsw_chemistry.execution.worker import get_process_rss
+
+
+class SoakTestHarness:
+    """ The soak test harness class. """
+
+    def __init__(
+            self,
+            workloads: Mapping[str, Callable[[Any], Any]],
+            items: Sequence[Any],
+            workload_weights: Optional[Mapping[str, float]] = None,
+            duration: float = 3600.0,
+            sampling_interval: float = 10.0,
+            warm_up_duration: Optional[float] = None,
+            max_rss_growth_per_hour: int = 64 * 1024 ** 2,
+            max_relative_throughput_decrease: float = 0.2,
+            collect_garbage_before_sampling: bool = True,
+            random_seed: int = 0
+    ) -> None:
+        """
+        The constructor method of the class. The workloads are called in the current process in a weighted random
+        order on the cycled items for a fixed duration, while the throughput and the resident set size of the process
+        are sampled at regular intervals.
+
+        :parameter workloads: The functions of the workloads per workload name, which are called with a single item.
+        :parameter items: The items of the corpus.
+        :parameter workload_weights: The relative weights of the workloads per workload name. The value `None`
+            indicates that all workloads should be called equally often. The workloads with the weight `0` are not
+            called.
+        :parameter duration: The duration of the soak test in seconds.
+        :parameter sampling_interval: The interval in seconds at which the throughput and the resident set size are
+            sampled.
+        :parameter warm_up_duration: The initial duration in seconds whose samples are ignored in the detection of the
+            leaks and regressions. The value `None` indicates that a tenth of the duration should be utilized.
+        :parameter max_rss_growth_per_hour: The maximum growth of the resident set size in bytes per hour, above which
+            a leak is suspected.
+        :parameter max_relative_throughput_decrease: The maximum relative decrease of the throughput from the start to
+            the end of the soak test, above which a regression is suspected.
+        :parameter collect_garbage_before_sampling: The indicator of whether the garbage should be collected before the
+            resident set size is sampled, which excludes the uncollected reference cycles from the leaks.
+        :parameter random_seed: The seed of the weighted random order of the workloads.
+        """
+
+        if workload_weights is None:
+            workload_weights = {workload_name: 1.0 for workload_name in workloads.keys()}
+
+        if any(workload_name not in workloads.keys() for workload_name in workload_weights.keys()):
+            raise ValueError(
+                "The workload weight names should be one of {workload_names}.".format(
+                    workload_names=tuple(workloads.keys())
+                )
+            )
+
+        if sum(workload_weights.values()) <= 0.0 or any(
+            workload_weight < 0.0 for workload_weight in workload_weights.values()
+        ):
+            raise ValueError(
+                "The workload weights should be non-negative and at least one should be positive."
+            )
+
+        if len(items) == 0:
+            raise ValueError(
+                "The corpus should contain at least one item."
+            )
+
+        if sampling_interval <= 0.0 or duration < sampling_interval:
+            raise ValueError(
+                "The sampling interval should be positive and not longer than the duration."
+            )
+
+        self.workloads = dict(workloads)
+        self.items = items
+        self.workload_weights = dict(workload_weights)
+        self.duration = duration
+        self.sampling_interval = sampling_interval
+        self.warm_up_duration = 0.1 * duration if warm_up_duration is None else warm_up_duration
+        self.max_rss_growth_per_hour = max_rss_growth_per_hour
+        self.max_relative_throughput_decrease = max_relative_throughput_decrease
+        self.collect_garbage_before_sampling = collect_garbage_before_sampling
+        self.random_seed = random_seed
+
+    def _get_workload_schedule(
+            self,
+            schedule_length: int = 4096
+    ) -> List[str]:
+        """
+        Get the weighted random schedule of the workload names, which is cycled during the soak test. The schedule is
+        drawn in advance to keep the random number generation out of the measurements.
+
+        :parameter schedule_length: The number of workload calls in the schedule.
+
+        :returns: The weighted random schedule of the workload names.
+        """
+
+        workload_names = [
+            workload_name for workload_name, workload_weight in self.workload_weights.items() if workload_weight > 0.0
+        ]
+
+        return Random(self.random_seed).choices(
+            population=workload_names,
+            weights=[self.workload_weights[workload_name] for workload_name in workload_names],
+            k=schedule_length
+        )
+
+    def _sample_rss(
+            self
+    ) -> Optional[int]:
+        """
+        Sample the resident set size of the current process.
+
+        :returns: The resident set size of the current process in bytes, or the value `None` if it is not available.
+        """
+
+        if self.collect_garbage_before_sampling:
+            collect()
+
+        return get_process_rss(
+            process_id=getpid()
+        )
+
+    def _analyze_samples(
+            self,
+            samples: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Analyze the samples after the warm-up for the growth of the resident set size and the decrease of the
+        throughput.
+
+        :parameter samples: The samples of the soak test.
+
+        :returns: The growth of the resident set size in bytes per hour, the relative decrease of the throughput and
+            the indicators of whether a leak or a regression is suspected. The values `None` indicate that there are
+            not enough samples after the warm-up for the analysis.
+        """
+
+        samples = [
+            sample for sample in samples
+            if sample["elapsed_time"] >= self.warm_up_duration and sample["rss"] is not None
+        ]
+
+        if len(samples) < 3:
+            return {
+                "rss_growth_per_hour": None,
+                "relative_throughput_decrease": None,
+                "is_leak_suspected": None,
+                "is_regression_suspected": None,
+            }
+
+        # The slope of the least squares line is less sensitive to the allocator noise than the difference of the first
+        # and last samples.
+        rss_growth_per_hour = 3600.0 * float(polyfit(
+            array([sample["elapsed_time"] for sample in samples], dtype=float64),
+            array([sample["rss"] for sample in samples], dtype=float64),
+            deg=1
+        )[0])
+
+        window_size = max(len(samples) // 3, 1)
+
+        start_throughput = sum(sample["throughput"] for sample in samples[:window_size]) / window_size
+        end_throughput = sum(sample["throughput"] for sample in samples[-window_size:]) / window_size
+
+        relative_throughput_decrease = 1.0 - end_throughput / start_throughput if start_throughput > 0.0 else 0.0
+
+        return {
+            "rss_growth_per_hour": rss_growth_per_hour,
+            "relative_throughput_decrease": relative_throughput_decrease,
+            "is_leak_suspected": rss_growth_per_hour > self.max_rss_growth_per_hour,
+            "is_regression_suspected": relative_throughput_decrease > self.max_relative_throughput_decrease,
+        }
+
+    def run(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Run the soak test.
+
+        :returns: The report of the soak test with the samples of the elapsed time, resident set size, throughput and
+            numbers of calls per workload, the total numbers of calls and errors per workload, the growth of the
+            resident set size in bytes per hour, the relative decrease of the throughput and the indicators of whether
+            a leak or a regression is suspected.
+        """
+
+        workloads = self.workloads
+        workload_schedule = cycle(self._get_workload_schedule())
+        items = cycle(self.items)
+
+        number_of_calls = {workload_name: 0 for workload_name in workloads.keys()}
+        number_of_errors = {workload_name: 0 for workload_name in workloads.keys()}
+
+        samples = list()
+
+        initial_rss = self._sample_rss()
+
+        start_time = perf_counter()
+        end_time = start_time + self.duration
+
+        sample_start_time = start_time
+        sample_number_of_calls = dict(number_of_calls)
+
+        while True:
+            workload_name = next(workload_schedule)
+
+            try:
+                workloads[workload_name](next(items))
+
+            except Exception:
+                number_of_errors[workload_name] += 1
+
+            number_of_calls[workload_name] += 1
+
+            current_time = perf_counter()
+
+            if current_time - sample_start_time >= self.sampling_interval or current_time >= end_time:
+                samples.append({
+                    "elapsed_time": current_time - start_time,
+                    "rss": self._sample_rss(),
+                    "throughput": sum(
+                        number_of_calls[workload_name] - sample_number_of_calls[workload_name]
+                        for workload_name in workloads.keys()
+                    ) / (current_time - sample_start_time),
+                    "number_of_calls": {
+                        workload_name: number_of_calls[workload_name] - sample_number_of_calls[workload_name]
+                        for workload_name in workloads.keys()
+                    },
+                })
+
+                if current_time >= end_time:
+                    break
+
+                # The sampling time, including the garbage collection, is excluded from the throughput of the next
+                # sample.
+                sample_start_time = perf_counter()
+                sample_number_of_calls = dict(number_of_calls)
+
+        return {
+            "duration": samples[-1]["elapsed_time"],
+            "initial_rss": initial_rss,
+            "final_rss": samples[-1]["rss"],
+            "number_of_calls": number_of_calls,
+            "number_of_errors": number_of_errors,
+            "samples": samples,
+            **self._analyze_samples(
+                samples=samples
+            ),
+        }
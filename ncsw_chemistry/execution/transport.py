@@ -0,0 +1,568 @@
+""" The ``ncsw_chemistry.execution`` package ``transport`` module. """
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pickle import dumps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from numpy import cumsum, frombuffer, int64, zeros
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdChemReactions import ChemicalReaction
+
+from ncsw_chemistry.execution.parallel import iterate_chunks
+
+
+class SharedMolArena:
+    """ The shared memory arena of RDKit Mol and ChemicalReaction objects class. """
+
+    _header = b"NSMA\x01\x00\x00\x00"
+
+    _item_classes = (None, Mol, ChemicalReaction, )
+
+    def __init__(
+            self,
+            shared_memory: SharedMemory,
+            is_owner: bool = False
+    ) -> None:
+        """
+        The constructor method of the class. The shared memory block consists of the header, the number of items, the
+        offsets of the RDKit binary representations of the items, the kinds of the items and the concatenated RDKit
+        binary representations of the items.
+
+        :parameter shared_memory: The shared memory block of the arena.
+        :parameter is_owner: The indicator of whether the arena is responsible for the removal of the shared memory
+            block.
+        """
+
+        if bytes(shared_memory.buf[:len(self._header)]) != self._header:
+            raise ValueError(
+                "The shared memory block '{name}' does not contain a shared memory arena.".format(
+                    name=shared_memory.name
+                )
+            )
+
+        self.shared_memory = shared_memory
+        self.is_owner = is_owner
+
+        number_of_items = int(frombuffer(shared_memory.buf, dtype="<i8", count=1, offset=len(self._header))[0])
+
+        offset_table_start = len(self._header) + 8
+
+        # The offset table and item kinds are converted to lists once, as the per-item access to NumPy scalars is slow.
+        self._item_offsets = frombuffer(
+            shared_memory.buf,
+            dtype="<i8",
+            count=number_of_items + 1,
+            offset=offset_table_start
+        ).tolist()
+
+        self._item_kinds = bytes(shared_memory.buf[
+            offset_table_start + 8 * (number_of_items + 1):offset_table_start + 8 * (number_of_items + 1) +
+            number_of_items
+        ])
+
+        self._item_data_start = offset_table_start + 8 * (number_of_items + 1) + -(-number_of_items // 8) * 8
+
+    def __enter__(
+            self
+    ) -> "SharedMolArena":
+        """
+        Enter the runtime context of the arena.
+
+        :returns: The shared memory arena.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the arena, close it and remove the shared memory block if owned. """
+
+        self.close()
+
+        if self.is_owner:
+            self.unlink()
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of items in the arena.
+
+        :returns: The number of items in the arena.
+        """
+
+        return len(self._item_kinds)
+
+    def __getitem__(
+            self,
+            item_index: int
+    ) -> Optional[Union[Mol, ChemicalReaction]]:
+        """
+        Decode an item of the arena, which is the only item that is copied out of the shared memory block.
+
+        :parameter item_index: The index of the item.
+
+        :returns: The RDKit Mol or ChemicalReaction object of the item, or the value `None` if the item is empty.
+        """
+
+        item_class = self._item_classes[self._item_kinds[item_index]]
+
+        if item_class is None:
+            return None
+
+        return item_class(
+            self.get_item_binary(
+                item_index=item_index
+            )
+        )
+
+    def __iter__(
+            self
+    ) -> Iterator[Optional[Union[Mol, ChemicalReaction]]]:
+        """
+        Iterate over the decoded items of the arena.
+
+        :returns: The iterator over the RDKit Mol or ChemicalReaction objects of the items.
+        """
+
+        for item_index in range(len(self)):
+            yield self[item_index]
+
+    def __reduce__(
+            self
+    ) -> Tuple:
+        """
+        Get the pickling instructions, which transfer only the name of the shared memory block.
+
+        :returns: The pickling instructions.
+        """
+
+        return self.__class__.attach, (self.shared_memory.name, )
+
+    @property
+    def name(
+            self
+    ) -> str:
+        """
+        Get the name of the shared memory block of the arena.
+
+        :returns: The name of the shared memory block of the arena.
+        """
+
+        return self.shared_memory.name
+
+    @property
+    def nbytes(
+            self
+    ) -> int:
+        """
+        Get the number of bytes of the arena.
+
+        :returns: The number of bytes of the arena.
+        """
+
+        return self._item_data_start + self._item_offsets[-1]
+
+    @classmethod
+    def from_items(
+            cls,
+            items: Iterable[Any]
+    ) -> "SharedMolArena":
+        """
+        Construct the arena from the RDKit Mol and ChemicalReaction objects in a new shared memory block, which is owned
+        by the arena.
+
+        :parameter items: The RDKit Mol or ChemicalReaction objects. The items of other types, such as the value `None`,
+            are stored as empty items.
+
+        :returns: The shared memory arena.
+        """
+
+        item_kinds, item_binaries = list(), list()
+
+        for item in items:
+            if isinstance(item, Mol):
+                item_kinds.append(1)
+                item_binaries.append(item.ToBinary())
+
+            elif isinstance(item, ChemicalReaction):
+                item_kinds.append(2)
+                item_binaries.append(item.ToBinary())
+
+            else:
+                item_kinds.append(0)
+                item_binaries.append(b"")
+
+        number_of_items = len(item_kinds)
+
+        item_offsets = zeros(
+            shape=number_of_items + 1,
+            dtype="<i8"
+        )
+
+        item_offsets[1:] = cumsum([len(item_binary) for item_binary in item_binaries], dtype=int64)
+
+        offset_table_start = len(cls._header) + 8
+        item_data_start = offset_table_start + 8 * (number_of_items + 1) + -(-number_of_items // 8) * 8
+
+        shared_memory = SharedMemory(
+            create=True,
+            size=max(item_data_start + int(item_offsets[-1]), 1)
+        )
+
+        shared_memory.buf[:len(cls._header)] = cls._header
+        shared_memory.buf[len(cls._header):offset_table_start] = number_of_items.to_bytes(8, byteorder="little")
+        shared_memory.buf[offset_table_start:offset_table_start + 8 * (number_of_items + 1)] = item_offsets.tobytes()
+
+        shared_memory.buf[
+            offset_table_start + 8 * (number_of_items + 1):offset_table_start + 8 * (number_of_items + 1) +
+            number_of_items
+        ] = bytes(item_kinds)
+
+        shared_memory.buf[item_data_start:item_data_start + int(item_offsets[-1])] = b"".join(item_binaries)
+
+        return cls(
+            shared_memory=shared_memory,
+            is_owner=True
+        )
+
+    @classmethod
+    def attach(
+            cls,
+            name: str,
+            is_owner: bool = False
+    ) -> "SharedMolArena":
+        """
+        Attach to the arena in an existing shared memory block, for example, in a worker process. The shared memory
+        block is registered in the resource tracker of the current process, which is why the attaching process should
+        become the owner of the block once the previous owner releases it.
+
+        :parameter name: The name of the shared memory block of the arena.
+        :parameter is_owner: The indicator of whether the arena is responsible for the removal of the shared memory
+            block.
+
+        :returns: The shared memory arena.
+        """
+
+        return cls(
+            shared_memory=SharedMemory(
+                name=name
+            ),
+            is_owner=is_owner
+        )
+
+    def get_item_binary(
+            self,
+            item_index: int
+    ) -> bytes:
+        """
+        Get the RDKit binary representation of an item of the arena.
+
+        :parameter item_index: The index of the item.
+
+        :returns: The RDKit binary representation of the item.
+        """
+
+        return bytes(self.shared_memory.buf[
+            self._item_data_start + self._item_offsets[item_index]:
+            self._item_data_start + self._item_offsets[item_index + 1]
+        ])
+
+    def close(
+            self
+    ) -> None:
+        """ Close the access to the shared memory block of the arena. """
+
+        self.shared_memory.close()
+
+    def unlink(
+            self
+    ) -> None:
+        """ Remove the shared memory block of the arena, which should be called once by the owner. """
+
+        self.shared_memory.unlink()
+
+    def release_ownership(
+            self
+    ) -> None:
+        """
+        Release the ownership of the shared memory block of the arena to the process that attaches to it next. The
+        shared memory block is unregistered from the resource tracker of the current process, which would otherwise
+        remove it at the shutdown or warn about it once it is removed by the other process.
+        """
+
+        resource_tracker.unregister(self.shared_memory._name, "shared_memory")
+
+        self.is_owner = False
+
+
+def _remove_shared_mol_arena(
+        name: str
+) -> None:
+    """
+    Remove the released shared memory arena of a chunk that is not consumed by any process, if it still exists.
+
+    :parameter name: The name of the shared memory block of the arena.
+    """
+
+    try:
+        with SharedMolArena.attach(
+            name=name,
+            is_owner=True
+        ):
+            pass
+
+    except FileNotFoundError:
+        pass
+
+
+def _map_shared_mol_arena(
+        mol_arena: Union[SharedMolArena, List[Any]],
+        item_function: Callable[[Any], Any],
+        pack_results: bool
+) -> Union[SharedMolArena, List[Any]]:
+    """
+    Apply a function on the items of a shared memory arena or a list in a worker process.
+
+    :parameter mol_arena: The shared memory arena of the items, or the list of the items.
+    :parameter item_function: The function that processes an item.
+    :parameter pack_results: The indicator of whether the results should be returned in a shared memory arena.
+
+    :returns: The shared memory arena of the results, or the list of the results.
+    """
+
+    if isinstance(mol_arena, SharedMolArena):
+        # The input arena is owned by the worker process once it is received, which is why it is removed once the items
+        # are processed, even if the processing fails.
+        mol_arena.is_owner = True
+
+        with mol_arena:
+            results = [item_function(item) for item in mol_arena]
+
+    else:
+        results = [item_function(item) for item in mol_arena]
+
+    if not pack_results:
+        return results
+
+    result_arena = SharedMolArena.from_items(
+        items=results
+    )
+
+    # The result arena is owned by the process that receives it, which is why only the local memory map is closed.
+    result_arena.release_ownership()
+    result_arena.close()
+
+    return result_arena
+
+
+def map_in_chunks_using_shared_memory(
+        item_function: Callable[[Any], Any],
+        items: Iterable[Any],
+        chunk_size: int = 10000,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        pack_items: bool = True,
+        pack_results: bool = True,
+        decode_results: bool = True
+) -> Iterator[Union[List[Any], SharedMolArena]]:
+    """
+    Apply a function on consecutive chunks of RDKit Mol or ChemicalReaction objects in worker processes, which receive
+    and return the objects in the RDKit binary representation in shared memory arenas instead of pickling them. Only a
+    bounded number of chunks is submitted at once and the order of the chunks is preserved.
+
+    :parameter item_function: The picklable function that processes an item.
+    :parameter items: The items.
+    :parameter chunk_size: The maximum number of items per chunk.
+    :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates that
+        the number of processors should be utilized unless an executor is specified.
+    :parameter executor: The process pool executor that processes the chunks. The value `None` indicates that a
+        process pool managed by the function should be utilized.
+    :parameter pack_items: The indicator of whether the items are RDKit Mol or ChemicalReaction objects that should be
+        transferred in shared memory arenas.
+    :parameter pack_results: The indicator of whether the results are RDKit Mol or ChemicalReaction objects that should
+        be transferred in shared memory arenas.
+    :parameter decode_results: The indicator of whether the packed results should be decoded. If not, the shared memory
+        arenas of the results are returned for the lazy decoding and should be removed by the caller.
+
+    :returns: The iterator over the results of the chunks in the order of the chunks.
+    """
+
+    is_executor_managed = executor is None
+
+    if is_executor_managed:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers
+        )
+
+    max_number_of_pending_chunks = 2 * (max_workers or getattr(executor, "_max_workers", 1))
+
+    chunk_function = partial(
+        _map_shared_mol_arena,
+        item_function=item_function,
+        pack_results=pack_results
+    )
+
+    def get_chunk_results(
+            chunk_result: Union[SharedMolArena, List[Any]]
+    ) -> Union[List[Any], SharedMolArena]:
+        if not pack_results:
+            return chunk_result
+
+        # The result arena is created by the worker process and owned by the current process once it is received.
+        chunk_result.is_owner = True
+
+        if not decode_results:
+            return chunk_result
+
+        with chunk_result:
+            return list(chunk_result)
+
+    # The pending chunks are stored with the names of their input arenas, which are removed if the chunks are not
+    # processed.
+    pending_chunk_futures = deque()
+
+    try:
+        for chunk in iterate_chunks(
+            items=items,
+            chunk_size=chunk_size
+        ):
+            if len(pending_chunk_futures) >= max_number_of_pending_chunks:
+                yield get_chunk_results(pending_chunk_futures.popleft()[0].result())
+
+            if pack_items:
+                chunk_arena = SharedMolArena.from_items(
+                    items=chunk
+                )
+
+                # The worker process owns and removes the input arena, which is why it is released before the
+                # submission and only the local memory map is closed.
+                chunk_arena.release_ownership()
+
+                pending_chunk_futures.append((
+                    executor.submit(chunk_function, chunk_arena),
+                    chunk_arena.name,
+                ))
+
+                chunk_arena.close()
+
+            else:
+                pending_chunk_futures.append((
+                    executor.submit(chunk_function, chunk),
+                    None,
+                ))
+
+        while len(pending_chunk_futures) > 0:
+            yield get_chunk_results(pending_chunk_futures.popleft()[0].result())
+
+    finally:
+        # If the iteration is stopped early, the input arenas of the cancelled chunks and the result arenas of the
+        # processed chunks are removed, as they are not consumed anymore.
+        for pending_chunk_future, chunk_arena_name in pending_chunk_futures:
+            if pending_chunk_future.cancel() or pending_chunk_future.exception() is not None:
+                if chunk_arena_name is not None:
+                    _remove_shared_mol_arena(
+                        name=chunk_arena_name
+                    )
+
+            elif pack_results:
+                chunk_result = pending_chunk_future.result()
+
+                chunk_result.close()
+                chunk_result.unlink()
+
+        if is_executor_managed:
+            executor.shutdown(
+                cancel_futures=True
+            )
+
+
+def _get_same_item(
+        item: Any
+) -> Any:
+    """
+    Get the same item, which measures the transport overhead only.
+
+    :parameter item: The item.
+
+    :returns: The same item.
+    """
+
+    return item
+
+
+def benchmark_shared_memory_transport(
+        compound_mols: Sequence[Mol],
+        chunk_size: int = 10000,
+        max_workers: Optional[int] = None,
+        number_of_repeats: int = 3
+) -> Dict[str, float]:
+    """
+    Benchmark the round trip of RDKit Mol objects to worker processes and back using the shared memory arenas against
+    the plain pickling of the RDKit Mol objects.
+
+    :parameter compound_mols: The RDKit Mol objects of the chemical compounds.
+    :parameter chunk_size: The maximum number of RDKit Mol objects per chunk.
+    :parameter max_workers: The number of worker processes. The value `None` indicates that the number of processors
+        should be utilized.
+    :parameter number_of_repeats: The number of repeats, of which the fastest is reported.
+
+    :returns: The fastest round trip times in seconds, the numbers of transferred bytes per RDKit Mol object of both
+        approaches and the speedup of the shared memory arenas.
+    """
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers
+    ) as process_pool_executor:
+        # The worker processes are started before the measurements.
+        list(process_pool_executor.map(_get_same_item, range(process_pool_executor._max_workers)))
+
+        pickling_times, shared_memory_times = list(), list()
+
+        for _ in range(number_of_repeats):
+            start_time = perf_counter()
+
+            list(process_pool_executor.map(
+                partial(
+                    _map_shared_mol_arena,
+                    item_function=_get_same_item,
+                    pack_results=False
+                ),
+                iterate_chunks(
+                    items=compound_mols,
+                    chunk_size=chunk_size
+                )
+            ))
+
+            pickling_times.append(perf_counter() - start_time)
+
+            start_time = perf_counter()
+
+            list(map_in_chunks_using_shared_memory(
+                item_function=_get_same_item,
+                items=compound_mols,
+                chunk_size=chunk_size,
+                executor=process_pool_executor
+            ))
+
+            shared_memory_times.append(perf_counter() - start_time)
+
+    number_of_compound_mols = max(len(compound_mols), 1)
+
+    return {
+        "pickling_time": min(pickling_times),
+        "shared_memory_time": min(shared_memory_times),
+        "pickling_bytes_per_mol": len(dumps(list(compound_mols))) / number_of_compound_mols,
+        "shared_memory_bytes_per_mol": sum(
+            len(compound_mol.ToBinary()) for compound_mol in compound_mols
+        ) / number_of_compound_mols,
+        "speedup": min(pickling_times) / max(min(shared_memory_times), 1e-9),
+    }
@@ -0,0 +1,96 @@
+""" The ``ncsw_chemistry.execution`` package ``worker`` module. """
+
+from collections import OrderedDict
+from os import sysconf
+from pickle import dumps
+from threading import local
+from typing import Optional
+
+from rdchiral.main import rdchiralReaction
+
+
+# The compiled chemical reaction retro templates are stateful, which is why they are cached per worker thread.
+_worker_state = local()
+
+worker_retro_template_cache_size = 1024
+
+
+def get_picklable_exception(
+        exception: Exception
+) -> Exception:
+    """
+    Get a picklable version of an exception, which is required to return the exception from a worker process.
+
+    :parameter exception: The exception.
+
+    :returns: The exception itself if it is picklable, or a runtime error with the same description otherwise.
+    """
+
+    try:
+        dumps(exception)
+
+        return exception
+
+    except Exception:
+        return RuntimeError(
+            "{exception_name}: {exception}".format(
+                exception_name=type(exception).__name__,
+                exception=exception
+            )
+        )
+
+
+def get_cached_rdchiral_reaction(
+        retro_template_smarts: str
+) -> rdchiralReaction:
+    """
+    Get the compiled RDChiral reaction of a chemical reaction retro template from the least recently used cache of the
+    current worker thread, which holds up to ``worker_retro_template_cache_size`` chemical reaction retro templates.
+
+    :parameter retro_template_smarts: The chemical reaction retro template SMARTS string.
+
+    :returns: The compiled RDChiral reaction of the chemical reaction retro template.
+    """
+
+    if not hasattr(_worker_state, "retro_template_rxns"):
+        _worker_state.retro_template_rxns = OrderedDict()
+
+    worker_retro_template_rxns = _worker_state.retro_template_rxns
+
+    if retro_template_smarts in worker_retro_template_rxns.keys():
+        worker_retro_template_rxns.move_to_end(
+            retro_template_smarts
+        )
+
+    else:
+        worker_retro_template_rxns[retro_template_smarts] = rdchiralReaction(
+            reaction_smarts=retro_template_smarts
+        )
+
+        if len(worker_retro_template_rxns) > worker_retro_template_cache_size:
+            worker_retro_template_rxns.popitem(
+                last=False
+            )
+
+    return worker_retro_template_rxns[retro_template_smarts]
+
+
+def get_process_rss(
+        process_id: int
+) -> Optional[int]:
+    """
+    Get the resident set size of a process from the ``/proc`` file system.
+
+    :parameter process_id: The ID of the process.
+
+    :returns: The resident set size of the process in bytes, or the value `None` if it is not available.
+    """
+
+    try:
+        with open("/proc/{process_id}/statm".format(
+            process_id=process_id
+        )) as file_handle:
+            return int(file_handle.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+
+    except (OSError, ValueError, IndexError):
+        return None
@@ -1,9 +1,51 @@
 """ The ``ncsw_chemistry.reaction.utility`` package initialization module. """
 
+from ncsw_chemistry.reaction.utility.applicability import (
+    ReactionCenterEnvironmentIndex,
+    ReactionTemplateApplicabilityIndex,
+)
+
+from ncsw_chemistry.reaction.utility.batch import (
+    ReactionBatchSanitizationResult,
+    ReactionBatchUtility,
+)
+
+from ncsw_chemistry.reaction.utility.caching import (
+    ReactionRetroTemplateCache,
+    ReactionStandardizationCache,
+)
+
 from ncsw_chemistry.reaction.utility.compound import ReactionCompoundUtility
 
+from ncsw_chemistry.reaction.utility.editing import ReactionGraphEditUtility
+
+from ncsw_chemistry.reaction.utility.enumeration import ReactionEnumerationUtility
+
 from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
 
+from ncsw_chemistry.reaction.utility.hierarchy import ReactionTemplateHierarchy
+
+from ncsw_chemistry.reaction.utility.mapping import ReactionAtomMapIndex
+
+from ncsw_chemistry.reaction.utility.mining import ReactionCenterPatternCounter
+
 from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
 
+from ncsw_chemistry.reaction.utility.retrosynthesis import (
+    ReactionRetrosynthesisExpander,
+    ReactionRetrosynthesisExpansionEngine,
+    ReactionRetrosynthesisSearchResult,
+)
+
+from ncsw_chemistry.reaction.utility.similarity import ReactionCenterSimilarityIndex
+
+from ncsw_chemistry.reaction.utility.soaking import ReactionSoakTestUtility
+
 from ncsw_chemistry.reaction.utility.standardization import ReactionStandardizationUtility
+
+from ncsw_chemistry.reaction.utility.synthon import (
+    ReactionReactiveSitesAndSynthons,
+    ReactionReactiveSitesAndSynthonsBatch,
+)
+
+from ncsw_chemistry.reaction.utility.typing_ import ReactionRetrosynthesisExpansionTuple
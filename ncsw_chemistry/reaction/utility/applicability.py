@@ -0,0 +1,698 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``applicability`` module. """
+
+from collections import Counter
+from json import dump, load
+from os import makedirs
+from os.path import join
+from re import sub
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from numpy import any as np_any, array, asarray, bool_, concatenate, cumsum, flatnonzero, fromiter, int64, isin, ndarray
+from numpy import load as np_load, packbits, save, uint8, uint64, zeros
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdmolops import PatternFingerprint
+
+from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
+from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
+
+
+class ReactionTemplateApplicabilityIndex:
+    """ The chemical reaction template applicability index class. """
+
+    element_atomic_numbers = (3, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 19, 29, 30, 34, 35, 46, 50, 53, )
+
+    element_count_thresholds = (1, 2, 3, 4, 5, 6, 8, 10, )
+
+    number_of_structural_features = 3
+
+    def __init__(
+            self,
+            retro_template_bit_matrix: ndarray,
+            pattern_fingerprint_size: int = 2048
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter retro_template_bit_matrix: The packed bit matrix of the chemical reaction retro template required
+            features, where each row corresponds to a chemical reaction retro template.
+        :parameter pattern_fingerprint_size: The size of the pattern fingerprints utilized in the required features.
+        """
+
+        self.retro_template_bit_matrix = retro_template_bit_matrix
+        self.pattern_fingerprint_size = pattern_fingerprint_size
+
+    @staticmethod
+    def _pack_feature_vector(
+            feature_vector: ndarray
+    ) -> ndarray:
+        """
+        Pack a boolean feature vector into an array of unsigned 64-bit integers.
+
+        :parameter feature_vector: The boolean feature vector.
+
+        :returns: The packed feature vector.
+        """
+
+        packed_feature_vector = zeros(
+            shape=-(-len(feature_vector) // 64) * 8,
+            dtype=uint8
+        )
+
+        packed_feature_vector[:-(-len(feature_vector) // 8)] = packbits(
+            feature_vector
+        )
+
+        return packed_feature_vector.view(uint64)
+
+    @staticmethod
+    def get_feature_vector(
+            compound_mols: Iterable[Mol],
+            pattern_fingerprint_size: int = 2048,
+            is_query: bool = False
+    ) -> ndarray:
+        """
+        Get the packed feature vector of chemical compounds or chemical compound patterns.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compounds or chemical compound patterns.
+        :parameter pattern_fingerprint_size: The size of the pattern fingerprints.
+        :parameter is_query: The indicator of whether the RDKit Mol objects are chemical compound patterns. If so, only
+            the atoms and bonds with unambiguous queries contribute to the element count and structural features.
+
+        :returns: The packed feature vector of the chemical compounds or chemical compound patterns.
+        """
+
+        element_atomic_numbers = ReactionTemplateApplicabilityIndex.element_atomic_numbers
+        element_count_thresholds = ReactionTemplateApplicabilityIndex.element_count_thresholds
+        number_of_element_count_features = len(element_atomic_numbers) * len(element_count_thresholds)
+        structural_feature_offset = number_of_element_count_features
+        pattern_fingerprint_offset = (
+            structural_feature_offset + ReactionTemplateApplicabilityIndex.number_of_structural_features
+        )
+
+        feature_vector = zeros(
+            shape=pattern_fingerprint_offset + pattern_fingerprint_size,
+            dtype=bool_
+        )
+
+        element_counts = dict.fromkeys(element_atomic_numbers, 0)
+
+        for compound_mol in compound_mols:
+            if is_query:
+                compound_mol.UpdatePropertyCache(
+                    strict=False
+                )
+
+            for atom in compound_mol.GetAtoms():
+                if is_query and any(
+                    query_character in atom.GetSmarts()
+                    for query_character in (",", "!", "$", )
+                ):
+                    continue
+
+                if atom.GetAtomicNum() in element_counts.keys():
+                    element_counts[atom.GetAtomicNum()] += 1
+
+                if atom.GetIsAromatic():
+                    feature_vector[structural_feature_offset] = True
+
+            for bond in compound_mol.GetBonds():
+                bond_smarts = bond.GetSmarts() if is_query else None
+
+                if (bond.GetIsAromatic() and not is_query) or bond_smarts == ":":
+                    feature_vector[structural_feature_offset + 1] = True
+
+                if (bond.IsInRing() and not is_query) or bond_smarts == "@":
+                    feature_vector[structural_feature_offset + 2] = True
+
+            for on_bit in PatternFingerprint(
+                compound_mol,
+                fpSize=pattern_fingerprint_size
+            ).GetOnBits():
+                feature_vector[pattern_fingerprint_offset + on_bit] = True
+
+        for element_index, element_atomic_number in enumerate(element_atomic_numbers):
+            for element_count_threshold_index, element_count_threshold in enumerate(element_count_thresholds):
+                if element_counts[element_atomic_number] >= element_count_threshold:
+                    feature_vector[
+                        element_index * len(element_count_thresholds) + element_count_threshold_index
+                    ] = True
+
+        return ReactionTemplateApplicabilityIndex._pack_feature_vector(
+            feature_vector=feature_vector
+        )
+
+    @staticmethod
+    def get_retro_template_feature_vector(
+            retro_template_smarts: str,
+            pattern_fingerprint_size: int = 2048
+    ) -> Optional[ndarray]:
+        """
+        Get the packed required feature vector of the product side of a chemical reaction retro template.
+
+        :parameter retro_template_smarts: The chemical reaction retro template SMARTS string.
+        :parameter pattern_fingerprint_size: The size of the pattern fingerprints.
+
+        :returns: The packed required feature vector of the chemical reaction retro template, or `None` if the chemical
+            reaction retro template cannot be parsed.
+        """
+
+        try:
+            retro_template_rxn = ReactionFormattingUtility.convert_reaction_smarts_to_rxn(
+                reaction_smarts=retro_template_smarts
+            )
+
+        except ValueError:
+            return None
+
+        if retro_template_rxn is None:
+            return None
+
+        return ReactionTemplateApplicabilityIndex.get_feature_vector(
+            compound_mols=retro_template_rxn.GetReactants(),
+            pattern_fingerprint_size=pattern_fingerprint_size,
+            is_query=True
+        )
+
+    @classmethod
+    def from_retro_templates(
+            cls,
+            retro_template_smarts_strings: Sequence[str],
+            pattern_fingerprint_size: int = 2048
+    ) -> "ReactionTemplateApplicabilityIndex":
+        """
+        Construct the index from a library of chemical reaction retro templates.
+
+        :parameter retro_template_smarts_strings: The chemical reaction retro template SMARTS strings. The position of
+            each chemical reaction retro template is utilized as its ID.
+        :parameter pattern_fingerprint_size: The size of the pattern fingerprints.
+
+        :returns: The chemical reaction template applicability index.
+        """
+
+        retro_template_bit_matrix = zeros(
+            shape=(
+                len(retro_template_smarts_strings),
+                len(cls.get_feature_vector(
+                    compound_mols=(),
+                    pattern_fingerprint_size=pattern_fingerprint_size
+                )),
+            ),
+            dtype=uint64
+        )
+
+        for retro_template_index, retro_template_smarts in enumerate(retro_template_smarts_strings):
+            retro_template_feature_vector = cls.get_retro_template_feature_vector(
+                retro_template_smarts=retro_template_smarts,
+                pattern_fingerprint_size=pattern_fingerprint_size
+            )
+
+            # The unparsable chemical reaction retro templates require all features and never become candidates.
+            if retro_template_feature_vector is None:
+                retro_template_bit_matrix[retro_template_index] = ~uint64(0)
+
+            else:
+                retro_template_bit_matrix[retro_template_index] = retro_template_feature_vector
+
+        return cls(
+            retro_template_bit_matrix=retro_template_bit_matrix,
+            pattern_fingerprint_size=pattern_fingerprint_size
+        )
+
+    def get_candidate_retro_template_indices(
+            self,
+            compound_mol: Mol,
+            block_size: int = 65536
+    ) -> ndarray:
+        """
+        Get the indices of the chemical reaction retro templates that could be applicable on a chemical compound.
+
+        :parameter compound_mol: The RDKit Mol object of the sanitized chemical compound.
+        :parameter block_size: The number of chemical reaction retro templates that should be compared at once.
+
+        :returns: The indices of the candidate chemical reaction retro templates.
+        """
+
+        inverted_compound_feature_vector = ~self.get_feature_vector(
+            compound_mols=(compound_mol, ),
+            pattern_fingerprint_size=self.pattern_fingerprint_size
+        )
+
+        candidate_retro_template_index_blocks = [zeros(
+            shape=0,
+            dtype=int64
+        ), ]
+
+        for block_start_index in range(0, len(self.retro_template_bit_matrix), block_size):
+            candidate_retro_template_index_blocks.append(
+                flatnonzero(
+                    ~np_any(
+                        self.retro_template_bit_matrix[
+                            block_start_index:block_start_index + block_size
+                        ] & inverted_compound_feature_vector,
+                        axis=1
+                    )
+                ) + block_start_index
+            )
+
+        return concatenate(
+            candidate_retro_template_index_blocks
+        )
+
+    def save(
+            self,
+            directory_path: str
+    ) -> None:
+        """
+        Save the index to a directory.
+
+        :parameter directory_path: The path to the directory.
+        """
+
+        makedirs(
+            name=directory_path,
+            exist_ok=True
+        )
+
+        save(
+            file=join(directory_path, "retro_template_bit_matrix.npy"),
+            arr=self.retro_template_bit_matrix
+        )
+
+        with open(join(directory_path, "metadata.json"), mode="w") as file_handle:
+            dump(
+                obj={
+                    "element_atomic_numbers": self.element_atomic_numbers,
+                    "element_count_thresholds": self.element_count_thresholds,
+                    "pattern_fingerprint_size": self.pattern_fingerprint_size,
+                },
+                fp=file_handle
+            )
+
+    @classmethod
+    def load(
+            cls,
+            directory_path: str,
+            memory_map: bool = True
+    ) -> "ReactionTemplateApplicabilityIndex":
+        """
+        Load the index from a directory.
+
+        :parameter directory_path: The path to the directory.
+        :parameter memory_map: The indicator of whether the packed bit matrix should be memory-mapped instead of read
+            into memory.
+
+        :returns: The chemical reaction template applicability index.
+        """
+
+        with open(join(directory_path, "metadata.json")) as file_handle:
+            metadata = load(
+                fp=file_handle
+            )
+
+        if (
+            tuple(metadata["element_atomic_numbers"]) != cls.element_atomic_numbers or
+            tuple(metadata["element_count_thresholds"]) != cls.element_count_thresholds
+        ):
+            raise ValueError(
+                "The feature layout of the saved index does not match the feature layout of the current version."
+            )
+
+        return cls(
+            retro_template_bit_matrix=np_load(
+                file=join(directory_path, "retro_template_bit_matrix.npy"),
+                mmap_mode="r" if memory_map else None
+            ),
+            pattern_fingerprint_size=metadata["pattern_fingerprint_size"]
+        )
+
+
+class ReactionCenterEnvironmentIndex:
+    """ The chemical reaction retro template reaction center environment index class. """
+
+    environment_atom_property_keys = ("atomic_number", "is_aromatic", )
+
+    environment_bond_property_keys = ("type", )
+
+    def __init__(
+            self,
+            environment_ids: ndarray,
+            environment_id_offsets: ndarray,
+            retro_template_validity_mask: ndarray
+    ) -> None:
+        """
+        The constructor method of the class. The reaction center environments of a chemical reaction retro template are
+        the bonds of its product side query that are incident to its reaction center atoms and have unambiguous atom
+        and bond queries. A chemical reaction retro template can only be applicable on a chemical compound if each of
+        its reaction center environment IDs occurs in the chemical compound.
+
+        :parameter environment_ids: The concatenated sorted unique 64-bit reaction center environment IDs of the
+            chemical reaction retro templates.
+        :parameter environment_id_offsets: The offsets of the reaction center environment IDs of each chemical reaction
+            retro template, where the IDs of the i-th chemical reaction retro template are delimited by the i-th and
+            (i + 1)-th offsets.
+        :parameter retro_template_validity_mask: The indicators of whether the chemical reaction retro templates could
+            be parsed. The unparsable chemical reaction retro templates never become candidates.
+        """
+
+        self.environment_ids = environment_ids
+        self.environment_id_offsets = environment_id_offsets
+        self.retro_template_validity_mask = retro_template_validity_mask
+
+    @staticmethod
+    def _is_atom_query_unambiguous(
+            atom_smarts: str,
+            atomic_number: int
+    ) -> bool:
+        """
+        Check whether the element and aromaticity of a chemical compound pattern atom are unambiguous.
+
+        :parameter atom_smarts: The SMARTS string of the chemical compound pattern atom.
+        :parameter atomic_number: The atomic number of the chemical compound pattern atom.
+
+        :returns: The indicator of whether the element and aromaticity of the chemical compound pattern atom are
+            unambiguous.
+        """
+
+        return atomic_number != 0 and not any(
+            query_character in atom_smarts
+            for query_character in (",", "!", "$", "#", )
+        )
+
+    @staticmethod
+    def get_bond_environment_id(
+            compound_mol: Mol,
+            bond_atom_indices: Tuple[int, int]
+    ) -> int:
+        """
+        Get the 64-bit ID of a chemical compound bond environment.
+
+        :parameter compound_mol: The RDKit Mol object of the chemical compound or chemical compound pattern.
+        :parameter bond_atom_indices: The indices of the chemical compound bond atoms.
+
+        :returns: The 64-bit ID of the chemical compound bond environment.
+        """
+
+        return CompoundSubstructureUtility.get_substructure_property_id_hash(
+            compound_mol=compound_mol,
+            substructure_atom_indices=bond_atom_indices,
+            substructure_atom_property_keys=ReactionCenterEnvironmentIndex.environment_atom_property_keys,
+            substructure_bond_property_keys=ReactionCenterEnvironmentIndex.environment_bond_property_keys
+        )
+
+    @staticmethod
+    def get_compound_environment_index(
+            compound_mol: Mol
+    ) -> Dict[int, Set[int]]:
+        """
+        Get the inverted index of the bond environments of a chemical compound.
+
+        :parameter compound_mol: The RDKit Mol object of the sanitized chemical compound.
+
+        :returns: The indices of the chemical compound atoms per 64-bit bond environment ID.
+        """
+
+        compound_environment_index = dict()
+
+        for bond in compound_mol.GetBonds():
+            compound_environment_index.setdefault(
+                ReactionCenterEnvironmentIndex.get_bond_environment_id(
+                    compound_mol=compound_mol,
+                    bond_atom_indices=(bond.GetBeginAtomIdx(), bond.GetEndAtomIdx(), )
+                ),
+                set()
+            ).update((
+                bond.GetBeginAtomIdx(),
+                bond.GetEndAtomIdx(),
+            ))
+
+        return compound_environment_index
+
+    @staticmethod
+    def _get_atom_map_number_signatures(
+            compound_mols: Iterable[Mol]
+    ) -> Dict[int, Tuple[str, frozenset]]:
+        """
+        Get the signatures of the mapped chemical compound pattern atoms, which consist of the atom query without the
+        atom map number and the neighboring atom map numbers and bond queries.
+
+        :parameter compound_mols: The RDKit Mol objects of the chemical compound patterns.
+
+        :returns: The signatures of the mapped chemical compound pattern atoms per atom map number.
+        """
+
+        atom_map_number_signatures = dict()
+
+        for compound_mol in compound_mols:
+            for atom in compound_mol.GetAtoms():
+                if atom.GetAtomMapNum() != 0:
+                    atom_map_number_signatures[atom.GetAtomMapNum()] = (
+                        sub(r":\d+\]$", "]", atom.GetSmarts()),
+                        frozenset(Counter(
+                            (bond.GetOtherAtom(atom).GetAtomMapNum(), bond.GetSmarts(), )
+                            for bond in atom.GetBonds()
+                        ).items()),
+                    )
+
+        return atom_map_number_signatures
+
+    @staticmethod
+    def get_retro_template_environment_ids(
+            retro_template_smarts: str
+    ) -> Optional[ndarray]:
+        """
+        Get the reaction center environment IDs of a chemical reaction retro template. The reaction center atoms are
+        the mapped product side atoms whose queries, neighbors or bonds differ from the reactant side.
+
+        :parameter retro_template_smarts: The chemical reaction retro template SMARTS string.
+
+        :returns: The sorted unique 64-bit reaction center environment IDs of the chemical reaction retro template, or
+            `None` if the chemical reaction retro template cannot be parsed.
+        """
+
+        try:
+            retro_template_rxn = ReactionFormattingUtility.convert_reaction_smarts_to_rxn(
+                reaction_smarts=retro_template_smarts
+            )
+
+        except ValueError:
+            return None
+
+        if retro_template_rxn is None:
+            return None
+
+        product_atom_map_number_signatures = ReactionCenterEnvironmentIndex._get_atom_map_number_signatures(
+            compound_mols=retro_template_rxn.GetReactants()
+        )
+
+        reactant_atom_map_number_signatures = ReactionCenterEnvironmentIndex._get_atom_map_number_signatures(
+            compound_mols=retro_template_rxn.GetProducts()
+        )
+
+        environment_ids = set()
+
+        for product_compound_mol in retro_template_rxn.GetReactants():
+            for bond in product_compound_mol.GetBonds():
+                if bond.GetSmarts() not in ("-", "=", "#", ":", ) or not all(
+                    ReactionCenterEnvironmentIndex._is_atom_query_unambiguous(
+                        atom_smarts=bond_atom.GetSmarts(),
+                        atomic_number=bond_atom.GetAtomicNum()
+                    ) for bond_atom in (bond.GetBeginAtom(), bond.GetEndAtom(), )
+                ):
+                    continue
+
+                if any(
+                    bond_atom.GetAtomMapNum() != 0 and product_atom_map_number_signatures[
+                        bond_atom.GetAtomMapNum()
+                    ] != reactant_atom_map_number_signatures.get(bond_atom.GetAtomMapNum(), None)
+                    for bond_atom in (bond.GetBeginAtom(), bond.GetEndAtom(), )
+                ):
+                    environment_ids.add(
+                        ReactionCenterEnvironmentIndex.get_bond_environment_id(
+                            compound_mol=product_compound_mol,
+                            bond_atom_indices=(bond.GetBeginAtomIdx(), bond.GetEndAtomIdx(), )
+                        )
+                    )
+
+        return array(
+            sorted(environment_ids),
+            dtype=uint64
+        )
+
+    @classmethod
+    def from_retro_templates(
+            cls,
+            retro_template_smarts_strings: Sequence[str]
+    ) -> "ReactionCenterEnvironmentIndex":
+        """
+        Construct the index from a library of chemical reaction retro templates.
+
+        :parameter retro_template_smarts_strings: The chemical reaction retro template SMARTS strings. The position of
+            each chemical reaction retro template is utilized as its ID.
+
+        :returns: The chemical reaction retro template reaction center environment index.
+        """
+
+        retro_template_environment_ids = [
+            cls.get_retro_template_environment_ids(
+                retro_template_smarts=retro_template_smarts
+            ) for retro_template_smarts in retro_template_smarts_strings
+        ]
+
+        retro_template_validity_mask = fromiter(
+            (environment_ids is not None for environment_ids in retro_template_environment_ids),
+            dtype=bool_,
+            count=len(retro_template_environment_ids)
+        )
+
+        retro_template_environment_ids = [
+            zeros(
+                shape=0,
+                dtype=uint64
+            ) if environment_ids is None else environment_ids
+            for environment_ids in retro_template_environment_ids
+        ]
+
+        return cls(
+            environment_ids=concatenate([zeros(
+                shape=0,
+                dtype=uint64
+            ), ] + retro_template_environment_ids),
+            environment_id_offsets=concatenate((
+                zeros(
+                    shape=1,
+                    dtype=int64
+                ),
+                cumsum(fromiter(
+                    (len(environment_ids) for environment_ids in retro_template_environment_ids),
+                    dtype=int64,
+                    count=len(retro_template_environment_ids)
+                )),
+            )),
+            retro_template_validity_mask=retro_template_validity_mask
+        )
+
+    def get_candidate_retro_template_indices(
+            self,
+            compound_mol: Optional[Mol] = None,
+            compound_environment_index: Optional[Dict[int, Set[int]]] = None,
+            retro_template_indices: Optional[ndarray] = None
+    ) -> ndarray:
+        """
+        Get the indices of the chemical reaction retro templates whose reaction center environments all occur in a
+        chemical compound.
+
+        :parameter compound_mol: The RDKit Mol object of the sanitized chemical compound. It is utilized only if the
+            inverted index of the bond environments of the chemical compound is not specified.
+        :parameter compound_environment_index: The precomputed inverted index of the bond environments of the chemical
+            compound as returned by the ``get_compound_environment_index`` method.
+        :parameter retro_template_indices: The indices of the chemical reaction retro templates that should be
+            considered, such as the candidates of the ``ReactionTemplateApplicabilityIndex`` class. The value `None`
+            indicates that all chemical reaction retro templates should be considered.
+
+        :returns: The indices of the candidate chemical reaction retro templates.
+        """
+
+        if compound_environment_index is None:
+            compound_environment_index = self.get_compound_environment_index(
+                compound_mol=compound_mol
+            )
+
+        cumulative_number_of_occurring_environment_ids = concatenate((
+            zeros(
+                shape=1,
+                dtype=int64
+            ),
+            cumsum(isin(
+                self.environment_ids,
+                fromiter(compound_environment_index.keys(), dtype=uint64, count=len(compound_environment_index))
+            ), dtype=int64),
+        ))
+
+        number_of_occurring_environment_ids = (
+            cumulative_number_of_occurring_environment_ids[self.environment_id_offsets[1:]] -
+            cumulative_number_of_occurring_environment_ids[self.environment_id_offsets[:-1]]
+        )
+
+        candidate_retro_template_mask = self.retro_template_validity_mask & (
+            number_of_occurring_environment_ids == self.environment_id_offsets[1:] - self.environment_id_offsets[:-1]
+        )
+
+        if retro_template_indices is None:
+            return flatnonzero(
+                candidate_retro_template_mask
+            )
+
+        retro_template_indices = asarray(retro_template_indices, dtype=int64)
+
+        return retro_template_indices[candidate_retro_template_mask[retro_template_indices]]
+
+    def save(
+            self,
+            directory_path: str
+    ) -> None:
+        """
+        Save the index to a directory.
+
+        :parameter directory_path: The path to the directory.
+        """
+
+        makedirs(
+            name=directory_path,
+            exist_ok=True
+        )
+
+        for array_name in ("environment_ids", "environment_id_offsets", "retro_template_validity_mask", ):
+            save(
+                file=join(directory_path, "{array_name}.npy".format(
+                    array_name=array_name
+                )),
+                arr=getattr(self, array_name)
+            )
+
+        with open(join(directory_path, "metadata.json"), mode="w") as file_handle:
+            dump(
+                obj={
+                    "environment_atom_property_keys": self.environment_atom_property_keys,
+                    "environment_bond_property_keys": self.environment_bond_property_keys,
+                },
+                fp=file_handle
+            )
+
+    @classmethod
+    def load(
+            cls,
+            directory_path: str,
+            memory_map: bool = True
+    ) -> "ReactionCenterEnvironmentIndex":
+        """
+        Load the index from a directory.
+
+        :parameter directory_path: The path to the directory.
+        :parameter memory_map: The indicator of whether the arrays should be memory-mapped instead of read into memory.
+
+        :returns: The chemical reaction retro template reaction center environment index.
+        """
+
+        with open(join(directory_path, "metadata.json")) as file_handle:
+            metadata = load(
+                fp=file_handle
+            )
+
+        if (
+            tuple(metadata["environment_atom_property_keys"]) != cls.environment_atom_property_keys or
+            tuple(metadata["environment_bond_property_keys"]) != cls.environment_bond_property_keys
+        ):
+            raise ValueError(
+                "The environment layout of the saved index does not match the environment layout of the current "
+                "version."
+            )
+
+        return cls(**{
+            array_name: np_load(
+                file=join(directory_path, "{array_name}.npy".format(
+                    array_name=array_name
+                )),
+                mmap_mode="r" if memory_map else None
+            ) for array_name in ("environment_ids", "environment_id_offsets", "retro_template_validity_mask", )
+        })
@@ -0,0 +1,354 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``batch`` module. """
+
+from collections import Counter
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from numpy import concatenate, empty, fromiter, int32, ndarray
+
+from rdkit.Chem.rdChemReactions import ChemicalReaction
+
+from ncsw_chemistry.execution.parallel import map_in_chunks
+from ncsw_chemistry.reaction.utility.standardization import ReactionStandardizationUtility
+
+
+def _sanitize_reaction(
+        reaction: Any,
+        sanitization_operation_keys: Sequence[Tuple[Optional[Collection[str]], Optional[Collection[str]]]],
+        sanitize_reaction_compounds: bool
+) -> Tuple[Optional[ChemicalReaction], int, Optional[str]]:
+    """
+    Sanitize a single chemical reaction in the current or a worker process, and retry the sanitization with the next
+    pair of the chemical reaction and chemical reaction compound sanitization operation keys if it fails.
+
+    :parameter reaction: The RDKit ChemicalReaction object of the chemical reaction.
+    :parameter sanitization_operation_keys: The pairs of the keys of the chemical reaction and chemical reaction
+        compound sanitization operations in the order in which they should be attempted.
+    :parameter sanitize_reaction_compounds: The indicator of whether the chemical reaction compounds should be
+        sanitized.
+
+    :returns: The sanitized chemical reaction or the value `None`, the index of the successful pair of the sanitization
+        operation keys or the value `-1`, and the category of the first error or the value `None`.
+    """
+
+    if not isinstance(reaction, ChemicalReaction):
+        return None, -1, "invalid_input"
+
+    error_category = None
+
+    for sanitization_level, (
+        reaction_sanitization_operation_keys, reaction_compound_sanitization_operation_keys,
+    ) in enumerate(sanitization_operation_keys):
+        sanitization_stage = "reaction"
+
+        try:
+            # The input RDKit ChemicalReaction objects are never modified, which is why each attempt starts from a copy.
+            reaction_rxn = ReactionStandardizationUtility.sanitize_reaction(
+                reaction_rxn=reaction,
+                reaction_sanitization_operation_keys=reaction_sanitization_operation_keys,
+                deep_copy=True
+            )
+
+            if sanitize_reaction_compounds:
+                sanitization_stage = "reaction_compounds"
+
+                ReactionStandardizationUtility.sanitize_reaction_compounds(
+                    reaction_rxn=reaction_rxn,
+                    reaction_compound_sanitization_operation_keys=reaction_compound_sanitization_operation_keys,
+                    deep_copy=False
+                )
+
+            return reaction_rxn, sanitization_level, error_category
+
+        except Exception as exception:
+            if error_category is None:
+                error_category = "{sanitization_stage}:{exception_name}".format(
+                    sanitization_stage=sanitization_stage,
+                    exception_name=type(exception).__name__
+                )
+
+    return None, -1, error_category
+
+
+def _sanitize_reaction_chunk(
+        reactions: List[Any],
+        **kwargs
+) -> List[Tuple[Optional[ChemicalReaction], int, Optional[str]]]:
+    """
+    Sanitize a chunk of chemical reactions in the current or a worker process.
+
+    :parameter reactions: The RDKit ChemicalReaction objects of the chemical reactions.
+    :parameter kwargs: The keyword arguments of the sanitization of each chemical reaction.
+
+    :returns: The sanitized chemical reactions, the indices of the successful pairs of the sanitization operation keys
+        and the categories of the first errors of the chemical reactions.
+    """
+
+    return [
+        _sanitize_reaction(
+            reaction=reaction,
+            **kwargs
+        ) for reaction in reactions
+    ]
+
+
+class ReactionBatchSanitizationResult:
+    """ The chemical reaction batch sanitization result class. """
+
+    def __init__(
+            self,
+            reaction_rxns: ndarray,
+            sanitization_levels: ndarray,
+            error_categories: ndarray
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter reaction_rxns: The NumPy object array of the sanitized chemical reactions, where the chemical
+            reactions that could not be sanitized are set to the value `None`.
+        :parameter sanitization_levels: The 32-bit integer array of the indices of the pairs of the sanitization
+            operation keys with which the chemical reactions were sanitized, where the value `0` indicates the requested
+            sanitization operations, the positive values indicate the fallback sanitization operations and the value
+            `-1` indicates that the chemical reaction could not be sanitized.
+        :parameter error_categories: The NumPy object array of the categories of the first errors of the chemical
+            reactions in the format `{stage}:{exception}` or `invalid_input`, where the chemical reactions without
+            errors are set to the value `None`.
+        """
+
+        self.reaction_rxns = reaction_rxns
+        self.sanitization_levels = sanitization_levels
+        self.error_categories = error_categories
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of chemical reactions in the result.
+
+        :returns: The number of chemical reactions in the result.
+        """
+
+        return len(self.sanitization_levels)
+
+    @classmethod
+    def from_reaction_results(
+            cls,
+            reaction_results: Sequence[Tuple[Optional[ChemicalReaction], int, Optional[str]]]
+    ) -> "ReactionBatchSanitizationResult":
+        """
+        Construct the result from the per chemical reaction results.
+
+        :parameter reaction_results: The sanitized chemical reactions, the indices of the successful pairs of the
+            sanitization operation keys and the categories of the first errors of the chemical reactions.
+
+        :returns: The chemical reaction batch sanitization result.
+        """
+
+        reaction_rxns, error_categories = empty(
+            shape=len(reaction_results),
+            dtype=object
+        ), empty(
+            shape=len(reaction_results),
+            dtype=object
+        )
+
+        reaction_rxns[:] = [reaction_result[0] for reaction_result in reaction_results]
+        error_categories[:] = [reaction_result[2] for reaction_result in reaction_results]
+
+        return cls(
+            reaction_rxns=reaction_rxns,
+            sanitization_levels=fromiter(
+                (reaction_result[1] for reaction_result in reaction_results),
+                dtype=int32,
+                count=len(reaction_results)
+            ),
+            error_categories=error_categories
+        )
+
+    @property
+    def success_mask(
+            self
+    ) -> ndarray:
+        """
+        Get the boolean mask of the chemical reactions that were sanitized with the requested or fallback sanitization
+        operations.
+
+        :returns: The boolean success mask.
+        """
+
+        return self.sanitization_levels >= 0
+
+    @property
+    def fallback_mask(
+            self
+    ) -> ndarray:
+        """
+        Get the boolean mask of the chemical reactions that were sanitized only with the fallback sanitization
+        operations.
+
+        :returns: The boolean fallback mask.
+        """
+
+        return self.sanitization_levels > 0
+
+    def get_error_category_counts(
+            self,
+            include_fallback_reactions: bool = False
+    ) -> Dict[str, int]:
+        """
+        Get the numbers of the chemical reactions per error category.
+
+        :parameter include_fallback_reactions: The indicator of whether the errors of the chemical reactions that were
+            sanitized with the fallback sanitization operations should be counted as well.
+
+        :returns: The numbers of the chemical reactions per error category.
+        """
+
+        return dict(Counter(
+            error_category
+            for error_category, sanitization_level in zip(self.error_categories, self.sanitization_levels)
+            if error_category is not None and (include_fallback_reactions or sanitization_level < 0)
+        ))
+
+
+class ReactionBatchUtility:
+    """ The chemical reaction batch utility class. """
+
+    fallback_sanitization_operation_keys = (
+        (("atom_map_numbers", "r_group_names", ), None, ),
+        (("atom_map_numbers", "r_group_names", ), (
+            "adjust_hydrogens", "clean_up", "clean_up_atropisomers", "clean_up_chirality", "clean_up_organometallics",
+            "find_radicals", "set_conjugation", "set_hybridization", "symmetrize_rings",
+        ), ),
+    )
+
+    @staticmethod
+    def iterate_sanitized_reaction_chunks(
+            reaction_rxns: Iterable[Any],
+            reaction_sanitization_operation_keys: Collection[str] = None,
+            reaction_compound_sanitization_operation_keys: Collection[str] = None,
+            sanitize_reaction_compounds: bool = True,
+            fallback_sanitization_operation_keys: Optional[
+                Sequence[Tuple[Optional[Collection[str]], Optional[Collection[str]]]]
+            ] = None,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None
+    ) -> Iterator[ReactionBatchSanitizationResult]:
+        """
+        Sanitize a stream of chemical reactions in chunks without modifying the input RDKit ChemicalReaction objects.
+        The chemical reactions that could not be sanitized with the requested sanitization operations are sanitized
+        again with the fallback sanitization operations instead of being dropped.
+
+        :parameter reaction_rxns: The RDKit ChemicalReaction objects of the chemical reactions as an iterable, sequence,
+            NumPy object array or pandas Series. The entries of other types, such as the missing values, are marked as
+            errors.
+        :parameter reaction_sanitization_operation_keys: The keys of the chemical reaction sanitization operations that
+            should be performed. The value `None` indicates that all chemical reaction sanitization operations should be
+            performed.
+        :parameter reaction_compound_sanitization_operation_keys: The keys of the chemical reaction compound
+            sanitization operations that should be performed. The value `None` indicates that all chemical reaction
+            compound sanitization operations should be performed.
+        :parameter sanitize_reaction_compounds: The indicator of whether the chemical reaction compounds should be
+            sanitized.
+        :parameter fallback_sanitization_operation_keys: The pairs of the keys of the chemical reaction and chemical
+            reaction compound sanitization operations that should be attempted in order if the sanitization fails. The
+            keys of the chemical reaction sanitization operations are defined by the
+            ``ReactionStandardizationUtility.get_reaction_sanitization_operations`` method. The value `None` indicates
+            that the default fallback sanitization operations of the class should be attempted, which first omit the
+            adjustment of the reactants and the merging of the hydrogen atoms, and then the chemical reaction compound
+            sanitization operations that require valid valences. An empty sequence indicates that the chemical
+            reactions should not be sanitized again.
+        :parameter chunk_size: The number of chemical reactions per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical reactions should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+
+        :returns: The iterator over the batch sanitization results of the chunks in the order of the input.
+        """
+
+        if fallback_sanitization_operation_keys is None:
+            fallback_sanitization_operation_keys = ReactionBatchUtility.fallback_sanitization_operation_keys
+
+        sanitization_operation_keys = (
+            (reaction_sanitization_operation_keys, reaction_compound_sanitization_operation_keys, ),
+            *fallback_sanitization_operation_keys,
+        )
+
+        for sanitized_reaction_chunk in map_in_chunks(
+            chunk_function=partial(
+                _sanitize_reaction_chunk,
+                sanitization_operation_keys=sanitization_operation_keys,
+                sanitize_reaction_compounds=sanitize_reaction_compounds
+            ),
+            items=reaction_rxns,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor
+        ):
+            yield ReactionBatchSanitizationResult.from_reaction_results(
+                reaction_results=sanitized_reaction_chunk
+            )
+
+    @staticmethod
+    def sanitize_reactions(
+            reaction_rxns: Iterable[Any],
+            reaction_sanitization_operation_keys: Collection[str] = None,
+            reaction_compound_sanitization_operation_keys: Collection[str] = None,
+            sanitize_reaction_compounds: bool = True,
+            fallback_sanitization_operation_keys: Optional[
+                Sequence[Tuple[Optional[Collection[str]], Optional[Collection[str]]]]
+            ] = None,
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None
+    ) -> ReactionBatchSanitizationResult:
+        """
+        Sanitize a batch of chemical reactions in chunks without modifying the input RDKit ChemicalReaction objects.
+
+        :parameter reaction_rxns: The RDKit ChemicalReaction objects of the chemical reactions as an iterable, sequence,
+            NumPy object array or pandas Series. The entries of other types, such as the missing values, are marked as
+            errors.
+        :parameter reaction_sanitization_operation_keys: The keys of the chemical reaction sanitization operations that
+            should be performed. The value `None` indicates that all chemical reaction sanitization operations should be
+            performed.
+        :parameter reaction_compound_sanitization_operation_keys: The keys of the chemical reaction compound
+            sanitization operations that should be performed. The value `None` indicates that all chemical reaction
+            compound sanitization operations should be performed.
+        :parameter sanitize_reaction_compounds: The indicator of whether the chemical reaction compounds should be
+            sanitized.
+        :parameter fallback_sanitization_operation_keys: The pairs of the keys of the chemical reaction and chemical
+            reaction compound sanitization operations that should be attempted in order if the sanitization fails. The
+            value `None` indicates that the default fallback sanitization operations of the class should be attempted,
+            and an empty sequence indicates that the chemical reactions should not be sanitized again.
+        :parameter chunk_size: The number of chemical reactions per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the chemical reactions should be processed in the current process unless an executor is specified.
+        :parameter executor: The executor that processes the chunks.
+
+        :returns: The batch sanitization result of the chemical reactions in the order of the input.
+        """
+
+        sanitization_results = list(ReactionBatchUtility.iterate_sanitized_reaction_chunks(
+            reaction_rxns=reaction_rxns,
+            reaction_sanitization_operation_keys=reaction_sanitization_operation_keys,
+            reaction_compound_sanitization_operation_keys=reaction_compound_sanitization_operation_keys,
+            sanitize_reaction_compounds=sanitize_reaction_compounds,
+            fallback_sanitization_operation_keys=fallback_sanitization_operation_keys,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor
+        ))
+
+        return ReactionBatchSanitizationResult(
+            reaction_rxns=concatenate([
+                empty(shape=0, dtype=object),
+            ] + [sanitization_result.reaction_rxns for sanitization_result in sanitization_results]),
+            sanitization_levels=concatenate([
+                empty(shape=0, dtype=int32),
+            ] + [sanitization_result.sanitization_levels for sanitization_result in sanitization_results]),
+            error_categories=concatenate([
+                empty(shape=0, dtype=object),
+            ] + [sanitization_result.error_categories for sanitization_result in sanitization_results])
+        )
@@ -0,0 +1,288 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``caching`` module. """
+
+from typing import Collection, Iterable, List, Optional, Sequence, Tuple
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.execution.caching import PersistentResultCache
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+from ncsw_chemistry.reaction.utility.standardization import ReactionStandardizationUtility
+
+
+class ReactionStandardizationCache:
+    """ The persistent chemical reaction standardization cache class. """
+
+    def __init__(
+            self,
+            database_file_path: str,
+            reaction_sanitization_operation_keys: Collection[str] = None,
+            remove_reaction_compound_atom_map_numbers: bool = False,
+            max_number_of_entries: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter database_file_path: The path to the SQLite database file of the cache.
+        :parameter reaction_sanitization_operation_keys: The keys of the chemical reaction sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_reaction_compound_atom_map_numbers: The indicator of whether the chemical reaction compound
+            atom map numbers should be removed.
+        :parameter max_number_of_entries: The maximum number of entries of the cache. The value `None` indicates that
+            the number of entries should not be limited.
+        """
+
+        self.reaction_sanitization_operation_keys = None if reaction_sanitization_operation_keys is None else sorted(
+            reaction_sanitization_operation_keys
+        )
+
+        self.remove_reaction_compound_atom_map_numbers = remove_reaction_compound_atom_map_numbers
+
+        self.result_cache = PersistentResultCache(
+            database_file_path=database_file_path,
+            configuration={
+                "pipeline": "standardize_reaction_smiles",
+                "reaction_sanitization_operation_keys": self.reaction_sanitization_operation_keys,
+                "remove_reaction_compound_atom_map_numbers": self.remove_reaction_compound_atom_map_numbers,
+            },
+            max_number_of_entries=max_number_of_entries
+        )
+
+    def __enter__(
+            self
+    ) -> "ReactionStandardizationCache":
+        """
+        Enter the runtime context of the cache.
+
+        :returns: The persistent chemical reaction standardization cache.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the cache and close the database connection. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Close the database connection of the cache. """
+
+        self.result_cache.close()
+
+    def standardize_reaction_smiles_strings(
+            self,
+            reaction_smiles_strings: Iterable[str]
+    ) -> List[Optional[str]]:
+        """
+        Standardize chemical reaction SMILES strings, of which only the ones that are not cached are recomputed.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+        :returns: The SMILES strings of the standardized chemical reactions, or the values `None` for the chemical
+            reactions that could not be standardized.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        cached_results = self.result_cache.get_many(
+            input_strings=reaction_smiles_strings
+        )
+
+        computed_results = dict()
+
+        for reaction_smiles in reaction_smiles_strings:
+            if reaction_smiles not in cached_results.keys() and reaction_smiles not in computed_results.keys():
+                standardized_reaction_smiles = ReactionStandardizationUtility.standardize_reaction_smiles(
+                    reaction_smiles=reaction_smiles,
+                    reaction_sanitization_operation_keys=self.reaction_sanitization_operation_keys,
+                    remove_reaction_compound_atom_map_numbers=self.remove_reaction_compound_atom_map_numbers
+                )
+
+                computed_results[reaction_smiles] = None if standardized_reaction_smiles is None else (
+                    standardized_reaction_smiles.encode()
+                )
+
+        if len(computed_results) > 0:
+            self.result_cache.set_many(
+                results=computed_results.items()
+            )
+
+        cached_results.update(computed_results)
+
+        return [
+            None if cached_results[reaction_smiles] is None else cached_results[reaction_smiles].decode()
+            for reaction_smiles in reaction_smiles_strings
+        ]
+
+
+class ReactionRetroTemplateCache:
+    """ The persistent chemical reaction retro template extraction cache class. """
+
+    def __init__(
+            self,
+            database_file_path: str,
+            max_number_of_entries: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class. The cache can be shared by multiple processes on the same machine.
+
+        :parameter database_file_path: The path to the SQLite database file of the cache.
+        :parameter max_number_of_entries: The maximum number of entries of the cache. The value `None` indicates that
+            the number of entries should not be limited.
+        """
+
+        self.result_cache = PersistentResultCache(
+            database_file_path=database_file_path,
+            configuration={
+                "pipeline": "extract_retro_template_using_rdchiral",
+            },
+            max_number_of_entries=max_number_of_entries
+        )
+
+    def __enter__(
+            self
+    ) -> "ReactionRetroTemplateCache":
+        """
+        Enter the runtime context of the cache.
+
+        :returns: The persistent chemical reaction retro template extraction cache.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the cache and close the database connection. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Close the database connection of the cache. """
+
+        self.result_cache.close()
+
+    @staticmethod
+    def get_canonical_mapped_reaction_smiles(
+            mapped_reactant_compound_smiles_strings: Sequence[str],
+            mapped_product_compound_smiles: str
+    ) -> str:
+        """
+        Get the canonical SMILES string of a mapped chemical reaction, which is independent of the order and notation of
+        the mapped chemical reaction reactant compounds. The atom map numbers are retained.
+
+        :parameter mapped_reactant_compound_smiles_strings: The SMILES strings of the mapped chemical reaction reactant
+            compounds.
+        :parameter mapped_product_compound_smiles: The SMILES string of the mapped chemical reaction product compound.
+
+        :returns: The canonical SMILES string of the mapped chemical reaction.
+        """
+
+        canonical_compound_smiles_strings = list()
+
+        for compound_smiles in (".".join(mapped_reactant_compound_smiles_strings), mapped_product_compound_smiles, ):
+            compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                compound_smiles=compound_smiles
+            )
+
+            # The unparsable chemical compounds are retained verbatim, as their retro template extraction fails anyway.
+            canonical_compound_smiles_strings.append(
+                compound_smiles if compound_mol is None else CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                    compound_mol=compound_mol
+                )
+            )
+
+        return ">>".join(canonical_compound_smiles_strings)
+
+    def extract_retro_templates(
+            self,
+            mapped_reactions: Iterable[Tuple[Sequence[str], str]]
+    ) -> List[Optional[str]]:
+        """
+        Extract the retro templates from mapped chemical reactions using the RDChiral library, of which only the ones
+        that are not cached are extracted.
+
+        :parameter mapped_reactions: The SMILES strings of the mapped chemical reaction reactant compounds and product
+            compound of each chemical reaction.
+
+        :returns: The chemical reaction retro templates, or the values `None` for the chemical reactions from which the
+            retro templates could not be extracted.
+        """
+
+        mapped_reactions = [
+            (tuple(mapped_reactant_compound_smiles_strings), mapped_product_compound_smiles, )
+            for mapped_reactant_compound_smiles_strings, mapped_product_compound_smiles in mapped_reactions
+        ]
+
+        canonical_mapped_reaction_smiles_strings = [
+            self.get_canonical_mapped_reaction_smiles(
+                mapped_reactant_compound_smiles_strings=mapped_reactant_compound_smiles_strings,
+                mapped_product_compound_smiles=mapped_product_compound_smiles
+            ) for mapped_reactant_compound_smiles_strings, mapped_product_compound_smiles in mapped_reactions
+        ]
+
+        cached_results = self.result_cache.get_many(
+            input_strings=canonical_mapped_reaction_smiles_strings
+        )
+
+        computed_results = dict()
+
+        for (mapped_reactant_compound_smiles_strings, mapped_product_compound_smiles), \
+                canonical_mapped_reaction_smiles in zip(mapped_reactions, canonical_mapped_reaction_smiles_strings):
+            if canonical_mapped_reaction_smiles in cached_results.keys() or \
+                    canonical_mapped_reaction_smiles in computed_results.keys():
+                continue
+
+            try:
+                retro_template_smarts = ReactionReactivityUtility.extract_retro_template_using_rdchiral(
+                    mapped_reactant_compound_smiles_strings=mapped_reactant_compound_smiles_strings,
+                    mapped_product_compound_smiles=mapped_product_compound_smiles
+                )
+
+            except Exception:
+                retro_template_smarts = None
+
+            computed_results[canonical_mapped_reaction_smiles] = None if retro_template_smarts is None else (
+                retro_template_smarts.encode()
+            )
+
+        if len(computed_results) > 0:
+            self.result_cache.set_many(
+                results=computed_results.items()
+            )
+
+        cached_results.update(computed_results)
+
+        return [
+            None if cached_results[canonical_mapped_reaction_smiles] is None else
+            cached_results[canonical_mapped_reaction_smiles].decode()
+            for canonical_mapped_reaction_smiles in canonical_mapped_reaction_smiles_strings
+        ]
+
+    def extract_retro_template(
+            self,
+            mapped_reactant_compound_smiles_strings: Sequence[str],
+            mapped_product_compound_smiles: str
+    ) -> Optional[str]:
+        """
+        Extract the retro template from a mapped chemical reaction using the RDChiral library unless it is cached.
+
+        :parameter mapped_reactant_compound_smiles_strings: The SMILES strings of the mapped chemical reaction reactant
+            compounds.
+        :parameter mapped_product_compound_smiles: The SMILES string of the mapped chemical reaction product compound.
+
+        :returns: The chemical reaction retro template, or the value `None` if it could not be extracted.
+        """
+
+        return self.extract_retro_templates(
+            mapped_reactions=[
+                (mapped_reactant_compound_smiles_strings, mapped_product_compound_smiles, ),
+            ]
+        )[0]
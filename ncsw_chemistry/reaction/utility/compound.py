@@ -2,9 +2,7 @@
 
 from typing import List, Tuple
 
-from rdkit.Chem.rdChemReactions import ChemicalReaction
-
-from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
+from rdkit.Chem.rdChemReactions import ChemicalReaction, RemoveMappingNumbersFromReactions
 
 
 class ReactionCompoundUtility:
@@ -28,16 +26,9 @@ class ReactionCompoundUtility:
         if deep_copy:
             reaction_rxn = ChemicalReaction(reaction_rxn)
 
-        for compound_mols in (
-            reaction_rxn.GetReactants(),
-            reaction_rxn.GetAgents(),
-            reaction_rxn.GetProducts(),
-        ):
-            for compound_mol in compound_mols:
-                CompoundAtomUtility.remove_atom_map_numbers(
-                    compound_mol=compound_mol,
-                    deep_copy=False
-                )
+        RemoveMappingNumbersFromReactions(
+            reaction_rxn
+        )
 
         return reaction_rxn
 
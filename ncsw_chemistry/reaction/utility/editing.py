@@ -0,0 +1,262 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``editing`` module. """
+
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from numpy import array, bool_, concatenate, cumsum, float32, fromiter, int32, int64, ndarray, zeros
+
+from rdkit.Chem.rdchem import Mol
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.execution.parallel import map_in_chunks
+
+
+def _try_to_extract_graph_edits(
+        mapped_reaction_smiles: Any
+) -> Optional[Tuple[ndarray, ndarray]]:
+    """
+    Try to extract the graph edits from a mapped chemical reaction SMILES string in the current or a worker process.
+
+    :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+    :returns: The bond and atom edits of the mapped chemical reaction, or the value `None` if the graph edits could not
+        be extracted.
+    """
+
+    try:
+        return ReactionGraphEditUtility.extract_graph_edits_from_reaction_smiles(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        )
+
+    except Exception:
+        return None
+
+
+def _extract_graph_edit_chunk(
+        mapped_reaction_smiles_strings: List[Any]
+) -> List[Optional[Tuple[ndarray, ndarray]]]:
+    """
+    Extract the graph edits from a chunk of mapped chemical reaction SMILES strings in the current or a worker process.
+
+    :parameter mapped_reaction_smiles_strings: The SMILES strings of the mapped chemical reactions.
+
+    :returns: The bond and atom edits of the mapped chemical reactions, or the values `None` for the mapped chemical
+        reactions whose graph edits could not be extracted.
+    """
+
+    return [
+        _try_to_extract_graph_edits(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        ) for mapped_reaction_smiles in mapped_reaction_smiles_strings
+    ]
+
+
+class ReactionGraphEditUtility:
+    """ The chemical reaction graph edit utility class. """
+
+    @staticmethod
+    def get_atom_and_bond_atom_map_number_tables(
+            compound_mols: Sequence[Mol]
+    ) -> Tuple[Dict[int, Tuple[int, int]], Dict[Tuple[int, int], float]]:
+        """
+        Get the tables of the chemical compound atoms and bonds between the mapped atoms indexed by the atom map numbers
+        in a single pass over the atoms and bonds.
+
+        :parameter compound_mols: The RDKit Mol objects of the sanitized chemical compounds.
+
+        :returns: The formal charges and total numbers of hydrogen atoms of the mapped atoms per atom map number, and
+            the bond orders of the bonds between the mapped atoms per ordered pair of the atom map numbers.
+        """
+
+        atom_table, bond_table = dict(), dict()
+
+        for compound_mol in compound_mols:
+            compound_atom_map_numbers = list()
+
+            for atom in compound_mol.GetAtoms():
+                atom_map_number = atom.GetAtomMapNum()
+
+                compound_atom_map_numbers.append(
+                    atom_map_number
+                )
+
+                if atom_map_number != 0:
+                    atom_table[atom_map_number] = (atom.GetFormalCharge(), atom.GetTotalNumHs(), )
+
+            for bond in compound_mol.GetBonds():
+                begin_atom_map_number = compound_atom_map_numbers[bond.GetBeginAtomIdx()]
+                end_atom_map_number = compound_atom_map_numbers[bond.GetEndAtomIdx()]
+
+                if begin_atom_map_number != 0 and end_atom_map_number != 0:
+                    if begin_atom_map_number > end_atom_map_number:
+                        begin_atom_map_number, end_atom_map_number = end_atom_map_number, begin_atom_map_number
+
+                    bond_table[(begin_atom_map_number, end_atom_map_number, )] = bond.GetBondTypeAsDouble()
+
+        return atom_table, bond_table
+
+    @staticmethod
+    def extract_graph_edits(
+            mapped_reactant_compound_mols: Sequence[Mol],
+            mapped_product_compound_mols: Sequence[Mol]
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Extract the graph edits of a mapped chemical reaction, which are the bonds that are formed, broken or changed
+        and the atoms whose formal charges or numbers of hydrogen atoms are changed. Only the bonds with at least one
+        atom that is mapped in the chemical reaction product compounds are considered.
+
+        :parameter mapped_reactant_compound_mols: The RDKit Mol objects of the sanitized mapped chemical reaction
+            reactant compounds.
+        :parameter mapped_product_compound_mols: The RDKit Mol objects of the sanitized mapped chemical reaction product
+            compounds.
+
+        :returns: The 32-bit float array of the bond edits with the rows `(map_i, map_j, old_order, new_order)` sorted
+            by the atom map numbers, where the bond order `0` indicates no bond, and the 32-bit integer array of the
+            atom edits with the rows `(map, old_charge, new_charge, old_number_of_hydrogens, new_number_of_hydrogens)`
+            sorted by the atom map number.
+        """
+
+        reactant_atom_table, reactant_bond_table = ReactionGraphEditUtility.get_atom_and_bond_atom_map_number_tables(
+            compound_mols=mapped_reactant_compound_mols
+        )
+
+        product_atom_table, product_bond_table = ReactionGraphEditUtility.get_atom_and_bond_atom_map_number_tables(
+            compound_mols=mapped_product_compound_mols
+        )
+
+        bond_edits = list()
+
+        for bond_atom_map_numbers in reactant_bond_table.keys() | product_bond_table.keys():
+            reactant_bond_order = reactant_bond_table.get(bond_atom_map_numbers, 0.0)
+            product_bond_order = product_bond_table.get(bond_atom_map_numbers, 0.0)
+
+            if reactant_bond_order != product_bond_order and (
+                bond_atom_map_numbers[0] in product_atom_table.keys() or
+                bond_atom_map_numbers[1] in product_atom_table.keys()
+            ):
+                bond_edits.append(
+                    (*bond_atom_map_numbers, reactant_bond_order, product_bond_order, )
+                )
+
+        atom_edits = list()
+
+        for atom_map_number, product_atom_properties in product_atom_table.items():
+            reactant_atom_properties = reactant_atom_table.get(atom_map_number, product_atom_properties)
+
+            if reactant_atom_properties != product_atom_properties:
+                atom_edits.append(
+                    (atom_map_number, reactant_atom_properties[0], product_atom_properties[0],
+                     reactant_atom_properties[1], product_atom_properties[1], )
+                )
+
+        return (
+            array(sorted(bond_edits), dtype=float32).reshape(-1, 4),
+            array(sorted(atom_edits), dtype=int32).reshape(-1, 5),
+        )
+
+    @staticmethod
+    def extract_graph_edits_from_reaction_smiles(
+            mapped_reaction_smiles: str
+    ) -> Optional[Tuple[ndarray, ndarray]]:
+        """
+        Extract the graph edits of a mapped chemical reaction SMILES string. The chemical reaction agent compounds are
+        ignored.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The bond and atom edits of the mapped chemical reaction in the format of the ``extract_graph_edits``
+            method, or the value `None` if the chemical reaction compounds could not be parsed.
+        """
+
+        mapped_reactant_compounds_smiles, _, mapped_product_compounds_smiles = mapped_reaction_smiles.split(">")
+
+        mapped_reactant_compounds_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+            compound_smiles=mapped_reactant_compounds_smiles
+        )
+
+        mapped_product_compounds_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+            compound_smiles=mapped_product_compounds_smiles
+        )
+
+        if mapped_reactant_compounds_mol is None or mapped_product_compounds_mol is None:
+            return None
+
+        return ReactionGraphEditUtility.extract_graph_edits(
+            mapped_reactant_compound_mols=(mapped_reactant_compounds_mol, ),
+            mapped_product_compound_mols=(mapped_product_compounds_mol, )
+        )
+
+    @staticmethod
+    def extract_graph_edits_in_batch(
+            mapped_reaction_smiles_strings: Iterable[Any],
+            chunk_size: int = 10000,
+            max_workers: Optional[int] = None,
+            executor: Optional[Executor] = None
+    ) -> Tuple[ndarray, ndarray, ndarray, ndarray, ndarray]:
+        """
+        Extract the graph edits of a batch of mapped chemical reaction SMILES strings in chunks.
+
+        :parameter mapped_reaction_smiles_strings: The SMILES strings of the mapped chemical reactions as a sequence,
+            NumPy object array or pandas Series. The entries of other types, such as the missing values, are marked as
+            errors.
+        :parameter chunk_size: The number of mapped chemical reactions per chunk.
+        :parameter max_workers: The number of worker processes of the managed process pool. The value `None` indicates
+            that the mapped chemical reactions should be processed in the current process unless an executor is
+            specified.
+        :parameter executor: The executor that processes the chunks.
+
+        :returns: The concatenated bond edits of the mapped chemical reactions, the 64-bit integer offsets of the bond
+            edits of each mapped chemical reaction, the concatenated atom edits of the mapped chemical reactions, the
+            64-bit integer offsets of the atom edits of each mapped chemical reaction, and the boolean error mask. The
+            edits of the i-th mapped chemical reaction are delimited by the i-th and (i + 1)-th offsets, and no edits
+            are recorded for the mapped chemical reactions that could not be processed.
+        """
+
+        graph_edits = list()
+
+        for graph_edit_chunk in map_in_chunks(
+            chunk_function=_extract_graph_edit_chunk,
+            items=mapped_reaction_smiles_strings,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executor=executor
+        ):
+            graph_edits.extend(
+                graph_edit_chunk
+            )
+
+        empty_graph_edits = (zeros((0, 4, ), dtype=float32), zeros((0, 5, ), dtype=int32), )
+
+        graph_edits_or_empty = [
+            empty_graph_edits if reaction_graph_edits is None else reaction_graph_edits
+            for reaction_graph_edits in graph_edits
+        ]
+
+        bond_edit_offsets, atom_edit_offsets = (
+            concatenate((
+                zeros(1, dtype=int64),
+                cumsum(
+                    fromiter(
+                        (len(reaction_graph_edits[edit_index]) for reaction_graph_edits in graph_edits_or_empty),
+                        dtype=int64,
+                        count=len(graph_edits_or_empty)
+                    )
+                ),
+            )) for edit_index in (0, 1, )
+        )
+
+        return (
+            concatenate([empty_graph_edits[0], ] + [
+                reaction_graph_edits[0] for reaction_graph_edits in graph_edits_or_empty
+            ]),
+            bond_edit_offsets,
+            concatenate([empty_graph_edits[1], ] + [
+                reaction_graph_edits[1] for reaction_graph_edits in graph_edits_or_empty
+            ]),
+            atom_edit_offsets,
+            fromiter(
+                (reaction_graph_edits is None for reaction_graph_edits in graph_edits),
+                dtype=bool_,
+                count=len(graph_edits)
+            ),
+        )
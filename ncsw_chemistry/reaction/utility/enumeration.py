@@ -0,0 +1,309 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``enumeration`` module. """
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import prod
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from rdkit.Chem.rdChemReactions import ChemicalReaction
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+
+
+_worker_forward_template_rxn: Optional[ChemicalReaction] = None
+
+_worker_reactant_compound_mols: Optional[List[list]] = None
+
+
+def _initialize_worker(
+        forward_template_smarts: str,
+        reactant_compound_smiles_strings: Sequence[Sequence[str]]
+) -> None:
+    """
+    Initialize the chemical reaction enumeration worker process.
+
+    :parameter forward_template_smarts: The chemical reaction forward template SMARTS string.
+    :parameter reactant_compound_smiles_strings: The SMILES strings of the chemical reaction reactant compounds for
+        each chemical reaction forward template reactant pattern.
+    """
+
+    global _worker_forward_template_rxn, _worker_reactant_compound_mols
+
+    _worker_forward_template_rxn, _worker_reactant_compound_mols = ReactionEnumerationUtility.compile_forward_template(
+        forward_template_smarts=forward_template_smarts,
+        reactant_compound_smiles_strings=reactant_compound_smiles_strings
+    )
+
+
+def _enumerate_slice_in_worker(
+        combination_slice: Tuple[int, int],
+        max_number_of_products: Optional[int]
+) -> List[str]:
+    """
+    Enumerate a slice of the chemical reaction reactant compound combination space in the chemical reaction
+    enumeration worker process.
+
+    :parameter combination_slice: The start and stop indices of the slice of the combination space.
+    :parameter max_number_of_products: The maximum number of unique product SMILES strings of the slice.
+
+    :returns: The unique canonical product SMILES strings of the slice.
+    """
+
+    return list(ReactionEnumerationUtility.enumerate_compiled_forward_template_products(
+        forward_template_rxn=_worker_forward_template_rxn,
+        reactant_compound_mols=_worker_reactant_compound_mols,
+        combination_slice=combination_slice,
+        max_number_of_products=max_number_of_products
+    ))
+
+
+class ReactionEnumerationUtility:
+    """ The chemical reaction enumeration utility class. """
+
+    @staticmethod
+    def compile_forward_template(
+            forward_template_smarts: str,
+            reactant_compound_smiles_strings: Sequence[Sequence[str]]
+    ) -> Tuple[ChemicalReaction, List[list]]:
+        """
+        Compile a chemical reaction forward template and its chemical reaction reactant compounds.
+
+        :parameter forward_template_smarts: The chemical reaction forward template SMARTS string.
+        :parameter reactant_compound_smiles_strings: The SMILES strings of the chemical reaction reactant compounds for
+            each chemical reaction forward template reactant pattern.
+
+        :returns: The initialized RDKit ChemicalReaction object of the chemical reaction forward template and the RDKit
+            Mol objects of the chemical reaction reactant compounds. The unparsable chemical reaction reactant compounds
+            are represented by the value `None`.
+        """
+
+        forward_template_rxn = ReactionFormattingUtility.convert_reaction_smarts_to_rxn(
+            reaction_smarts=forward_template_smarts
+        )
+
+        forward_template_rxn.Initialize()
+
+        if forward_template_rxn.GetNumReactantTemplates() != len(reactant_compound_smiles_strings):
+            raise ValueError(
+                "The number of reactant compound lists ({number_of_lists}) does not match the number of chemical "
+                "reaction forward template reactant patterns ({number_of_patterns}).".format(
+                    number_of_lists=len(reactant_compound_smiles_strings),
+                    number_of_patterns=forward_template_rxn.GetNumReactantTemplates()
+                )
+            )
+
+        return forward_template_rxn, [
+            [
+                CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                    compound_smiles=compound_smiles
+                ) for compound_smiles in compound_smiles_strings
+            ] for compound_smiles_strings in reactant_compound_smiles_strings
+        ]
+
+    @staticmethod
+    def iterate_combination_indices(
+            combination_space_shape: Sequence[int],
+            combination_slice: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Iterate over the indices of a slice of a combination space in the `itertools.product` order without
+        materializing the combinations.
+
+        :parameter combination_space_shape: The number of elements of each dimension of the combination space.
+        :parameter combination_slice: The start and stop indices of the slice of the combination space. The value
+            `None` indicates that the complete combination space should be iterated.
+
+        :returns: The iterator over the indices of the combinations.
+        """
+
+        number_of_combinations = prod(combination_space_shape)
+
+        start_index, stop_index = (0, number_of_combinations) if combination_slice is None else combination_slice
+        start_index, stop_index = max(start_index, 0), min(stop_index, number_of_combinations)
+
+        if start_index >= stop_index:
+            return
+
+        combination_indices, remainder = [0, ] * len(combination_space_shape), start_index
+
+        for dimension_index in reversed(range(len(combination_space_shape))):
+            remainder, combination_indices[dimension_index] = divmod(
+                remainder,
+                combination_space_shape[dimension_index]
+            )
+
+        for _ in range(stop_index - start_index):
+            yield tuple(combination_indices)
+
+            for dimension_index in reversed(range(len(combination_space_shape))):
+                combination_indices[dimension_index] += 1
+
+                if combination_indices[dimension_index] < combination_space_shape[dimension_index]:
+                    break
+
+                combination_indices[dimension_index] = 0
+
+    @staticmethod
+    def enumerate_compiled_forward_template_products(
+            forward_template_rxn: ChemicalReaction,
+            reactant_compound_mols: Sequence[Sequence],
+            combination_slice: Optional[Tuple[int, int]] = None,
+            max_number_of_products: Optional[int] = None,
+            **kwargs
+    ) -> Iterator[str]:
+        """
+        Enumerate the unique products of a compiled chemical reaction forward template over the combinations of the
+        chemical reaction reactant compounds.
+
+        :parameter forward_template_rxn: The initialized RDKit ChemicalReaction object of the chemical reaction forward
+            template.
+        :parameter reactant_compound_mols: The RDKit Mol objects of the chemical reaction reactant compounds for each
+            chemical reaction forward template reactant pattern. The value `None` entries are skipped.
+        :parameter combination_slice: The start and stop indices of the slice of the combination space. The value
+            `None` indicates that the complete combination space should be enumerated.
+        :parameter max_number_of_products: The maximum number of unique product SMILES strings. The value `None`
+            indicates that the number of unique product SMILES strings should not be limited.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdChemReactions.ChemicalReaction.RunReactants` }.
+
+        :returns: The iterator over the unique canonical product SMILES strings.
+        """
+
+        product_compound_smiles_strings = set()
+
+        for combination_indices in ReactionEnumerationUtility.iterate_combination_indices(
+            combination_space_shape=[len(compound_mols) for compound_mols in reactant_compound_mols],
+            combination_slice=combination_slice
+        ):
+            combination_compound_mols = [
+                reactant_compound_mols[dimension_index][compound_index]
+                for dimension_index, compound_index in enumerate(combination_indices)
+            ]
+
+            if any(compound_mol is None for compound_mol in combination_compound_mols):
+                continue
+
+            for product_compound_smiles in ReactionReactivityUtility.apply_forward_template_using_rdkit(
+                forward_template_rxn=forward_template_rxn,
+                reactant_compound_mols=combination_compound_mols,
+                **kwargs
+            ):
+                if product_compound_smiles not in product_compound_smiles_strings:
+                    product_compound_smiles_strings.add(
+                        product_compound_smiles
+                    )
+
+                    yield product_compound_smiles
+
+                    if max_number_of_products is not None and len(
+                        product_compound_smiles_strings
+                    ) >= max_number_of_products:
+                        return
+
+    @staticmethod
+    def enumerate_forward_template_products(
+            forward_template_smarts: str,
+            reactant_compound_smiles_strings: Sequence[Sequence[str]],
+            combination_slice: Optional[Tuple[int, int]] = None,
+            max_number_of_products: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            combination_slice_size: int = 10000
+    ) -> Iterator[str]:
+        """
+        Enumerate the unique products of a chemical reaction forward template over the combinations of the chemical
+        reaction reactant compounds.
+
+        :parameter forward_template_smarts: The chemical reaction forward template SMARTS string.
+        :parameter reactant_compound_smiles_strings: The SMILES strings of the chemical reaction reactant compounds for
+            each chemical reaction forward template reactant pattern.
+        :parameter combination_slice: The start and stop indices of the slice of the combination space in the
+            `itertools.product` order. The value `None` indicates that the complete combination space should be
+            enumerated.
+        :parameter max_number_of_products: The maximum number of unique product SMILES strings. The value `None`
+            indicates that the number of unique product SMILES strings should not be limited.
+        :parameter max_workers: The number of worker processes that enumerate the disjoint slices of the combination
+            space in parallel. The value `None` indicates that the combination space should be enumerated in the current
+            process.
+        :parameter combination_slice_size: The number of combinations per slice that is enumerated by a worker process.
+
+        :returns: The iterator over the unique canonical product SMILES strings.
+        """
+
+        number_of_combinations = prod(
+            len(compound_smiles_strings)
+            for compound_smiles_strings in reactant_compound_smiles_strings
+        )
+
+        start_index, stop_index = (0, number_of_combinations) if combination_slice is None else combination_slice
+
+        # The chemical reaction forward template is compiled in the current process in both cases, which raises the
+        # same errors for the invalid inputs instead of the broken process pool of the worker process initializers.
+        forward_template_rxn, reactant_compound_mols = ReactionEnumerationUtility.compile_forward_template(
+            forward_template_smarts=forward_template_smarts,
+            reactant_compound_smiles_strings=reactant_compound_smiles_strings
+        )
+
+        if max_workers is None:
+            yield from ReactionEnumerationUtility.enumerate_compiled_forward_template_products(
+                forward_template_rxn=forward_template_rxn,
+                reactant_compound_mols=reactant_compound_mols,
+                combination_slice=(start_index, stop_index, ),
+                max_number_of_products=max_number_of_products
+            )
+
+            return
+
+        product_compound_smiles_strings = set()
+
+        combination_slices = (
+            (slice_start_index, min(slice_start_index + combination_slice_size, stop_index), )
+            for slice_start_index in range(max(start_index, 0), stop_index, combination_slice_size)
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(forward_template_smarts, reactant_compound_smiles_strings, )
+        ) as executor:
+            pending_futures = set()
+
+            try:
+                while True:
+                    for combination_space_slice in combination_slices:
+                        pending_futures.add(
+                            executor.submit(
+                                _enumerate_slice_in_worker,
+                                combination_space_slice,
+                                max_number_of_products
+                            )
+                        )
+
+                        if len(pending_futures) >= 2 * max_workers:
+                            break
+
+                    if len(pending_futures) == 0:
+                        return
+
+                    completed_futures, pending_futures = wait(
+                        fs=pending_futures,
+                        return_when=FIRST_COMPLETED
+                    )
+
+                    for completed_future in completed_futures:
+                        for product_compound_smiles in completed_future.result():
+                            if product_compound_smiles not in product_compound_smiles_strings:
+                                product_compound_smiles_strings.add(
+                                    product_compound_smiles
+                                )
+
+                                yield product_compound_smiles
+
+                                if max_number_of_products is not None and len(
+                                    product_compound_smiles_strings
+                                ) >= max_number_of_products:
+                                    return
+
+            finally:
+                for pending_future in pending_futures:
+                    pending_future.cancel()
@@ -1,6 +1,6 @@
 """ The ``ncsw_chemistry.reaction.utility`` package ``formatting`` module. """
 
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from rdkit.Chem.rdChemReactions import ChemicalReaction, ReactionFromSmarts, ReactionToSmarts, ReactionToSmiles
 
@@ -62,6 +62,56 @@ class ReactionFormattingUtility:
             **kwargs
         )
 
+    @staticmethod
+    def convert_reaction_rxns_to_smarts(
+            reaction_rxns: Iterable[Optional[ChemicalReaction]],
+            remove_reaction_compound_atom_map_numbers: bool = False
+    ) -> List[Optional[str]]:
+        """
+        Convert multiple chemical reaction RDKit ChemicalReaction objects to SMARTS strings.
+
+        :parameter reaction_rxns: The RDKit ChemicalReaction objects of the chemical reactions. The value `None` entries
+            are converted to the value `None`.
+        :parameter remove_reaction_compound_atom_map_numbers: The indicator of whether the chemical reaction compound
+            atom map numbers should be removed.
+
+        :returns: The SMARTS strings of the chemical reactions.
+        """
+
+        return [
+            None if reaction_rxn is None else ReactionFormattingUtility.convert_reaction_rxn_to_smarts(
+                reaction_rxn=reaction_rxn,
+                remove_reaction_compound_atom_map_numbers=remove_reaction_compound_atom_map_numbers
+            ) for reaction_rxn in reaction_rxns
+        ]
+
+    @staticmethod
+    def convert_reaction_rxns_to_smiles(
+            reaction_rxns: Iterable[Optional[ChemicalReaction]],
+            remove_reaction_compound_atom_map_numbers: bool = False,
+            **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Convert multiple chemical reaction RDKit ChemicalReaction objects to SMILES strings.
+
+        :parameter reaction_rxns: The RDKit ChemicalReaction objects of the chemical reactions. The value `None` entries
+            are converted to the value `None`.
+        :parameter remove_reaction_compound_atom_map_numbers: The indicator of whether the chemical reaction compound
+            atom map numbers should be removed.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdChemReactions.ReactionToSmiles` }.
+
+        :returns: The SMILES strings of the chemical reactions.
+        """
+
+        return [
+            None if reaction_rxn is None else ReactionFormattingUtility.convert_reaction_rxn_to_smiles(
+                reaction_rxn=reaction_rxn,
+                remove_reaction_compound_atom_map_numbers=remove_reaction_compound_atom_map_numbers,
+                **kwargs
+            ) for reaction_rxn in reaction_rxns
+        ]
+
     @staticmethod
     def convert_reaction_smarts_to_rxn(
             reaction_smarts: str,
@@ -0,0 +1,232 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``hierarchy`` module. """
+
+from collections import defaultdict
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+
+
+class ReactionTemplateHierarchy:
+    """ The chemical reaction retro template specificity hierarchy class. """
+
+    def __init__(
+            self,
+            store_retro_template_smarts_strings: bool = True
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter store_retro_template_smarts_strings: The indicator of whether the chemical reaction retro template
+            SMARTS strings should be stored alongside the hashed chemical reaction retro template keys.
+        """
+
+        self.store_retro_template_smarts_strings = store_retro_template_smarts_strings
+
+        self.retro_template_key_to_parent_key = dict()
+        self.retro_template_key_to_count = defaultdict(int)
+        self.retro_template_key_to_specificity_level_key = dict()
+        self.retro_template_key_to_smarts = dict()
+
+        self.number_of_reactions = 0
+
+    @staticmethod
+    def get_retro_template_key(
+            retro_template_smarts: str,
+            retro_template_specificity_level_key: str
+    ) -> int:
+        """
+        Get the hashed key of a chemical reaction retro template at a specificity level.
+
+        :parameter retro_template_smarts: The chemical reaction retro template SMARTS string.
+        :parameter retro_template_specificity_level_key: The key of the chemical reaction retro template specificity
+            level.
+
+        :returns: The 64-bit key of the chemical reaction retro template.
+        """
+
+        return int.from_bytes(
+            bytes=blake2b(
+                "{retro_template_specificity_level_key}\t{retro_template_smarts}".format(
+                    retro_template_specificity_level_key=retro_template_specificity_level_key,
+                    retro_template_smarts=retro_template_smarts
+                ).encode(),
+                digest_size=8
+            ).digest(),
+            byteorder="little"
+        )
+
+    def add_retro_templates(
+            self,
+            retro_templates: Mapping[str, Optional[str]]
+    ) -> Dict[str, int]:
+        """
+        Add the chemical reaction retro templates of a single chemical reaction at multiple specificity levels.
+
+        :parameter retro_templates: The chemical reaction retro template SMARTS strings per specificity level as
+            returned by the ``ReactionReactivityUtility.extract_retro_templates_at_specificity_levels`` method.
+
+        :returns: The hashed chemical reaction retro template keys per specificity level.
+        """
+
+        retro_template_specificity_levels = ReactionReactivityUtility.get_retro_template_specificity_levels()
+
+        retro_template_keys = {
+            retro_template_specificity_level_key: self.get_retro_template_key(
+                retro_template_smarts=retro_template_smarts,
+                retro_template_specificity_level_key=retro_template_specificity_level_key
+            ) for retro_template_specificity_level_key, retro_template_smarts in retro_templates.items()
+            if retro_template_smarts is not None
+        }
+
+        for retro_template_specificity_level_key, retro_template_key in retro_template_keys.items():
+            self.retro_template_key_to_count[retro_template_key] += 1
+
+            if retro_template_key in self.retro_template_key_to_specificity_level_key.keys():
+                continue
+
+            self.retro_template_key_to_specificity_level_key[retro_template_key] = retro_template_specificity_level_key
+
+            if self.store_retro_template_smarts_strings:
+                self.retro_template_key_to_smarts[retro_template_key] = retro_templates[
+                    retro_template_specificity_level_key
+                ]
+
+            parent_retro_template_specificity_level_key = retro_template_specificity_levels[
+                retro_template_specificity_level_key
+            ][2]
+
+            # The closest more general specificity level that was extracted is utilized as the parent.
+            while (
+                parent_retro_template_specificity_level_key is not None and
+                parent_retro_template_specificity_level_key not in retro_template_keys.keys()
+            ):
+                parent_retro_template_specificity_level_key = retro_template_specificity_levels[
+                    parent_retro_template_specificity_level_key
+                ][2]
+
+            if parent_retro_template_specificity_level_key is not None:
+                self.retro_template_key_to_parent_key[retro_template_key] = retro_template_keys[
+                    parent_retro_template_specificity_level_key
+                ]
+
+        self.number_of_reactions += 1
+
+        return retro_template_keys
+
+    def update(
+            self,
+            retro_templates_per_reaction: Iterable[Mapping[str, Optional[str]]]
+    ) -> None:
+        """
+        Add the chemical reaction retro templates of multiple chemical reactions at multiple specificity levels.
+
+        :parameter retro_templates_per_reaction: The chemical reaction retro template SMARTS strings per specificity
+            level of each chemical reaction.
+        """
+
+        for retro_templates in retro_templates_per_reaction:
+            self.add_retro_templates(
+                retro_templates=retro_templates
+            )
+
+    def merge(
+            self,
+            other: "ReactionTemplateHierarchy"
+    ) -> None:
+        """
+        Merge another chemical reaction retro template specificity hierarchy, for example, a hierarchy that was built
+        over a different shard of the same dataset.
+
+        :parameter other: The other chemical reaction retro template specificity hierarchy.
+        """
+
+        for retro_template_key, retro_template_count in other.retro_template_key_to_count.items():
+            self.retro_template_key_to_count[retro_template_key] += retro_template_count
+
+        for retro_template_key, parent_retro_template_key in other.retro_template_key_to_parent_key.items():
+            self.retro_template_key_to_parent_key.setdefault(retro_template_key, parent_retro_template_key)
+
+        for retro_template_key, retro_template_specificity_level_key in (
+            other.retro_template_key_to_specificity_level_key.items()
+        ):
+            self.retro_template_key_to_specificity_level_key.setdefault(
+                retro_template_key,
+                retro_template_specificity_level_key
+            )
+
+        if self.store_retro_template_smarts_strings:
+            for retro_template_key, retro_template_smarts in other.retro_template_key_to_smarts.items():
+                self.retro_template_key_to_smarts.setdefault(retro_template_key, retro_template_smarts)
+
+        self.number_of_reactions += other.number_of_reactions
+
+    def get_parent_key(
+            self,
+            retro_template_key: int
+    ) -> Optional[int]:
+        """
+        Get the hashed key of the more general parent chemical reaction retro template.
+
+        :parameter retro_template_key: The hashed key of the chemical reaction retro template.
+
+        :returns: The hashed key of the parent chemical reaction retro template, or `None` if the chemical reaction
+            retro template is a root of the hierarchy.
+        """
+
+        return self.retro_template_key_to_parent_key.get(retro_template_key, None)
+
+    def get_ancestor_keys(
+            self,
+            retro_template_key: int
+    ) -> List[int]:
+        """
+        Get the hashed keys of the increasingly general ancestor chemical reaction retro templates.
+
+        :parameter retro_template_key: The hashed key of the chemical reaction retro template.
+
+        :returns: The hashed keys of the ancestor chemical reaction retro templates from the parent to the root.
+        """
+
+        ancestor_retro_template_keys = list()
+
+        while retro_template_key in self.retro_template_key_to_parent_key.keys():
+            retro_template_key = self.retro_template_key_to_parent_key[retro_template_key]
+
+            ancestor_retro_template_keys.append(
+                retro_template_key
+            )
+
+        return ancestor_retro_template_keys
+
+    def get_parent_key_to_child_keys(
+            self
+    ) -> Dict[int, Set[int]]:
+        """
+        Get the inverted hierarchy of the chemical reaction retro templates.
+
+        :returns: The hashed keys of the more specific child chemical reaction retro templates per hashed key of the
+            parent chemical reaction retro template.
+        """
+
+        parent_retro_template_key_to_child_keys = defaultdict(set)
+
+        for retro_template_key, parent_retro_template_key in self.retro_template_key_to_parent_key.items():
+            parent_retro_template_key_to_child_keys[parent_retro_template_key].add(
+                retro_template_key
+            )
+
+        return dict(parent_retro_template_key_to_child_keys)
+
+    def get_root_keys(
+            self
+    ) -> Set[int]:
+        """
+        Get the hashed keys of the most general chemical reaction retro templates.
+
+        :returns: The hashed keys of the chemical reaction retro templates without a parent.
+        """
+
+        return set(self.retro_template_key_to_count.keys()).difference(
+            self.retro_template_key_to_parent_key.keys()
+        )
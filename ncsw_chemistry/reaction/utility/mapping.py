@@ -0,0 +1,291 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``mapping`` module. """
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from numpy import bool_, concatenate, flatnonzero, fromiter, int32, isin, ndarray, setdiff1d, unique
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdChemReactions import ChemicalReaction
+
+from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
+
+
+class ReactionAtomMapIndex:
+    """ The chemical reaction atom map number index class. """
+
+    def __init__(
+            self,
+            mapped_reactant_compound_mols: Sequence[Mol],
+            mapped_product_compound_mols: Sequence[Mol]
+    ) -> None:
+        """
+        The constructor method of the class, which indexes and validates the atom map numbers in a single pass over the
+        atoms of the chemical reaction compounds.
+
+        :parameter mapped_reactant_compound_mols: The RDKit Mol objects of the mapped chemical reaction reactant
+            compounds.
+        :parameter mapped_product_compound_mols: The RDKit Mol objects of the mapped chemical reaction product
+            compounds.
+        """
+
+        self.reactant_compound_atom_map_numbers = [
+            CompoundAtomUtility.get_atom_map_numbers(
+                compound_mol=compound_mol
+            ) for compound_mol in mapped_reactant_compound_mols
+        ]
+
+        self.product_compound_atom_map_numbers = [
+            CompoundAtomUtility.get_atom_map_numbers(
+                compound_mol=compound_mol
+            ) for compound_mol in mapped_product_compound_mols
+        ]
+
+        self.reactant_compound_atomic_numbers = [
+            fromiter(
+                (atom.GetAtomicNum() for atom in compound_mol.GetAtoms()),
+                dtype=int32,
+                count=compound_mol.GetNumAtoms()
+            ) for compound_mol in mapped_reactant_compound_mols
+        ]
+
+        self.product_compound_atomic_numbers = [
+            fromiter(
+                (atom.GetAtomicNum() for atom in compound_mol.GetAtoms()),
+                dtype=int32,
+                count=compound_mol.GetNumAtoms()
+            ) for compound_mol in mapped_product_compound_mols
+        ]
+
+        self._reactant_compound_atom_map_number_to_index = [None, ] * len(self.reactant_compound_atom_map_numbers)
+        self._product_compound_atom_map_number_to_index = [None, ] * len(self.product_compound_atom_map_numbers)
+
+        all_reactant_atom_map_numbers, all_reactant_atomic_numbers = self._concatenate_mapped(
+            atom_map_numbers=self.reactant_compound_atom_map_numbers,
+            atomic_numbers=self.reactant_compound_atomic_numbers
+        )
+
+        all_product_atom_map_numbers, all_product_atomic_numbers = self._concatenate_mapped(
+            atom_map_numbers=self.product_compound_atom_map_numbers,
+            atomic_numbers=self.product_compound_atomic_numbers
+        )
+
+        unique_reactant_atom_map_numbers, reactant_atom_map_number_counts = unique(
+            all_reactant_atom_map_numbers,
+            return_counts=True
+        )
+
+        unique_product_atom_map_numbers, product_atom_map_number_counts = unique(
+            all_product_atom_map_numbers,
+            return_counts=True
+        )
+
+        self.duplicate_reactant_atom_map_numbers = set(
+            unique_reactant_atom_map_numbers[reactant_atom_map_number_counts > 1].tolist()
+        )
+
+        self.duplicate_product_atom_map_numbers = set(
+            unique_product_atom_map_numbers[product_atom_map_number_counts > 1].tolist()
+        )
+
+        self.orphan_product_atom_map_numbers = set(
+            setdiff1d(unique_product_atom_map_numbers, unique_reactant_atom_map_numbers).tolist()
+        )
+
+        self.unbalanced_reactant_atom_map_numbers = set(
+            setdiff1d(unique_reactant_atom_map_numbers, unique_product_atom_map_numbers).tolist()
+        )
+
+        reactant_atom_map_number_to_atomic_number = dict(zip(
+            all_reactant_atom_map_numbers.tolist(),
+            all_reactant_atomic_numbers.tolist()
+        ))
+
+        self.mismatched_atom_map_numbers = {
+            atom_map_number
+            for atom_map_number, atomic_number in zip(
+                all_product_atom_map_numbers.tolist(),
+                all_product_atomic_numbers.tolist()
+            )
+            if reactant_atom_map_number_to_atomic_number.get(atom_map_number, atomic_number) != atomic_number
+        }
+
+        self.number_of_unmapped_product_atoms = sum(
+            int((atom_map_numbers == 0).sum())
+            for atom_map_numbers in self.product_compound_atom_map_numbers
+        )
+
+    @staticmethod
+    def _concatenate_mapped(
+            atom_map_numbers: List[ndarray],
+            atomic_numbers: List[ndarray]
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Concatenate the atom map numbers and atomic numbers of the mapped atoms of multiple chemical compounds.
+
+        :parameter atom_map_numbers: The atom map numbers of each chemical compound.
+        :parameter atomic_numbers: The atomic numbers of each chemical compound.
+
+        :returns: The atom map numbers and atomic numbers of the mapped atoms.
+        """
+
+        if len(atom_map_numbers) == 0:
+            return fromiter((), dtype=int32), fromiter((), dtype=int32)
+
+        all_atom_map_numbers, all_atomic_numbers = concatenate(atom_map_numbers), concatenate(atomic_numbers)
+
+        is_mapped = all_atom_map_numbers != 0
+
+        return all_atom_map_numbers[is_mapped], all_atomic_numbers[is_mapped]
+
+    @classmethod
+    def from_reaction_rxn(
+            cls,
+            mapped_reaction_rxn: ChemicalReaction
+    ) -> "ReactionAtomMapIndex":
+        """
+        Construct the chemical reaction atom map number index from a chemical reaction.
+
+        :parameter mapped_reaction_rxn: The RDKit ChemicalReaction object of the mapped chemical reaction.
+
+        :returns: The chemical reaction atom map number index.
+        """
+
+        return cls(
+            mapped_reactant_compound_mols=mapped_reaction_rxn.GetReactants(),
+            mapped_product_compound_mols=mapped_reaction_rxn.GetProducts()
+        )
+
+    @property
+    def is_valid(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the atom map numbers are valid, which requires unique atom map numbers on each side
+        of the chemical reaction, no orphan product atom map numbers and matching elements of the mapped atoms.
+
+        :returns: The indicator of whether the atom map numbers are valid.
+        """
+
+        return (
+            len(self.duplicate_reactant_atom_map_numbers) == 0 and
+            len(self.duplicate_product_atom_map_numbers) == 0 and
+            len(self.orphan_product_atom_map_numbers) == 0 and
+            len(self.mismatched_atom_map_numbers) == 0
+        )
+
+    @property
+    def is_balanced(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the atom map numbers are balanced, which requires each mapped reactant atom to be
+        mapped in the product compounds and each product atom to be mapped.
+
+        :returns: The indicator of whether the atom map numbers are balanced.
+        """
+
+        return len(self.unbalanced_reactant_atom_map_numbers) == 0 and self.number_of_unmapped_product_atoms == 0
+
+    def get_reactant_compound_atom_map_number_to_index(
+            self,
+            reactant_compound_index: int
+    ) -> Dict[int, int]:
+        """
+        Get the mapping of the atom map numbers to the atom indices of a chemical reaction reactant compound.
+
+        :parameter reactant_compound_index: The index of the chemical reaction reactant compound.
+
+        :returns: The mapping of the atom map numbers to the atom indices, excluding the unmapped atoms. The first atom
+            is utilized in the case of the duplicate atom map numbers.
+        """
+
+        if self._reactant_compound_atom_map_number_to_index[reactant_compound_index] is None:
+            self._reactant_compound_atom_map_number_to_index[reactant_compound_index] = self._get_map_number_to_index(
+                atom_map_numbers=self.reactant_compound_atom_map_numbers[reactant_compound_index]
+            )
+
+        return self._reactant_compound_atom_map_number_to_index[reactant_compound_index]
+
+    def get_product_compound_atom_map_number_to_index(
+            self,
+            product_compound_index: int
+    ) -> Dict[int, int]:
+        """
+        Get the mapping of the atom map numbers to the atom indices of a chemical reaction product compound.
+
+        :parameter product_compound_index: The index of the chemical reaction product compound.
+
+        :returns: The mapping of the atom map numbers to the atom indices, excluding the unmapped atoms. The first atom
+            is utilized in the case of the duplicate atom map numbers.
+        """
+
+        if self._product_compound_atom_map_number_to_index[product_compound_index] is None:
+            self._product_compound_atom_map_number_to_index[product_compound_index] = self._get_map_number_to_index(
+                atom_map_numbers=self.product_compound_atom_map_numbers[product_compound_index]
+            )
+
+        return self._product_compound_atom_map_number_to_index[product_compound_index]
+
+    @staticmethod
+    def _get_map_number_to_index(
+            atom_map_numbers: ndarray
+    ) -> Dict[int, int]:
+        """
+        Get the mapping of the atom map numbers to the atom indices of a chemical compound.
+
+        :parameter atom_map_numbers: The atom map numbers of the chemical compound.
+
+        :returns: The mapping of the atom map numbers to the atom indices, excluding the unmapped atoms.
+        """
+
+        atom_map_number_to_index = dict()
+
+        for atom_index, atom_map_number in enumerate(atom_map_numbers.tolist()):
+            if atom_map_number != 0:
+                atom_map_number_to_index.setdefault(atom_map_number, atom_index)
+
+        return atom_map_number_to_index
+
+    def get_reactant_compound_atom_indices_not_in(
+            self,
+            reactant_compound_index: int,
+            atom_map_numbers: Iterable[int]
+    ) -> Set[int]:
+        """
+        Get the indices of the chemical reaction reactant compound atoms whose map numbers are not in a collection.
+
+        :parameter reactant_compound_index: The index of the chemical reaction reactant compound.
+        :parameter atom_map_numbers: The atom map numbers.
+
+        :returns: The indices of the chemical reaction reactant compound atoms.
+        """
+
+        return set(flatnonzero(~isin(
+            self.reactant_compound_atom_map_numbers[reactant_compound_index],
+            fromiter(atom_map_numbers, dtype=int32)
+        )).tolist())
+
+    @staticmethod
+    def get_valid_reaction_mask(
+            mapped_reaction_rxns: Iterable[ChemicalReaction],
+            require_balanced: bool = False
+    ) -> ndarray:
+        """
+        Get the mask of the chemical reactions with valid atom map numbers.
+
+        :parameter mapped_reaction_rxns: The RDKit ChemicalReaction objects of the mapped chemical reactions.
+        :parameter require_balanced: The indicator of whether the atom map numbers should also be balanced.
+
+        :returns: The indicators of whether the atom map numbers of the chemical reactions are valid.
+        """
+
+        reaction_atom_map_indices = (
+            ReactionAtomMapIndex.from_reaction_rxn(
+                mapped_reaction_rxn=mapped_reaction_rxn
+            ) for mapped_reaction_rxn in mapped_reaction_rxns
+        )
+
+        return fromiter((
+            reaction_atom_map_index.is_valid and (reaction_atom_map_index.is_balanced or not require_balanced)
+            for reaction_atom_map_index in reaction_atom_map_indices
+        ), dtype=bool_)
@@ -0,0 +1,575 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``mining`` module. """
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappushpop, merge
+from itertools import islice
+from os import makedirs, remove
+from os.path import join
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from numpy import array, fromfile, int64, uint64
+
+from rdkit.Chem.rdchem import Mol
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
+from ncsw_chemistry.compound.utility.typing_ import CompoundPropertyKeysOrProfile
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+
+
+def _write_run(
+        run_file_path: str,
+        run_entries: Iterable[Tuple[int, int, str]],
+        block_size: int = 65536
+) -> int:
+    """
+    Write a sorted run of the chemical reaction center pattern counts to the disk.
+
+    :parameter run_file_path: The path prefix of the files of the run.
+    :parameter run_entries: The hashes, counts and representative SMARTS strings of the chemical reaction center
+        patterns in the ascending order of the hashes.
+    :parameter block_size: The number of entries that should be written at once.
+
+    :returns: The number of entries of the run.
+    """
+
+    number_of_run_entries = 0
+
+    run_entries = iter(run_entries)
+
+    with open(run_file_path + ".hashes", mode="wb") as hash_file_handle, \
+            open(run_file_path + ".counts", mode="wb") as count_file_handle, \
+            open(run_file_path + ".smarts", mode="w") as smarts_file_handle:
+        while True:
+            run_entry_block = list(islice(run_entries, block_size))
+
+            if len(run_entry_block) == 0:
+                break
+
+            array([run_entry[0] for run_entry in run_entry_block], dtype=uint64).astype("<u8").tofile(
+                hash_file_handle
+            )
+
+            array([run_entry[1] for run_entry in run_entry_block], dtype=int64).astype("<i8").tofile(
+                count_file_handle
+            )
+
+            smarts_file_handle.writelines(
+                "{smarts}\n".format(
+                    smarts=run_entry[2]
+                ) for run_entry in run_entry_block
+            )
+
+            number_of_run_entries += len(run_entry_block)
+
+    return number_of_run_entries
+
+
+def _iterate_run(
+        run_file_path: str,
+        block_size: int = 65536
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Iterate over a sorted run of the chemical reaction center pattern counts on the disk in blocks.
+
+    :parameter run_file_path: The path prefix of the files of the run.
+    :parameter block_size: The number of entries that should be read at once.
+
+    :returns: The iterator over the hashes, counts and representative SMARTS strings of the chemical reaction center
+        patterns in the ascending order of the hashes.
+    """
+
+    with open(run_file_path + ".hashes", mode="rb") as hash_file_handle, \
+            open(run_file_path + ".counts", mode="rb") as count_file_handle, \
+            open(run_file_path + ".smarts") as smarts_file_handle:
+        while True:
+            hashes = fromfile(hash_file_handle, dtype="<u8", count=block_size).tolist()
+
+            if len(hashes) == 0:
+                break
+
+            counts = fromfile(count_file_handle, dtype="<i8", count=block_size).tolist()
+
+            for hash_, count in zip(hashes, counts):
+                yield hash_, count, smarts_file_handle.readline()[:-1]
+
+
+def _delete_run(
+        run_file_path: str
+) -> None:
+    """
+    Delete a sorted run of the chemical reaction center pattern counts from the disk.
+
+    :parameter run_file_path: The path prefix of the files of the run.
+    """
+
+    for file_extension in (".hashes", ".counts", ".smarts", ):
+        remove(run_file_path + file_extension)
+
+
+def _merge_runs(
+        run_file_paths: Sequence[str]
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Merge the sorted runs of the chemical reaction center pattern counts on the disk without loading them into memory.
+
+    :parameter run_file_paths: The path prefixes of the files of the runs.
+
+    :returns: The iterator over the hashes, summed counts and representative SMARTS strings of the chemical reaction
+        center patterns in the ascending order of the hashes.
+    """
+
+    merged_run_entry = None
+
+    for hash_, count, smarts in merge(
+        *[
+            _iterate_run(
+                run_file_path=run_file_path
+            ) for run_file_path in run_file_paths
+        ],
+        key=lambda run_entry: run_entry[0]
+    ):
+        if merged_run_entry is not None and merged_run_entry[0] == hash_:
+            merged_run_entry[1] += count
+
+            continue
+
+        if merged_run_entry is not None:
+            yield tuple(merged_run_entry)
+
+        merged_run_entry = [hash_, count, smarts, ]
+
+    if merged_run_entry is not None:
+        yield tuple(merged_run_entry)
+
+
+def _count_reaction_center_patterns(
+        mapped_reaction_smiles_strings: Sequence[str],
+        run_file_path: str,
+        atom_property_keys: Optional[CompoundPropertyKeysOrProfile],
+        bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile],
+        bond_property_keys: Optional[CompoundPropertyKeysOrProfile]
+) -> Tuple[int, int]:
+    """
+    Count the chemical reaction center patterns of a shard of mapped chemical reactions and write them to the disk as a
+    sorted run, which is utilized in both the current and the worker processes.
+
+    :parameter mapped_reaction_smiles_strings: The SMILES strings of the mapped chemical reactions of the shard.
+    :parameter run_file_path: The path prefix of the files of the run.
+    :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+        properties.
+    :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+        atom properties.
+    :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+        properties.
+
+    :returns: The number of the chemical reactions and the number of the chemical reactions that could not be processed.
+    """
+
+    pattern_counts: Dict[int, List] = dict()
+
+    number_of_failed_reactions = 0
+
+    for mapped_reaction_smiles in mapped_reaction_smiles_strings:
+        try:
+            reaction_center_patterns = ReactionCenterPatternCounter.get_reaction_center_patterns(
+                mapped_reactant_compound_mols=[
+                    CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                        compound_smiles=compound_smiles
+                    ) for compound_smiles in mapped_reaction_smiles.split(">")[0].split(".")
+                ],
+                mapped_product_compound_mols=[
+                    CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                        compound_smiles=compound_smiles
+                    ) for compound_smiles in mapped_reaction_smiles.split(">")[-1].split(".")
+                ],
+                atom_property_keys=atom_property_keys,
+                bond_atom_property_keys=bond_atom_property_keys,
+                bond_property_keys=bond_property_keys
+            )
+
+        except Exception:
+            number_of_failed_reactions += 1
+
+            continue
+
+        for pattern_hash, (compound_mol, reactive_site_atom_indices) in reaction_center_patterns.items():
+            if pattern_hash in pattern_counts.keys():
+                pattern_counts[pattern_hash][0] += 1
+
+            else:
+                pattern_counts[pattern_hash] = [
+                    1,
+                    CompoundSubstructureUtility.get_substructure_smarts(
+                        compound_mol=compound_mol,
+                        substructure_atom_indices=sorted(reactive_site_atom_indices)
+                    ),
+                ]
+
+    _write_run(
+        run_file_path=run_file_path,
+        run_entries=(
+            (pattern_hash, pattern_count, pattern_smarts, )
+            for pattern_hash, (pattern_count, pattern_smarts) in sorted(pattern_counts.items())
+        )
+    )
+
+    return len(mapped_reaction_smiles_strings), number_of_failed_reactions
+
+
+class ReactionCenterPatternCounter:
+    """ The chemical reaction center pattern counter class. """
+
+    def __init__(
+            self,
+            working_directory_path: str,
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            shard_size: int = 10000,
+            max_number_of_merged_runs: int = 64,
+            max_workers: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class. The counts of each shard of chemical reactions are written to the working
+        directory as a sorted run, and the runs are merged on the disk, which bounds the memory usage by the size of a
+        shard.
+
+        :parameter working_directory_path: The path to the working directory of the sorted runs.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound atom properties should be utilized in the property ID.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized in the property ID. The value `None` indicates that all chemical
+            reaction compound bond atom properties should be utilized in the property ID.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound bond properties should be utilized in the property ID.
+        :parameter shard_size: The number of chemical reactions per shard.
+        :parameter max_number_of_merged_runs: The maximum number of sorted runs that are merged at once, which bounds
+            the number of open files.
+        :parameter max_workers: The number of worker processes utilized for the parallel counting of shards. The value
+            `None` indicates that the shards should be counted in the current process.
+        """
+
+        if shard_size < 1 or max_number_of_merged_runs < 2:
+            raise ValueError(
+                "The shard size should be positive and the maximum number of merged runs should be at least two."
+            )
+
+        makedirs(
+            name=working_directory_path,
+            exist_ok=True
+        )
+
+        self.working_directory_path = working_directory_path
+        self.atom_property_keys = atom_property_keys
+        self.bond_atom_property_keys = bond_atom_property_keys
+        self.bond_property_keys = bond_property_keys
+        self.shard_size = shard_size
+        self.max_number_of_merged_runs = max_number_of_merged_runs
+        self.max_workers = max_workers
+
+        self.number_of_reactions = 0
+        self.number_of_failed_reactions = 0
+
+        self.run_file_paths: List[str] = list()
+
+        self._number_of_created_runs = 0
+
+    @staticmethod
+    def get_reaction_center_patterns(
+            mapped_reactant_compound_mols: Sequence[Mol],
+            mapped_product_compound_mols: Sequence[Mol],
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
+    ) -> Dict[int, Tuple[Mol, Set[int]]]:
+        """
+        Get the distinct reaction center patterns of a chemical reaction, which are the reactive sites of the chemical
+        reaction reactant and product compounds identified by the hashes of their substructure property IDs.
+
+        :parameter mapped_reactant_compound_mols: The RDKit Mol objects of the mapped chemical reaction reactant
+            compounds.
+        :parameter mapped_product_compound_mols: The RDKit Mol objects of the mapped chemical reaction product
+            compounds.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound atom properties should be utilized in the property ID.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized in the property ID. The value `None` indicates that all chemical
+            reaction compound bond atom properties should be utilized in the property ID.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound bond properties should be utilized in the property ID.
+
+        :returns: The chemical compounds and reactive site atom indices of the reaction center patterns by their hashes.
+        """
+
+        reactive_sites_and_synthons = ReactionReactivityUtility.extract_reactive_sites_and_synthons(
+            mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+            mapped_product_compound_mols=mapped_product_compound_mols,
+            atom_property_keys=atom_property_keys,
+            bond_atom_property_keys=bond_atom_property_keys,
+            bond_property_keys=bond_property_keys
+        )
+
+        reactive_sites = [
+            (mapped_reactant_compound_mol, set(), ) for mapped_reactant_compound_mol in mapped_reactant_compound_mols
+        ]
+
+        for product_compound_index, product_compound_mol in enumerate(mapped_product_compound_mols):
+            reactant_compound_reactive_sites_and_synthons, product_compound_reactive_site_atom_indices = (
+                reactive_sites_and_synthons[product_compound_index]
+            )
+
+            for reactant_compound_index, (reactant_compound_reactive_site_atom_indices, _) in (
+                reactant_compound_reactive_sites_and_synthons.items()
+            ):
+                reactive_sites[reactant_compound_index][1].update(
+                    reactant_compound_reactive_site_atom_indices
+                )
+
+            reactive_sites.append(
+                (product_compound_mol, product_compound_reactive_site_atom_indices, )
+            )
+
+        reaction_center_patterns = dict()
+
+        for compound_mol, reactive_site_atom_indices in reactive_sites:
+            if len(reactive_site_atom_indices) == 0:
+                continue
+
+            reaction_center_patterns.setdefault(
+                CompoundSubstructureUtility.get_substructure_property_id_hash(
+                    compound_mol=compound_mol,
+                    substructure_atom_indices=reactive_site_atom_indices,
+                    substructure_atom_property_keys=atom_property_keys,
+                    substructure_bond_property_keys=bond_property_keys
+                ),
+                (compound_mol, reactive_site_atom_indices, )
+            )
+
+        return reaction_center_patterns
+
+    def _get_next_run_file_path(
+            self
+    ) -> str:
+        """
+        Get the path prefix of the files of the next sorted run.
+
+        :returns: The path prefix of the files of the next sorted run.
+        """
+
+        self._number_of_created_runs += 1
+
+        return join(
+            self.working_directory_path,
+            "run_{run_index:08d}".format(
+                run_index=self._number_of_created_runs
+            )
+        )
+
+    def count(
+            self,
+            mapped_reaction_smiles_strings: Iterable[str]
+    ) -> None:
+        """
+        Count the reaction center patterns of mapped chemical reactions in shards. The method can be called repeatedly
+        to count the chemical reactions incrementally.
+
+        :parameter mapped_reaction_smiles_strings: The SMILES strings of the mapped chemical reactions.
+        """
+
+        mapped_reaction_smiles_strings = iter(mapped_reaction_smiles_strings)
+
+        shards = iter(
+            lambda: list(islice(mapped_reaction_smiles_strings, self.shard_size)),
+            list()
+        )
+
+        if self.max_workers is None:
+            for shard in shards:
+                run_file_path = self._get_next_run_file_path()
+
+                self._add_shard_result(
+                    run_file_path=run_file_path,
+                    shard_result=_count_reaction_center_patterns(
+                        mapped_reaction_smiles_strings=shard,
+                        run_file_path=run_file_path,
+                        atom_property_keys=self.atom_property_keys,
+                        bond_atom_property_keys=self.bond_atom_property_keys,
+                        bond_property_keys=self.bond_property_keys
+                    )
+                )
+
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers
+        ) as process_pool_executor:
+            pending_shard_futures = deque()
+
+            for shard in shards:
+                # The number of submitted shards is bounded to keep only a few shards in memory at once.
+                if len(pending_shard_futures) >= 2 * self.max_workers:
+                    run_file_path, shard_future = pending_shard_futures.popleft()
+
+                    self._add_shard_result(
+                        run_file_path=run_file_path,
+                        shard_result=shard_future.result()
+                    )
+
+                run_file_path = self._get_next_run_file_path()
+
+                pending_shard_futures.append((
+                    run_file_path,
+                    process_pool_executor.submit(
+                        _count_reaction_center_patterns,
+                        mapped_reaction_smiles_strings=shard,
+                        run_file_path=run_file_path,
+                        atom_property_keys=self.atom_property_keys,
+                        bond_atom_property_keys=self.bond_atom_property_keys,
+                        bond_property_keys=self.bond_property_keys
+                    ),
+                ))
+
+            for run_file_path, shard_future in pending_shard_futures:
+                self._add_shard_result(
+                    run_file_path=run_file_path,
+                    shard_result=shard_future.result()
+                )
+
+    def _add_shard_result(
+            self,
+            run_file_path: str,
+            shard_result: Tuple[int, int]
+    ) -> None:
+        """
+        Add the result of a counted shard.
+
+        :parameter run_file_path: The path prefix of the files of the sorted run of the shard.
+        :parameter shard_result: The number of the chemical reactions and the number of the chemical reactions that
+            could not be processed.
+        """
+
+        number_of_reactions, number_of_failed_reactions = shard_result
+
+        self.number_of_reactions += number_of_reactions
+        self.number_of_failed_reactions += number_of_failed_reactions
+
+        self.run_file_paths.append(
+            run_file_path
+        )
+
+    def compact(
+            self
+    ) -> None:
+        """ Merge the sorted runs in groups until their number does not exceed the maximum number of merged runs. """
+
+        while len(self.run_file_paths) > self.max_number_of_merged_runs:
+            compacted_run_file_paths = list()
+
+            for group_start_index in range(0, len(self.run_file_paths), self.max_number_of_merged_runs):
+                group_run_file_paths = self.run_file_paths[
+                    group_start_index:group_start_index + self.max_number_of_merged_runs
+                ]
+
+                if len(group_run_file_paths) == 1:
+                    compacted_run_file_paths.extend(
+                        group_run_file_paths
+                    )
+
+                    continue
+
+                compacted_run_file_path = self._get_next_run_file_path()
+
+                _write_run(
+                    run_file_path=compacted_run_file_path,
+                    run_entries=_merge_runs(
+                        run_file_paths=group_run_file_paths
+                    )
+                )
+
+                for group_run_file_path in group_run_file_paths:
+                    _delete_run(
+                        run_file_path=group_run_file_path
+                    )
+
+                compacted_run_file_paths.append(
+                    compacted_run_file_path
+                )
+
+            self.run_file_paths = compacted_run_file_paths
+
+    def iterate_pattern_counts(
+            self
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over the merged counts of the reaction center patterns without loading them into memory.
+
+        :returns: The iterator over the hashes, supports and representative SMARTS strings of the reaction center
+            patterns in the ascending order of the hashes. The support of a reaction center pattern is the number of the
+            chemical reactions in which it occurs.
+        """
+
+        self.compact()
+
+        return _merge_runs(
+            run_file_paths=self.run_file_paths
+        )
+
+    def get_most_frequent_patterns(
+            self,
+            k: Optional[int] = None,
+            min_support: int = 1
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Get the most frequent reaction center patterns, of which only the top-k are held in memory.
+
+        :parameter k: The number of the most frequent reaction center patterns. The value `None` indicates that all
+            reaction center patterns with the minimum support should be returned.
+        :parameter min_support: The minimum number of the chemical reactions in which a reaction center pattern occurs.
+
+        :returns: The hashes, supports and representative SMARTS strings of the most frequent reaction center patterns
+            in the descending order of the support, where the ties are resolved by the ascending order of the hash.
+        """
+
+        most_frequent_patterns = list()
+
+        for pattern_hash, pattern_support, pattern_smarts in self.iterate_pattern_counts():
+            if pattern_support < min_support:
+                continue
+
+            # The hashes are negated so that the smallest hash of a tie is retained in the min-heap.
+            heap_entry = (pattern_support, -pattern_hash, pattern_smarts, )
+
+            if k is None or len(most_frequent_patterns) < k:
+                heappush(most_frequent_patterns, heap_entry)
+
+            elif heap_entry > most_frequent_patterns[0]:
+                heappushpop(most_frequent_patterns, heap_entry)
+
+        return [
+            (-negative_pattern_hash, pattern_support, pattern_smarts, )
+            for pattern_support, negative_pattern_hash, pattern_smarts in sorted(
+                most_frequent_patterns,
+                reverse=True
+            )
+        ]
+
+    def clear(
+            self
+    ) -> None:
+        """ Delete the sorted runs and reset the counts. """
+
+        for run_file_path in self.run_file_paths:
+            _delete_run(
+                run_file_path=run_file_path
+            )
+
+        self.run_file_paths = list()
+
+        self.number_of_reactions = 0
+        self.number_of_failed_reactions = 0
@@ -1,15 +1,28 @@
 """ The ``ncsw_chemistry.reaction.utility`` package ``reactivity`` module. """
 
 from itertools import chain
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple
+
+from numpy import ndarray
 
 from rdchiral.main import rdchiralReactants, rdchiralReaction, rdchiralRun
-from rdchiral.template_extractor import extract_from_reaction
+from rdchiral.template_extractor import (
+    canonicalize_transform,
+    extract_from_reaction,
+    get_special_groups,
+    get_strict_smarts_for_atom,
+)
 
 from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdChemReactions import ChemicalReaction
 
 from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
 from ncsw_chemistry.compound.utility.bond import CompoundBondUtility
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
+from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
+from ncsw_chemistry.compound.utility.typing_ import CompoundPropertyKeysOrProfile
+from ncsw_chemistry.reaction.utility.mapping import ReactionAtomMapIndex
 
 
 class ReactionReactivityUtility:
@@ -63,155 +76,224 @@ class ReactionReactivityUtility:
             **kwargs
         )
 
+    @staticmethod
+    def apply_forward_template_using_rdkit(
+            forward_template_rxn: ChemicalReaction,
+            reactant_compound_mols: Sequence[Mol],
+            **kwargs
+    ) -> List[str]:
+        """
+        Apply a chemical reaction forward template on chemical reaction reactant compounds using the RDKit library.
+
+        :parameter forward_template_rxn: The initialized RDKit ChemicalReaction object of the chemical reaction forward
+            template.
+        :parameter reactant_compound_mols: The RDKit Mol objects of the chemical reaction reactant compounds in the
+            order of the chemical reaction forward template reactant patterns.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `rdkit.Chem.rdChemReactions.ChemicalReaction.RunReactants` }.
+
+        :returns: The unique canonical SMILES strings of the sanitizable outcomes of the application of the chemical
+            reaction forward template on the chemical reaction reactant compounds in the order of generation.
+        """
+
+        outcome_compound_smiles_strings = dict()
+
+        for product_compound_mols in forward_template_rxn.RunReactants(
+            tuple(reactant_compound_mols),
+            **kwargs
+        ):
+            product_compound_smiles_strings = list()
+
+            for product_compound_mol in product_compound_mols:
+                try:
+                    CompoundStandardizationUtility.sanitize_compound(
+                        compound_mol=product_compound_mol,
+                        deep_copy=False
+                    )
+
+                except ValueError:
+                    break
+
+                product_compound_smiles_strings.append(
+                    CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                        compound_mol=CompoundAtomUtility.remove_atom_map_numbers(
+                            compound_mol=product_compound_mol,
+                            deep_copy=False
+                        )
+                    )
+                )
+
+            else:
+                outcome_compound_smiles_strings.setdefault(
+                    ".".join(sorted(product_compound_smiles_strings)),
+                    None
+                )
+
+        return list(outcome_compound_smiles_strings.keys())
+
+    @staticmethod
+    def _get_bond_atom_map_number_table(
+            compound_mol: Mol,
+            compound_atom_map_numbers: List[int]
+    ) -> Dict[frozenset, list]:
+        """
+        Get the table of the chemical compound bonds between the mapped atoms indexed by the atom map numbers.
+
+        :parameter compound_mol: The RDKit Mol object of the chemical compound.
+        :parameter compound_atom_map_numbers: The atom map numbers of the chemical compound.
+
+        :returns: The chemical compound bonds per unordered pair of the atom map numbers.
+        """
+
+        bond_atom_map_number_table = dict()
+
+        for compound_bond in compound_mol.GetBonds():
+            begin_atom_map_number = compound_atom_map_numbers[compound_bond.GetBeginAtomIdx()]
+            end_atom_map_number = compound_atom_map_numbers[compound_bond.GetEndAtomIdx()]
+
+            if begin_atom_map_number != 0 and end_atom_map_number != 0:
+                bond_atom_map_number_table.setdefault(
+                    frozenset({begin_atom_map_number, end_atom_map_number, }),
+                    list()
+                ).append(
+                    compound_bond
+                )
+
+        return bond_atom_map_number_table
+
     @staticmethod
     def get_synthon_atom_map_numbers(
             mapped_reactant_compound_mol: Mol,
             mapped_product_compound_mol: Mol,
-            atom_property_keys: Optional[Sequence[str]] = None,
-            bond_atom_property_keys: Optional[Sequence[str]] = None,
-            bond_property_keys: Optional[Sequence[str]] = None
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            reactant_compound_atom_map_numbers: Optional[ndarray] = None,
+            product_compound_atom_map_numbers: Optional[ndarray] = None
     ) -> Set[int]:
         """
         Get the synthon atom map numbers of the mapped chemical reaction reactant and product compounds.
 
         :parameter mapped_reactant_compound_mol: The RDKit Mol object of the mapped chemical reaction reactant compound.
         :parameter mapped_product_compound_mol: The RDKit Mol object of mapped chemical reaction product compound.
-        :parameter atom_property_keys: The keys of the chemical reaction compound atom properties that should be
-            utilized in the property ID. The value `None` indicates that all chemical reaction compound atom properties
-            should be utilized in the property ID.
-        :parameter bond_atom_property_keys: The keys of the chemical reaction compound bond atom properties that should
-            be utilized in the property ID. The value `None` indicates that all chemical reaction compound bond atom
-            properties should be utilized in the property ID.
-        :parameter bond_property_keys: The keys of the chemical reaction compound bond properties that should be
-            utilized in the property ID. The value `None` indicates that all chemical reaction compound bond properties
-            should be utilized in the property ID.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound atom properties should be utilized in the property ID.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized in the property ID. The value `None` indicates that all chemical
+            reaction compound bond atom properties should be utilized in the property ID.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound bond properties should be utilized in the property ID.
+        :parameter reactant_compound_atom_map_numbers: The precomputed atom map numbers of the mapped chemical reaction
+            reactant compound. The value `None` indicates that the atom map numbers should be computed.
+        :parameter product_compound_atom_map_numbers: The precomputed atom map numbers of the mapped chemical reaction
+            product compound. The value `None` indicates that the atom map numbers should be computed.
 
         :returns: The synthon atom map numbers of the mapped chemical reaction reactant and product compounds.
         """
 
-        reactant_compound_bond_atom_map_numbers = set()
+        if reactant_compound_atom_map_numbers is None:
+            reactant_compound_atom_map_numbers = CompoundAtomUtility.get_atom_map_numbers(
+                compound_mol=mapped_reactant_compound_mol
+            )
+
+        if product_compound_atom_map_numbers is None:
+            product_compound_atom_map_numbers = CompoundAtomUtility.get_atom_map_numbers(
+                compound_mol=mapped_product_compound_mol
+            )
 
-        for reactant_compound_bond in mapped_reactant_compound_mol.GetBonds():
-            if reactant_compound_bond.GetBeginAtom().HasProp(
-                key="molAtomMapNumber"
-            ) and reactant_compound_bond.GetEndAtom().HasProp(
-                key="molAtomMapNumber"
-            ):
-                reactant_compound_bond_atom_map_numbers.add(
-                    frozenset({
-                        reactant_compound_bond.GetBeginAtom().GetAtomMapNum(),
-                        reactant_compound_bond.GetEndAtom().GetAtomMapNum(),
-                    })
-                )
+        reactant_compound_atom_map_numbers = reactant_compound_atom_map_numbers.tolist()
+        product_compound_atom_map_numbers = product_compound_atom_map_numbers.tolist()
 
-        product_compound_bond_atom_map_numbers = set()
+        reactant_compound_bond_table = ReactionReactivityUtility._get_bond_atom_map_number_table(
+            compound_mol=mapped_reactant_compound_mol,
+            compound_atom_map_numbers=reactant_compound_atom_map_numbers
+        )
 
-        for product_compound_bond in mapped_product_compound_mol.GetBonds():
-            if product_compound_bond.GetBeginAtom().HasProp(
-                key="molAtomMapNumber"
-            ) and product_compound_bond.GetEndAtom().HasProp(
-                key="molAtomMapNumber"
-            ):
-                product_compound_bond_atom_map_numbers.add(
-                    frozenset({
-                        product_compound_bond.GetBeginAtom().GetAtomMapNum(),
-                        product_compound_bond.GetEndAtom().GetAtomMapNum(),
-                    })
-                )
+        product_compound_bond_table = ReactionReactivityUtility._get_bond_atom_map_number_table(
+            compound_mol=mapped_product_compound_mol,
+            compound_atom_map_numbers=product_compound_atom_map_numbers
+        )
 
         non_synthon_bond_atom_map_numbers = set(
             chain.from_iterable(
-                reactant_compound_bond_atom_map_numbers.symmetric_difference(
-                    product_compound_bond_atom_map_numbers
-                )
+                reactant_compound_bond_table.keys() ^ product_compound_bond_table.keys()
             )
         )
 
         synthon_bond_atom_map_numbers = set()
 
-        for reactant_compound_bond in mapped_reactant_compound_mol.GetBonds():
-            if reactant_compound_bond.GetBeginAtom().HasProp(
-                key="molAtomMapNumber"
-            ) and reactant_compound_bond.GetEndAtom().HasProp(
-                key="molAtomMapNumber"
-            ):
-                for product_compound_bond in mapped_product_compound_mol.GetBonds():
-                    if product_compound_bond.GetBeginAtom().HasProp(
-                        key="molAtomMapNumber"
-                    ) and product_compound_bond.GetEndAtom().HasProp(
-                        key="molAtomMapNumber"
+        for bond_atom_map_numbers, reactant_compound_bonds in reactant_compound_bond_table.items():
+            if bond_atom_map_numbers not in product_compound_bond_table.keys():
+                continue
+
+            for reactant_compound_bond in reactant_compound_bonds:
+                reactant_compound_bond_property_id = CompoundBondUtility.get_bond_property_id(
+                    bond=reactant_compound_bond,
+                    bond_atom_property_keys=bond_atom_property_keys,
+                    bond_property_keys=bond_property_keys
+                )
+
+                for product_compound_bond in product_compound_bond_table[bond_atom_map_numbers]:
+                    if reactant_compound_bond_property_id == CompoundBondUtility.get_bond_property_id(
+                        bond=product_compound_bond,
+                        bond_atom_property_keys=bond_atom_property_keys,
+                        bond_property_keys=bond_property_keys
                     ):
-                        if {
-                            reactant_compound_bond.GetBeginAtom().GetAtomMapNum(),
-                            reactant_compound_bond.GetEndAtom().GetAtomMapNum(),
-                        } == {
-                            product_compound_bond.GetBeginAtom().GetAtomMapNum(),
-                            product_compound_bond.GetEndAtom().GetAtomMapNum(),
-                        }:
-                            if CompoundBondUtility.get_bond_property_id(
-                                bond=reactant_compound_bond,
-                                bond_atom_property_keys=bond_atom_property_keys,
-                                bond_property_keys=bond_property_keys
-                            ) == CompoundBondUtility.get_bond_property_id(
-                                bond=product_compound_bond,
-                                bond_atom_property_keys=bond_atom_property_keys,
-                                bond_property_keys=bond_property_keys
-                            ):
-                                synthon_bond_atom_map_numbers.add(
-                                    reactant_compound_bond.GetBeginAtom().GetAtomMapNum()
-                                    # product_compound_bond.GetBeginAtom().GetAtomMapNum()
-                                )
-
-                                synthon_bond_atom_map_numbers.add(
-                                    reactant_compound_bond.GetEndAtom().GetAtomMapNum()
-                                    # product_compound_bond.GetEndAtom().GetAtomMapNum()
-                                )
-
-                            else:
-                                non_synthon_bond_atom_map_numbers.add(
-                                    reactant_compound_bond.GetBeginAtom().GetAtomMapNum()
-                                    # product_compound_bond.GetBeginAtom().GetAtomMapNum()
-                                )
-
-                                non_synthon_bond_atom_map_numbers.add(
-                                    reactant_compound_bond.GetEndAtom().GetAtomMapNum()
-                                    # product_compound_bond.GetEndAtom().GetAtomMapNum()
-                                )
+                        synthon_bond_atom_map_numbers.update(
+                            bond_atom_map_numbers
+                        )
+
+                    else:
+                        non_synthon_bond_atom_map_numbers.update(
+                            bond_atom_map_numbers
+                        )
+
+        product_compound_atom_map_number_to_atoms = dict()
+
+        for product_compound_atom_index, product_compound_atom_map_number in enumerate(
+            product_compound_atom_map_numbers
+        ):
+            if product_compound_atom_map_number != 0:
+                product_compound_atom_map_number_to_atoms.setdefault(
+                    product_compound_atom_map_number,
+                    list()
+                ).append(
+                    mapped_product_compound_mol.GetAtomWithIdx(product_compound_atom_index)
+                )
 
         synthon_atom_map_numbers, non_synthon_atom_map_numbers = set(), set()
 
-        for reactant_compound_atom in mapped_reactant_compound_mol.GetAtoms():
+        for reactant_compound_atom_index, reactant_compound_atom_map_number in enumerate(
+            reactant_compound_atom_map_numbers
+        ):
             if (
-                reactant_compound_atom.HasProp(
-                    key="molAtomMapNumber"
-                ) and reactant_compound_atom.GetAtomMapNum() not in synthon_bond_atom_map_numbers and
-                reactant_compound_atom.GetAtomMapNum() not in non_synthon_bond_atom_map_numbers
+                reactant_compound_atom_map_number == 0 or
+                reactant_compound_atom_map_number in synthon_bond_atom_map_numbers or
+                reactant_compound_atom_map_number in non_synthon_bond_atom_map_numbers or
+                reactant_compound_atom_map_number not in product_compound_atom_map_number_to_atoms.keys()
             ):
-                for product_compound_atom in mapped_product_compound_mol.GetAtoms():
-                    if (
-                        product_compound_atom.HasProp(
-                            key="molAtomMapNumber"
-                        ) and product_compound_atom.GetAtomMapNum() not in synthon_bond_atom_map_numbers and
-                        product_compound_atom.GetAtomMapNum() not in non_synthon_bond_atom_map_numbers
-                    ):
-                        if reactant_compound_atom.GetAtomMapNum() == product_compound_atom.GetAtomMapNum():
-                            if CompoundAtomUtility.get_atom_property_id(
-                                atom=reactant_compound_atom,
-                                atom_property_keys=atom_property_keys
-                            ) == CompoundAtomUtility.get_atom_property_id(
-                                atom=product_compound_atom,
-                                atom_property_keys=atom_property_keys
-                            ):
-                                synthon_atom_map_numbers.add(
-                                    reactant_compound_atom.GetAtomMapNum()
-                                    # product_compound_atom.GetAtomMapNum()
-                                )
-
-                            else:
-                                non_synthon_atom_map_numbers.add(
-                                    reactant_compound_atom.GetAtomMapNum()
-                                    # product_compound_atom.GetAtomMapNum()
-                                )
+                continue
+
+            reactant_compound_atom_property_id = CompoundAtomUtility.get_atom_property_id(
+                atom=mapped_reactant_compound_mol.GetAtomWithIdx(reactant_compound_atom_index),
+                atom_property_keys=atom_property_keys
+            )
+
+            for product_compound_atom in product_compound_atom_map_number_to_atoms[reactant_compound_atom_map_number]:
+                if reactant_compound_atom_property_id == CompoundAtomUtility.get_atom_property_id(
+                    atom=product_compound_atom,
+                    atom_property_keys=atom_property_keys
+                ):
+                    synthon_atom_map_numbers.add(
+                        reactant_compound_atom_map_number
+                    )
+
+                else:
+                    non_synthon_atom_map_numbers.add(
+                        reactant_compound_atom_map_number
+                    )
 
         synthon_atom_map_numbers.update(
             synthon_bond_atom_map_numbers
@@ -231,9 +313,10 @@ class ReactionReactivityUtility:
     def extract_reactive_sites_and_synthons(
             mapped_reactant_compound_mols: Sequence[Mol],
             mapped_product_compound_mols: Sequence[Mol],
-            atom_property_keys: Optional[Sequence[str]] = None,
-            bond_atom_property_keys: Optional[Sequence[str]] = None,
-            bond_property_keys: Optional[Sequence[str]] = None
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            reaction_atom_map_index: Optional[ReactionAtomMapIndex] = None
     ) -> Dict[int, Tuple[Dict[int, Tuple[Set[int], Dict[int, int]]], Set[int]]]:
         """
         Extract the reactive sites and synthons of the chemical reaction reactant and product compounds.
@@ -242,84 +325,89 @@ class ReactionReactivityUtility:
             compounds.
         :parameter mapped_product_compound_mols: The RDKit Mol objects of the mapped chemical reaction product
             compounds.
-        :parameter atom_property_keys: The keys of the chemical reaction compound atom properties that should be
-            utilized in the property ID. The value `None` indicates that all chemical reaction compound atom properties
-            should be utilized in the property ID.
-        :parameter bond_atom_property_keys: The keys of the chemical reaction compound bond atom properties that should
-            be utilized in the property ID. The value `None` indicates that all chemical reaction compound bond atom
-            properties should be utilized in the property ID.
-        :parameter bond_property_keys: The keys of the chemical reaction compound bond properties that should be
-            utilized in the property ID. The value `None` indicates that all chemical reaction compound bond properties
-            should be utilized in the property ID.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound atom properties should be utilized in the property ID.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized in the property ID. The value `None` indicates that all chemical
+            reaction compound bond atom properties should be utilized in the property ID.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound bond properties should be utilized in the property ID.
+        :parameter reaction_atom_map_index: The precomputed atom map number index of the chemical reaction. The value
+            `None` indicates that the atom map number index should be computed.
 
         :returns: The reactive sites and synthons of the chemical reaction reactant and product compounds.
         """
 
-        product_compound_atom_map_number_to_index_dictionaries = dict()
-        reactant_compound_atom_map_number_to_index_dictionaries = dict()
+        if reaction_atom_map_index is None:
+            reaction_atom_map_index = ReactionAtomMapIndex(
+                mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+                mapped_product_compound_mols=mapped_product_compound_mols
+            )
 
         product_compound_reactive_sites_and_synthons = dict()
 
         for product_compound_index, product_compound_mol in enumerate(mapped_product_compound_mols):
-            if product_compound_index not in product_compound_atom_map_number_to_index_dictionaries.keys():
-                product_compound_atom_map_number_to_index_dictionaries[product_compound_index] = {
-                    product_compound_atom.GetAtomMapNum(): product_compound_atom.GetIdx()
-                    for product_compound_atom in product_compound_mol.GetAtoms()
-                }
+            product_compound_atom_map_number_to_index = (
+                reaction_atom_map_index.get_product_compound_atom_map_number_to_index(
+                    product_compound_index=product_compound_index
+                )
+            )
 
             reactant_compound_reactive_sites_and_synthons = dict()
 
+            product_compound_synthon_atom_indices = set()
+
             for reactant_compound_index, reactant_compound_mol in enumerate(mapped_reactant_compound_mols):
-                if reactant_compound_index not in reactant_compound_atom_map_number_to_index_dictionaries.keys():
-                    reactant_compound_atom_map_number_to_index_dictionaries[reactant_compound_index] = {
-                        reactant_compound_atom.GetAtomMapNum(): reactant_compound_atom.GetIdx()
-                        for reactant_compound_atom in reactant_compound_mol.GetAtoms()
-                    }
+                reactant_compound_atom_map_number_to_index = (
+                    reaction_atom_map_index.get_reactant_compound_atom_map_number_to_index(
+                        reactant_compound_index=reactant_compound_index
+                    )
+                )
 
                 synthon_atom_map_numbers = ReactionReactivityUtility.get_synthon_atom_map_numbers(
                     mapped_reactant_compound_mol=reactant_compound_mol,
                     mapped_product_compound_mol=product_compound_mol,
                     atom_property_keys=atom_property_keys,
                     bond_atom_property_keys=bond_atom_property_keys,
-                    bond_property_keys=bond_property_keys
+                    bond_property_keys=bond_property_keys,
+                    reactant_compound_atom_map_numbers=reaction_atom_map_index.reactant_compound_atom_map_numbers[
+                        reactant_compound_index
+                    ],
+                    product_compound_atom_map_numbers=reaction_atom_map_index.product_compound_atom_map_numbers[
+                        product_compound_index
+                    ]
                 )
 
-                reactant_compound_reactive_site_atom_indices, reactant_compound_synthon_atom_indices = set(), dict()
+                reactant_compound_reactive_site_atom_indices = (
+                    reaction_atom_map_index.get_reactant_compound_atom_indices_not_in(
+                        reactant_compound_index=reactant_compound_index,
+                        atom_map_numbers=synthon_atom_map_numbers
+                    )
+                )
 
-                for reactant_compound_atom in reactant_compound_mol.GetAtoms():
-                    if reactant_compound_atom.GetAtomMapNum() not in synthon_atom_map_numbers:
-                        reactant_compound_reactive_site_atom_indices.add(
-                            reactant_compound_atom.GetIdx()
-                        )
+                reactant_compound_synthon_atom_indices = {
+                    reactant_compound_atom_map_number_to_index[synthon_atom_map_number]:
+                        product_compound_atom_map_number_to_index[synthon_atom_map_number]
+                    for synthon_atom_map_number in synthon_atom_map_numbers
+                    if synthon_atom_map_number in reactant_compound_atom_map_number_to_index.keys()
+                }
 
-                for synthon_atom_map_number in synthon_atom_map_numbers:
-                    if synthon_atom_map_number in reactant_compound_atom_map_number_to_index_dictionaries[
-                        reactant_compound_index
-                    ].keys():
-                        reactant_compound_synthon_atom_indices[
-                            reactant_compound_atom_map_number_to_index_dictionaries[
-                                reactant_compound_index
-                            ][synthon_atom_map_number]
-                        ] = product_compound_atom_map_number_to_index_dictionaries[
-                            product_compound_index
-                        ][synthon_atom_map_number]
+                product_compound_synthon_atom_indices.update(
+                    reactant_compound_synthon_atom_indices.values()
+                )
 
                 reactant_compound_reactive_sites_and_synthons[reactant_compound_index] = (
                     reactant_compound_reactive_site_atom_indices,
                     reactant_compound_synthon_atom_indices,
                 )
 
-            product_compound_reactive_site_atom_indices = set()
-
-            for product_compound_atom in product_compound_mol.GetAtoms():
-                if not any(
-                    product_compound_atom.GetIdx() in reactant_compound_synthon_atom_indices.values()
-                    for _, reactant_compound_synthon_atom_indices in
-                    reactant_compound_reactive_sites_and_synthons.values()
-                ):
-                    product_compound_reactive_site_atom_indices.add(
-                        product_compound_atom.GetIdx()
-                    )
+            product_compound_reactive_site_atom_indices = set(
+                range(product_compound_mol.GetNumAtoms())
+            ).difference(
+                product_compound_synthon_atom_indices
+            )
 
             product_compound_reactive_sites_and_synthons[product_compound_index] = (
                 reactant_compound_reactive_sites_and_synthons,
@@ -327,3 +415,237 @@ class ReactionReactivityUtility:
             )
 
         return product_compound_reactive_sites_and_synthons
+
+    @staticmethod
+    def get_retro_template_specificity_levels() -> Dict[str, Tuple[int, bool, Optional[str]]]:
+        """
+        Get the chemical reaction retro template specificity levels.
+
+        :returns: The chemical reaction retro template specificity levels with the radius around the reaction center,
+            the indicator of whether the special groups should be included, and the key of the more general parent
+            specificity level.
+        """
+
+        return {
+            "reaction_center": (0, False, None, ),
+            "reaction_center_special_groups": (0, True, "reaction_center", ),
+            "radius_1": (1, False, "reaction_center", ),
+            "radius_1_special_groups": (1, True, "radius_1", ),
+            "radius_2": (2, False, "radius_1", ),
+            "radius_2_special_groups": (2, True, "radius_2", ),
+        }
+
+    @staticmethod
+    def extract_retro_templates_at_specificity_levels(
+            mapped_reactant_compound_mols: Sequence[Mol],
+            mapped_product_compound_mols: Sequence[Mol],
+            retro_template_specificity_level_keys: Optional[Collection[str]] = None,
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract the retro templates of a chemical reaction at multiple specificity levels in a single pass.
+
+        :parameter mapped_reactant_compound_mols: The RDKit Mol objects of the sanitized mapped chemical reaction
+            reactant compounds.
+        :parameter mapped_product_compound_mols: The RDKit Mol objects of the sanitized mapped chemical reaction
+            product compounds.
+        :parameter retro_template_specificity_level_keys: The keys of the chemical reaction retro template specificity
+            levels that should be extracted. The value `None` indicates that all chemical reaction retro template
+            specificity levels should be extracted.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized to detect the reaction center. The value `None` indicates that all
+            chemical reaction compound atom properties should be utilized.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized to detect the reaction center. The value `None` indicates that all
+            chemical reaction compound bond atom properties should be utilized.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized to detect the reaction center. The value `None` indicates that all
+            chemical reaction compound bond properties should be utilized.
+
+        :returns: The chemical reaction retro template SMARTS strings per specificity level. The value `None` indicates
+            that the chemical reaction retro template could not be extracted at the specificity level.
+        """
+
+        retro_template_specificity_levels = ReactionReactivityUtility.get_retro_template_specificity_levels()
+
+        if retro_template_specificity_level_keys is None:
+            retro_template_specificity_level_keys = retro_template_specificity_levels.keys()
+
+        reactive_sites_and_synthons = ReactionReactivityUtility.extract_reactive_sites_and_synthons(
+            mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+            mapped_product_compound_mols=mapped_product_compound_mols,
+            atom_property_keys=atom_property_keys,
+            bond_atom_property_keys=bond_atom_property_keys,
+            bond_property_keys=bond_property_keys
+        )
+
+        atom_map_number_to_product_compound_index = dict()
+
+        for product_compound_index, product_compound_mol in enumerate(mapped_product_compound_mols):
+            for product_compound_atom in product_compound_mol.GetAtoms():
+                if product_compound_atom.GetAtomMapNum() != 0:
+                    atom_map_number_to_product_compound_index[
+                        product_compound_atom.GetAtomMapNum()
+                    ] = product_compound_index
+
+        # The reaction center consists of the reactive site atoms of each reactant compound with respect to the product
+        # compound that contains the same atom map number, and the unmapped atoms of the contributing reactant
+        # compounds.
+        reactant_compound_center_atom_indices = dict()
+
+        for reactant_compound_index, reactant_compound_mol in enumerate(mapped_reactant_compound_mols):
+            if not any(
+                reactant_compound_atom.GetAtomMapNum() in atom_map_number_to_product_compound_index.keys()
+                for reactant_compound_atom in reactant_compound_mol.GetAtoms()
+            ):
+                continue
+
+            reactant_compound_center_atom_indices[reactant_compound_index] = {
+                reactant_compound_atom.GetIdx()
+                for reactant_compound_atom in reactant_compound_mol.GetAtoms()
+                if reactant_compound_atom.GetAtomMapNum() not in atom_map_number_to_product_compound_index.keys() or
+                reactant_compound_atom.GetIdx() in reactive_sites_and_synthons[
+                    atom_map_number_to_product_compound_index[reactant_compound_atom.GetAtomMapNum()]
+                ][0][reactant_compound_index][0]
+            }
+
+        product_compound_unmapped_center_atom_indices = {
+            product_compound_index: {
+                product_compound_atom_index
+                for product_compound_atom_index in reactive_sites_and_synthons[product_compound_index][1]
+                if mapped_product_compound_mols[product_compound_index].GetAtomWithIdx(
+                    product_compound_atom_index
+                ).GetAtomMapNum() == 0
+            } for product_compound_index in range(len(mapped_product_compound_mols))
+        }
+
+        center_atom_map_numbers = {
+            mapped_reactant_compound_mols[reactant_compound_index].GetAtomWithIdx(
+                reactant_compound_atom_index
+            ).GetAtomMapNum()
+            for reactant_compound_index, reactant_compound_atom_indices in reactant_compound_center_atom_indices.items()
+            for reactant_compound_atom_index in reactant_compound_atom_indices
+        }.union(
+            mapped_product_compound_mols[product_compound_index].GetAtomWithIdx(
+                product_compound_atom_index
+            ).GetAtomMapNum()
+            for product_compound_index, (_, product_compound_atom_indices) in reactive_sites_and_synthons.items()
+            for product_compound_atom_index in product_compound_atom_indices
+        ).difference({0, })
+
+        if len(center_atom_map_numbers) == 0:
+            return dict.fromkeys(retro_template_specificity_level_keys, None)
+
+        # The atom symbols and the copies without the atom map numbers are prepared once for all specificity levels,
+        # which ensures that the canonical atom ranks do not depend on the atom map numbers.
+        compound_atom_symbols, unmapped_compound_mols = dict(), dict()
+
+        for compound_key, compound_mol in chain(
+            (
+                (("reactant", reactant_compound_index, ), mapped_reactant_compound_mols[reactant_compound_index], )
+                for reactant_compound_index in reactant_compound_center_atom_indices.keys()
+            ), (
+                (("product", product_compound_index, ), product_compound_mol, )
+                for product_compound_index, product_compound_mol in enumerate(mapped_product_compound_mols)
+            )
+        ):
+            compound_atom_symbols[compound_key] = [
+                get_strict_smarts_for_atom(atom) if (
+                    atom.GetAtomMapNum() in center_atom_map_numbers or atom.GetAtomMapNum() == 0
+                ) else "[{atom_symbol}:{atom_map_number}]".format(
+                    atom_symbol=atom.GetSymbol().lower() if atom.GetIsAromatic() else atom.GetSymbol(),
+                    atom_map_number=atom.GetAtomMapNum()
+                ) for atom in compound_mol.GetAtoms()
+            ]
+
+            unmapped_compound_mols[compound_key] = CompoundAtomUtility.remove_atom_map_numbers(
+                compound_mol=compound_mol
+            )
+
+        reactant_compound_special_groups = {
+            reactant_compound_index: get_special_groups(
+                mapped_reactant_compound_mols[reactant_compound_index]
+            ) for reactant_compound_index in reactant_compound_center_atom_indices.keys()
+        }
+
+        retro_templates = dict()
+
+        for retro_template_specificity_level_key in retro_template_specificity_level_keys:
+            radius, include_special_groups, _ = retro_template_specificity_levels[retro_template_specificity_level_key]
+
+            reactant_compound_atom_indices, level_atom_map_numbers = dict(), set()
+
+            for reactant_compound_index, center_atom_indices in reactant_compound_center_atom_indices.items():
+                reactant_compound_mol = mapped_reactant_compound_mols[reactant_compound_index]
+
+                atom_indices, frontier_atom_indices = set(center_atom_indices), set(center_atom_indices)
+
+                for _ in range(radius):
+                    frontier_atom_indices = {
+                        neighbor_atom.GetIdx()
+                        for atom_index in frontier_atom_indices
+                        for neighbor_atom in reactant_compound_mol.GetAtomWithIdx(atom_index).GetNeighbors()
+                    }.difference(atom_indices)
+
+                    atom_indices.update(frontier_atom_indices)
+
+                if include_special_groups:
+                    for special_group_trigger_atom_indices, special_group_atom_indices in (
+                        reactant_compound_special_groups[reactant_compound_index]
+                    ):
+                        if not center_atom_indices.isdisjoint(special_group_trigger_atom_indices):
+                            atom_indices.update(special_group_atom_indices)
+
+                reactant_compound_atom_indices[reactant_compound_index] = atom_indices
+
+                level_atom_map_numbers.update(
+                    reactant_compound_mol.GetAtomWithIdx(atom_index).GetAtomMapNum()
+                    for atom_index in atom_indices
+                )
+
+            level_atom_map_numbers.discard(0)
+
+            compound_fragments = {"reactant": list(), "product": list(), }
+
+            for compound_key, atom_indices in chain(
+                (
+                    (("reactant", reactant_compound_index, ), atom_indices, )
+                    for reactant_compound_index, atom_indices in reactant_compound_atom_indices.items()
+                ), (
+                    (("product", product_compound_index, ), {
+                        product_compound_atom.GetIdx()
+                        for product_compound_atom in product_compound_mol.GetAtoms()
+                        if product_compound_atom.GetAtomMapNum() in level_atom_map_numbers
+                    }.union(product_compound_unmapped_center_atom_indices[product_compound_index]), )
+                    for product_compound_index, product_compound_mol in enumerate(mapped_product_compound_mols)
+                )
+            ):
+                if len(atom_indices) > 0:
+                    compound_fragments[compound_key[0]].append(
+                        "(" + CompoundSubstructureUtility.get_substructure_smiles(
+                            compound_mol=unmapped_compound_mols[compound_key],
+                            substructure_atom_indices=sorted(atom_indices),
+                            atomSymbols=compound_atom_symbols[compound_key],
+                            allHsExplicit=True,
+                            isomericSmiles=True,
+                            allBondsExplicit=True
+                        ) + ")"
+                    )
+
+            if len(compound_fragments["reactant"]) == 0 or len(compound_fragments["product"]) == 0:
+                retro_templates[retro_template_specificity_level_key] = None
+
+                continue
+
+            reactant_fragments, product_fragments = canonicalize_transform(
+                ".".join(compound_fragments["reactant"]) + ">>" + ".".join(compound_fragments["product"])
+            ).split(">>")
+
+            retro_templates[retro_template_specificity_level_key] = "{product_fragments}>>{reactant_fragments}".format(
+                product_fragments=product_fragments[1:-1].replace(").(", "."),
+                reactant_fragments=reactant_fragments[1:-1].replace(").(", ".")
+            )
+
+        return retro_templates
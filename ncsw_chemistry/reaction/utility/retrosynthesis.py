@@ -0,0 +1,699 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``retrosynthesis`` module. """
+
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
+from sys import getsizeof
+from time import perf_counter
+from typing import Callable, Container, List, Optional, Sequence, Tuple
+
+from rdchiral.main import rdchiralReactants, rdchiralRun
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.execution.worker import get_cached_rdchiral_reaction
+from ncsw_chemistry.reaction.utility.applicability import (
+    ReactionCenterEnvironmentIndex,
+    ReactionTemplateApplicabilityIndex,
+)
+from ncsw_chemistry.reaction.utility.typing_ import ReactionRetrosynthesisExpansionTuple
+
+
+class ReactionRetrosynthesisExpander:
+    """ The chemical reaction retrosynthesis single-step expander class. """
+
+    def __init__(
+            self,
+            retro_template_smarts_strings: Sequence[str],
+            retro_template_applicability_index: Optional[ReactionTemplateApplicabilityIndex] = None,
+            reaction_center_environment_index: Optional[ReactionCenterEnvironmentIndex] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter retro_template_smarts_strings: The chemical reaction retro template SMARTS strings. The position of
+            each chemical reaction retro template is utilized as its ID.
+        :parameter retro_template_applicability_index: The chemical reaction template applicability index of the
+            chemical reaction retro templates. The value `None` indicates that all chemical reaction retro templates
+            should be applied on each chemical compound.
+        :parameter reaction_center_environment_index: The chemical reaction retro template reaction center environment
+            index of the chemical reaction retro templates. The value `None` indicates that the chemical reaction retro
+            templates should not be filtered by their reaction center environments.
+        """
+
+        self.retro_template_smarts_strings = retro_template_smarts_strings
+        self.retro_template_applicability_index = retro_template_applicability_index
+        self.reaction_center_environment_index = reaction_center_environment_index
+
+    def expand_and_get_failures(
+            self,
+            compound_smiles: str
+    ) -> Tuple[ReactionRetrosynthesisExpansionTuple, Optional[Tuple[int, ...]]]:
+        """
+        Expand a chemical compound by applying the chemical reaction retro templates and get the failures. The compiled
+        chemical reaction retro templates are cached in the least recently used cache of the current worker thread,
+        whose size is defined by ``ncsw_chemistry.execution.worker.worker_retro_template_cache_size``.
+
+        :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+
+        :returns: The pairs of the chemical reaction retro template indices and the canonical SMILES strings of the
+            precursor chemical compounds, and the indices of the chemical reaction retro templates that could not be
+            compiled or applied. The value `None` instead of the indices indicates that the chemical compound could not
+            be prepared for the expansion.
+        """
+
+        if self.retro_template_applicability_index is None and self.reaction_center_environment_index is None:
+            retro_template_indices = range(len(self.retro_template_smarts_strings))
+
+        else:
+            compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                compound_smiles=compound_smiles
+            )
+
+            if compound_mol is None:
+                return tuple(), None
+
+            retro_template_indices = None
+
+            if self.retro_template_applicability_index is not None:
+                retro_template_indices = self.retro_template_applicability_index.get_candidate_retro_template_indices(
+                    compound_mol=compound_mol
+                )
+
+            if self.reaction_center_environment_index is not None:
+                retro_template_indices = self.reaction_center_environment_index.get_candidate_retro_template_indices(
+                    compound_mol=compound_mol,
+                    retro_template_indices=retro_template_indices
+                )
+
+            retro_template_indices = retro_template_indices.tolist()
+
+        try:
+            compound_reactants = rdchiralReactants(
+                reactant_smiles=compound_smiles
+            )
+
+        except Exception:
+            return tuple(), None
+
+        expansions, failed_retro_template_indices = list(), list()
+
+        for retro_template_index in retro_template_indices:
+            try:
+                outcomes = rdchiralRun(
+                    rxn=get_cached_rdchiral_reaction(
+                        retro_template_smarts=self.retro_template_smarts_strings[retro_template_index]
+                    ),
+                    reactants=compound_reactants
+                )
+
+            except Exception:
+                failed_retro_template_indices.append(
+                    retro_template_index
+                )
+
+                continue
+
+            for outcome in outcomes:
+                expansions.append((
+                    retro_template_index,
+                    tuple(sorted(outcome.split(
+                        sep="."
+                    ))),
+                ))
+
+        return tuple(expansions), tuple(failed_retro_template_indices)
+
+    def expand(
+            self,
+            compound_smiles: str
+    ) -> ReactionRetrosynthesisExpansionTuple:
+        """
+        Expand a chemical compound by applying the chemical reaction retro templates.
+
+        :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+
+        :returns: The pairs of the chemical reaction retro template indices and the canonical SMILES strings of the
+            precursor chemical compounds.
+        """
+
+        return self.expand_and_get_failures(
+            compound_smiles=compound_smiles
+        )[0]
+
+
+_worker_retro_template_expander: Optional[ReactionRetrosynthesisExpander] = None
+
+
+def _initialize_worker(
+        retro_template_smarts_strings: Sequence[str],
+        retro_template_applicability_index: Optional[ReactionTemplateApplicabilityIndex],
+        reaction_center_environment_index: Optional[ReactionCenterEnvironmentIndex]
+) -> None:
+    """
+    Initialize the chemical reaction retrosynthesis worker process.
+
+    :parameter retro_template_smarts_strings: The chemical reaction retro template SMARTS strings.
+    :parameter retro_template_applicability_index: The chemical reaction template applicability index.
+    :parameter reaction_center_environment_index: The chemical reaction retro template reaction center environment
+        index.
+    """
+
+    global _worker_retro_template_expander
+
+    _worker_retro_template_expander = ReactionRetrosynthesisExpander(
+        retro_template_smarts_strings=retro_template_smarts_strings,
+        retro_template_applicability_index=retro_template_applicability_index,
+        reaction_center_environment_index=reaction_center_environment_index
+    )
+
+
+def _expand_in_worker(
+        compound_smiles: str
+) -> Tuple[ReactionRetrosynthesisExpansionTuple, Optional[Tuple[int, ...]]]:
+    """
+    Expand a chemical compound in the chemical reaction retrosynthesis worker process.
+
+    :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+
+    :returns: The pairs of the chemical reaction retro template indices and the canonical SMILES strings of the
+        precursor chemical compounds, and the indices of the failed chemical reaction retro templates.
+    """
+
+    return _worker_retro_template_expander.expand_and_get_failures(
+        compound_smiles=compound_smiles
+    )
+
+
+class ReactionRetrosynthesisSearchResult:
+    """ The chemical reaction retrosynthesis search result class. """
+
+    def __init__(
+            self
+    ) -> None:
+        """ The constructor method of the class. """
+
+        self.compound_smiles_to_node_index = dict()
+
+        self.node_compound_smiles = list()
+        self.node_depths = list()
+        self.node_expansions = dict()
+        self.terminal_node_indices = set()
+
+        self.retro_template_failure_counts = dict()
+
+        self.number_of_expanded_nodes = 0
+        self.number_of_failed_compound_expansions = 0
+        self.number_of_memo_hits = 0
+        self.elapsed_time = 0.0
+
+    def add_node(
+            self,
+            compound_smiles: str,
+            depth: int
+    ) -> Tuple[int, bool]:
+        """
+        Add a node to the transposition table if it does not exist yet, or update the depth of the existing node if it
+        is reached at a smaller depth. The existing node that is reached at a smaller depth is no longer terminal, as it
+        might have been marked as terminal only because of its depth.
+
+        :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+        :parameter depth: The depth of the node.
+
+        :returns: The index of the node and the indicator of whether the node is new or reached at a smaller depth,
+            which indicates that the node should be expanded.
+        """
+
+        if compound_smiles in self.compound_smiles_to_node_index.keys():
+            node_index = self.compound_smiles_to_node_index[compound_smiles]
+
+            if depth < self.node_depths[node_index]:
+                self.node_depths[node_index] = depth
+
+                self.terminal_node_indices.discard(
+                    node_index
+                )
+
+                return node_index, True
+
+            return node_index, False
+
+        node_index = len(self.node_compound_smiles)
+
+        self.compound_smiles_to_node_index[compound_smiles] = node_index
+        self.node_compound_smiles.append(compound_smiles)
+        self.node_depths.append(depth)
+
+        return node_index, True
+
+    @property
+    def number_of_nodes(
+            self
+    ) -> int:
+        """
+        Get the number of nodes in the transposition table.
+
+        :returns: The number of nodes in the transposition table.
+        """
+
+        return len(self.node_compound_smiles)
+
+    @property
+    def number_of_expanded_nodes_per_second(
+            self
+    ) -> float:
+        """
+        Get the search throughput.
+
+        :returns: The number of expanded nodes per second.
+        """
+
+        return self.number_of_expanded_nodes / self.elapsed_time if self.elapsed_time > 0.0 else 0.0
+
+    def get_memory_usage_per_node(
+            self
+    ) -> float:
+        """
+        Get the approximate memory usage of the search result per node.
+
+        :returns: The approximate memory usage of the search result per node in bytes.
+        """
+
+        if self.number_of_nodes == 0:
+            return 0.0
+
+        memory_usage = (
+            getsizeof(self.compound_smiles_to_node_index) + getsizeof(self.node_compound_smiles) +
+            getsizeof(self.node_depths) + getsizeof(self.node_expansions) + getsizeof(self.terminal_node_indices) +
+            sum(getsizeof(compound_smiles) for compound_smiles in self.node_compound_smiles)
+        )
+
+        for node_expansions in self.node_expansions.values():
+            memory_usage += getsizeof(node_expansions) + sum(
+                getsizeof(node_expansion) + getsizeof(node_expansion[1])
+                for node_expansion in node_expansions
+            )
+
+        return memory_usage / self.number_of_nodes
+
+    def get_expansions(
+            self,
+            compound_smiles: str
+    ) -> List[Tuple[int, Tuple[str, ...]]]:
+        """
+        Get the expansions of a chemical compound node.
+
+        :parameter compound_smiles: The canonical SMILES string of the chemical compound.
+
+        :returns: The pairs of the chemical reaction retro template indices and the canonical SMILES strings of the
+            precursor chemical compounds.
+        """
+
+        return [
+            (retro_template_index, tuple(
+                self.node_compound_smiles[precursor_node_index]
+                for precursor_node_index in precursor_node_indices
+            ), )
+            for retro_template_index, precursor_node_indices in self.node_expansions.get(
+                self.compound_smiles_to_node_index.get(compound_smiles, -1), ()
+            )
+        ]
+
+
+class ReactionRetrosynthesisExpansionEngine:
+    """ The chemical reaction multi-step retrosynthesis expansion engine class. """
+
+    search_modes = ("best_first", "breadth_first", "depth_first", )
+
+    def __init__(
+            self,
+            retro_template_smarts_strings: Sequence[str],
+            retro_template_applicability_index: Optional[ReactionTemplateApplicabilityIndex] = None,
+            reaction_center_environment_index: Optional[ReactionCenterEnvironmentIndex] = None,
+            memo_size: int = 100000,
+            max_workers: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter retro_template_smarts_strings: The chemical reaction retro template SMARTS strings. The position of
+            each chemical reaction retro template is utilized as its ID.
+        :parameter retro_template_applicability_index: The chemical reaction template applicability index of the
+            chemical reaction retro templates. The value `None` indicates that all chemical reaction retro templates
+            should be applied on each chemical compound.
+        :parameter reaction_center_environment_index: The chemical reaction retro template reaction center environment
+            index of the chemical reaction retro templates. The value `None` indicates that the chemical reaction retro
+            templates should not be filtered by their reaction center environments.
+        :parameter memo_size: The maximum number of chemical compound expansions that should be memoized across
+            searches.
+        :parameter max_workers: The number of worker processes utilized for the parallel expansion of nodes. The value
+            `None` indicates that the nodes should be expanded in the current process.
+        """
+
+        self.expander = ReactionRetrosynthesisExpander(
+            retro_template_smarts_strings=retro_template_smarts_strings,
+            retro_template_applicability_index=retro_template_applicability_index,
+            reaction_center_environment_index=reaction_center_environment_index
+        )
+
+        self.memo_size = memo_size
+        self.max_workers = max_workers
+
+        self._memo = OrderedDict()
+        self._executor = None
+
+    def __enter__(
+            self
+    ) -> "ReactionRetrosynthesisExpansionEngine":
+        """
+        Enter the runtime context of the engine.
+
+        :returns: The chemical reaction multi-step retrosynthesis expansion engine.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ Exit the runtime context of the engine and shut down the worker processes. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Shut down the worker processes of the engine. """
+
+        if self._executor is not None:
+            self._executor.shutdown()
+
+            self._executor = None
+
+    @staticmethod
+    def get_building_block_stopping_criterion(
+            building_block_compound_smiles_strings: Container[str]
+    ) -> Callable[[str, int], bool]:
+        """
+        Get the stopping criterion that marks the building block chemical compounds as terminal nodes.
+
+        :parameter building_block_compound_smiles_strings: The canonical SMILES strings of the building block chemical
+            compounds, or any container that supports the membership test.
+
+        :returns: The stopping criterion.
+        """
+
+        return lambda compound_smiles, depth: compound_smiles in building_block_compound_smiles_strings
+
+    @staticmethod
+    def get_depth_stopping_criterion(
+            max_depth: int
+    ) -> Callable[[str, int], bool]:
+        """
+        Get the stopping criterion that marks the nodes at the maximum depth as terminal nodes.
+
+        :parameter max_depth: The maximum depth of the search.
+
+        :returns: The stopping criterion.
+        """
+
+        return lambda compound_smiles, depth: depth >= max_depth
+
+    @staticmethod
+    def get_time_budget_stopping_criterion(
+            time_budget: float
+    ) -> Callable[["ReactionRetrosynthesisSearchResult"], bool]:
+        """
+        Get the stopping criterion that terminates the search once the time budget is exhausted.
+
+        :parameter time_budget: The time budget of the search in seconds.
+
+        :returns: The stopping criterion.
+        """
+
+        return lambda search_result: search_result.elapsed_time >= time_budget
+
+    def _expand_compounds(
+            self,
+            compound_smiles_strings: Sequence[str],
+            search_result: ReactionRetrosynthesisSearchResult
+    ) -> List[ReactionRetrosynthesisExpansionTuple]:
+        """
+        Expand the chemical compounds using the memo and, if configured, the worker processes.
+
+        :parameter compound_smiles_strings: The canonical SMILES strings of the chemical compounds.
+        :parameter search_result: The chemical reaction retrosynthesis search result.
+
+        :returns: The expansions of the chemical compounds.
+        """
+
+        compound_expansions, missed_compound_smiles_strings = dict(), list()
+
+        for compound_smiles in compound_smiles_strings:
+            if compound_smiles in self._memo.keys():
+                self._memo.move_to_end(
+                    key=compound_smiles
+                )
+
+                compound_expansions[compound_smiles] = self._memo[compound_smiles]
+
+                search_result.number_of_memo_hits += 1
+
+            else:
+                missed_compound_smiles_strings.append(
+                    compound_smiles
+                )
+
+        if self.max_workers is None or len(missed_compound_smiles_strings) < 2:
+            missed_compound_expansions = map(self.expander.expand_and_get_failures, missed_compound_smiles_strings)
+
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_initialize_worker,
+                    initargs=(
+                        self.expander.retro_template_smarts_strings,
+                        self.expander.retro_template_applicability_index,
+                        self.expander.reaction_center_environment_index,
+                    )
+                )
+
+            missed_compound_expansions = self._executor.map(
+                _expand_in_worker,
+                missed_compound_smiles_strings,
+                chunksize=max(1, len(missed_compound_smiles_strings) // (4 * self.max_workers))
+            )
+
+        for compound_smiles, compound_expansion in zip(missed_compound_smiles_strings, missed_compound_expansions):
+            compound_expansions[compound_smiles] = compound_expansion
+
+            if self.memo_size > 0:
+                self._memo[compound_smiles] = compound_expansion
+
+                if len(self._memo) > self.memo_size:
+                    self._memo.popitem(
+                        last=False
+                    )
+
+        # The failures are memoized with the expansions, which is why they are also counted for the memo hits.
+        for compound_smiles in compound_smiles_strings:
+            failed_retro_template_indices = compound_expansions[compound_smiles][1]
+
+            if failed_retro_template_indices is None:
+                search_result.number_of_failed_compound_expansions += 1
+
+                continue
+
+            for retro_template_index in failed_retro_template_indices:
+                search_result.retro_template_failure_counts[retro_template_index] = (
+                    search_result.retro_template_failure_counts.get(retro_template_index, 0) + 1
+                )
+
+        return [
+            compound_expansions[compound_smiles][0]
+            for compound_smiles in compound_smiles_strings
+        ]
+
+    def search(
+            self,
+            target_compound_smiles: str,
+            search_mode: str = "breadth_first",
+            node_stopping_criteria: Sequence[Callable[[str, int], bool]] = (),
+            search_stopping_criteria: Sequence[Callable[[ReactionRetrosynthesisSearchResult], bool]] = (),
+            compound_scoring_function: Optional[Callable[[str], float]] = None,
+            max_depth: Optional[int] = None,
+            batch_size: Optional[int] = None
+    ) -> ReactionRetrosynthesisSearchResult:
+        """
+        Search the retrosynthetic routes of a target chemical compound.
+
+        :parameter target_compound_smiles: The SMILES string of the target chemical compound.
+        :parameter search_mode: The search mode. The value should be one of the following: { `best_first`,
+            `breadth_first`, `depth_first` }.
+        :parameter node_stopping_criteria: The stopping criteria that mark a node as terminal based on the canonical
+            SMILES string of the chemical compound and the depth of the node.
+        :parameter search_stopping_criteria: The stopping criteria that terminate the search based on the current
+            search result.
+        :parameter compound_scoring_function: The function that scores the chemical compounds in the `best_first`
+            search mode, where lower scores are expanded first. The value `None` indicates that the number of
+            characters of the canonical SMILES string should be utilized as the score.
+        :parameter max_depth: The maximum depth of the search, which is required in the `depth_first` search mode.
+        :parameter batch_size: The number of nodes that should be expanded at once. The value `None` indicates that
+            four nodes per worker process, or a single node without worker processes, should be expanded at once.
+
+        :returns: The chemical reaction retrosynthesis search result.
+        """
+
+        if search_mode not in self.search_modes:
+            raise ValueError(
+                "The search mode '{search_mode}' is not supported.".format(
+                    search_mode=search_mode
+                )
+            )
+
+        if search_mode == "depth_first" and max_depth is None:
+            raise ValueError(
+                "The maximum depth should be specified in the 'depth_first' search mode."
+            )
+
+        if compound_scoring_function is None:
+            compound_scoring_function = len
+
+        if max_depth is not None:
+            node_stopping_criteria = (
+                *node_stopping_criteria,
+                self.get_depth_stopping_criterion(
+                    max_depth=max_depth
+                ),
+            )
+
+        if batch_size is None:
+            batch_size = 1 if self.max_workers is None else 4 * self.max_workers
+
+        start_time = perf_counter()
+
+        search_result = ReactionRetrosynthesisSearchResult()
+
+        target_compound_mol = CompoundFormattingUtility.convert_compound_smiles_to_mol(
+            compound_smiles=target_compound_smiles
+        )
+
+        if target_compound_mol is None:
+            raise ValueError(
+                "The target chemical compound SMILES string '{target_compound_smiles}' cannot be parsed.".format(
+                    target_compound_smiles=target_compound_smiles
+                )
+            )
+
+        target_compound_smiles = CompoundFormattingUtility.convert_compound_mol_to_smiles(
+            compound_mol=target_compound_mol,
+            remove_compound_atom_map_numbers=True
+        )
+
+        frontier, tie_breaker = list() if search_mode == "best_first" else deque(), count()
+
+        def push_node(
+                node_index: int
+        ) -> None:
+            if search_mode == "best_first":
+                heappush(frontier, (
+                    compound_scoring_function(search_result.node_compound_smiles[node_index]),
+                    next(tie_breaker),
+                    node_index,
+                ))
+
+            else:
+                frontier.append(node_index)
+
+        def pop_node() -> int:
+            if search_mode == "best_first":
+                return heappop(frontier)[-1]
+
+            if search_mode == "breadth_first":
+                return frontier.popleft()
+
+            return frontier.pop()
+
+        target_node_index, _ = search_result.add_node(
+            compound_smiles=target_compound_smiles,
+            depth=0
+        )
+
+        push_node(target_node_index)
+
+        # The nodes that are reached again at a smaller depth are pushed again, which is why the depths at which the
+        # nodes were expanded are tracked to skip the outdated entries of the frontier.
+        expanded_node_depths = dict()
+
+        while len(frontier) > 0:
+            search_result.elapsed_time = perf_counter() - start_time
+
+            if any(
+                search_stopping_criterion(search_result)
+                for search_stopping_criterion in search_stopping_criteria
+            ):
+                break
+
+            node_indices = list()
+
+            while len(frontier) > 0 and len(node_indices) < batch_size:
+                node_index = pop_node()
+
+                if expanded_node_depths.get(
+                    node_index, search_result.node_depths[node_index] + 1
+                ) <= search_result.node_depths[node_index]:
+                    continue
+
+                if any(
+                    node_stopping_criterion(
+                        search_result.node_compound_smiles[node_index],
+                        search_result.node_depths[node_index]
+                    ) for node_stopping_criterion in node_stopping_criteria
+                ):
+                    search_result.terminal_node_indices.add(
+                        node_index
+                    )
+
+                else:
+                    expanded_node_depths[node_index] = search_result.node_depths[node_index]
+
+                    node_indices.append(
+                        node_index
+                    )
+
+            for node_index, node_expansions in zip(node_indices, self._expand_compounds(
+                compound_smiles_strings=[
+                    search_result.node_compound_smiles[node_index]
+                    for node_index in node_indices
+                ],
+                search_result=search_result
+            )):
+                search_result.number_of_expanded_nodes += 1
+
+                search_result.node_expansions[node_index] = list()
+
+                for retro_template_index, precursor_compound_smiles_strings in node_expansions:
+                    precursor_node_indices = list()
+
+                    for precursor_compound_smiles in precursor_compound_smiles_strings:
+                        precursor_node_index, is_node_to_expand = search_result.add_node(
+                            compound_smiles=precursor_compound_smiles,
+                            depth=search_result.node_depths[node_index] + 1
+                        )
+
+                        if is_node_to_expand:
+                            push_node(precursor_node_index)
+
+                        precursor_node_indices.append(
+                            precursor_node_index
+                        )
+
+                    search_result.node_expansions[node_index].append(
+                        (retro_template_index, tuple(precursor_node_indices), )
+                    )
+
+        search_result.elapsed_time = perf_counter() - start_time
+
+        return search_result
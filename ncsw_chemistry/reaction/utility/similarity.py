@@ -0,0 +1,457 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``similarity`` module. """
+
+from concurrent.futures import ThreadPoolExecutor
+from json import dump, load
+from os import makedirs
+from os.path import join
+from typing import Iterable, Optional, Sequence, Tuple
+
+from numpy import (
+    arange, concatenate, flatnonzero, float64, int32, int64, lexsort, ndarray, packbits, partition, save, uint8, uint32,
+    uint64, unpackbits, zeros,
+)
+from numpy import load as np_load
+
+try:
+    from numpy import bitwise_count
+
+# The native population count is available only in the NumPy library version 2.0 and later.
+except ImportError:
+    bitwise_count = None
+
+from rdkit.Chem.rdchem import Mol
+
+from ncsw_chemistry.compound.utility.atom import CompoundAtomUtility
+from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
+from ncsw_chemistry.compound.utility.typing_ import CompoundPropertyKeysOrProfile
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+
+
+class ReactionCenterSimilarityIndex:
+    """ The chemical reaction center similarity index class. """
+
+    _byte_bit_counts = unpackbits(
+        arange(256, dtype=uint8)[:, None],
+        axis=1
+    ).sum(
+        axis=1,
+        dtype=uint8
+    )
+
+    def __init__(
+            self,
+            fingerprint_matrix: ndarray,
+            fingerprint_size: int = 2048,
+            fingerprint_bit_counts: Optional[ndarray] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter fingerprint_matrix: The packed bit matrix of the chemical reaction center fingerprints, where each
+            row corresponds to a chemical reaction.
+        :parameter fingerprint_size: The size of the chemical reaction center fingerprints.
+        :parameter fingerprint_bit_counts: The precomputed numbers of the on bits of the chemical reaction center
+            fingerprints. The value `None` indicates that the numbers of the on bits should be computed.
+        """
+
+        self.fingerprint_matrix = fingerprint_matrix
+        self.fingerprint_size = fingerprint_size
+
+        self.fingerprint_bit_counts = self._get_bit_counts(
+            packed_fingerprints=fingerprint_matrix
+        ) if fingerprint_bit_counts is None else fingerprint_bit_counts
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of chemical reactions in the index.
+
+        :returns: The number of chemical reactions in the index.
+        """
+
+        return len(self.fingerprint_matrix)
+
+    @staticmethod
+    def _get_bit_counts(
+            packed_fingerprints: ndarray
+    ) -> ndarray:
+        """
+        Get the numbers of the on bits of packed fingerprints.
+
+        :parameter packed_fingerprints: The packed fingerprints stored as unsigned 64-bit integers along the last axis.
+
+        :returns: The numbers of the on bits of the packed fingerprints.
+        """
+
+        if bitwise_count is not None:
+            return bitwise_count(
+                packed_fingerprints
+            ).sum(
+                axis=-1,
+                dtype=int32
+            )
+
+        return ReactionCenterSimilarityIndex._byte_bit_counts[
+            packed_fingerprints.view(uint8)
+        ].sum(
+            axis=-1,
+            dtype=int32
+        )
+
+    @staticmethod
+    def pack_fingerprint(
+            fingerprint: ndarray
+    ) -> ndarray:
+        """
+        Pack a bit or count fingerprint into an array of unsigned 64-bit integers, where the positive counts are set as
+        the on bits.
+
+        :parameter fingerprint: The bit or count fingerprint.
+
+        :returns: The packed fingerprint.
+        """
+
+        packed_fingerprint = zeros(
+            shape=-(-len(fingerprint) // 64) * 8,
+            dtype=uint8
+        )
+
+        packed_fingerprint[:-(-len(fingerprint) // 8)] = packbits(
+            fingerprint > 0
+        )
+
+        return packed_fingerprint.view(uint64)
+
+    @staticmethod
+    def get_reaction_center_fingerprint(
+            mapped_reactant_compound_mols: Sequence[Mol],
+            mapped_product_compound_mols: Sequence[Mol],
+            fingerprint_size: int = 2048,
+            atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_atom_property_keys: Optional[CompoundPropertyKeysOrProfile] = None,
+            bond_property_keys: Optional[CompoundPropertyKeysOrProfile] = None
+    ) -> ndarray:
+        """
+        Get the hashed count fingerprint of the reaction center of a chemical reaction. The features are the property
+        IDs of the reactive sites of the chemical reaction reactant and product compounds, of each reactive site atom,
+        and of the neighbourhood of each reactive site atom within the reactive site, which are distinguished by the
+        side of the chemical reaction.
+
+        :parameter mapped_reactant_compound_mols: The RDKit Mol objects of the mapped chemical reaction reactant
+            compounds.
+        :parameter mapped_product_compound_mols: The RDKit Mol objects of the mapped chemical reaction product
+            compounds.
+        :parameter fingerprint_size: The size of the fingerprint.
+        :parameter atom_property_keys: The keys or the property profile name of the chemical reaction compound atom
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound atom properties should be utilized in the property ID.
+        :parameter bond_atom_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            atom properties that should be utilized in the property ID. The value `None` indicates that all chemical
+            reaction compound bond atom properties should be utilized in the property ID.
+        :parameter bond_property_keys: The keys or the property profile name of the chemical reaction compound bond
+            properties that should be utilized in the property ID. The value `None` indicates that all chemical reaction
+            compound bond properties should be utilized in the property ID.
+
+        :returns: The hashed count fingerprint of the reaction center of the chemical reaction.
+        """
+
+        reactive_sites_and_synthons = ReactionReactivityUtility.extract_reactive_sites_and_synthons(
+            mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+            mapped_product_compound_mols=mapped_product_compound_mols,
+            atom_property_keys=atom_property_keys,
+            bond_atom_property_keys=bond_atom_property_keys,
+            bond_property_keys=bond_property_keys
+        )
+
+        reactant_compound_reactive_site_atom_indices = [set() for _ in mapped_reactant_compound_mols]
+
+        product_compound_reactive_site_atom_indices = list()
+
+        for product_compound_index in range(len(mapped_product_compound_mols)):
+            reactant_compound_reactive_sites_and_synthons, product_compound_reactive_site = (
+                reactive_sites_and_synthons[product_compound_index]
+            )
+
+            for reactant_compound_index, (reactant_compound_reactive_site, _) in (
+                reactant_compound_reactive_sites_and_synthons.items()
+            ):
+                reactant_compound_reactive_site_atom_indices[reactant_compound_index].update(
+                    reactant_compound_reactive_site
+                )
+
+            product_compound_reactive_site_atom_indices.append(
+                product_compound_reactive_site
+            )
+
+        fingerprint = zeros(
+            shape=fingerprint_size,
+            dtype=uint32
+        )
+
+        for reaction_side, compound_mols, compound_reactive_site_atom_indices in (
+            ("reactant", mapped_reactant_compound_mols, reactant_compound_reactive_site_atom_indices, ),
+            ("product", mapped_product_compound_mols, product_compound_reactive_site_atom_indices, ),
+        ):
+            for compound_mol, reactive_site_atom_indices in zip(compound_mols, compound_reactive_site_atom_indices):
+                if len(reactive_site_atom_indices) == 0:
+                    continue
+
+                property_ids = [
+                    (
+                        "site",
+                        CompoundSubstructureUtility.get_substructure_property_id(
+                            compound_mol=compound_mol,
+                            substructure_atom_indices=reactive_site_atom_indices,
+                            substructure_atom_property_keys=atom_property_keys,
+                            substructure_bond_property_keys=bond_property_keys
+                        ),
+                    ),
+                ]
+
+                for atom_index in reactive_site_atom_indices:
+                    atom = compound_mol.GetAtomWithIdx(atom_index)
+
+                    property_ids.append((
+                        "atom",
+                        CompoundAtomUtility.get_atom_property_id(
+                            atom=atom,
+                            atom_property_keys=atom_property_keys
+                        ),
+                    ))
+
+                    property_ids.append((
+                        "environment",
+                        CompoundSubstructureUtility.get_substructure_property_id(
+                            compound_mol=compound_mol,
+                            substructure_atom_indices={atom_index, } | {
+                                neighbor_atom.GetIdx()
+                                for neighbor_atom in atom.GetNeighbors()
+                                if neighbor_atom.GetIdx() in reactive_site_atom_indices
+                            },
+                            substructure_atom_property_keys=atom_property_keys,
+                            substructure_bond_property_keys=bond_property_keys
+                        ),
+                    ))
+
+                for property_id_kind, property_id in property_ids:
+                    fingerprint[
+                        CompoundSubstructureUtility.get_property_id_hash(
+                            property_id=(reaction_side, property_id_kind, property_id, )
+                        ) % fingerprint_size
+                    ] += 1
+
+        return fingerprint
+
+    @classmethod
+    def from_fingerprints(
+            cls,
+            fingerprints: Iterable[ndarray],
+            fingerprint_size: int = 2048
+    ) -> "ReactionCenterSimilarityIndex":
+        """
+        Construct the index from the chemical reaction center fingerprints.
+
+        :parameter fingerprints: The bit or count fingerprints of the chemical reaction centers. The position of each
+            chemical reaction is utilized as its ID.
+        :parameter fingerprint_size: The size of the chemical reaction center fingerprints.
+
+        :returns: The chemical reaction center similarity index.
+        """
+
+        packed_fingerprints = [
+            cls.pack_fingerprint(
+                fingerprint=fingerprint
+            ) for fingerprint in fingerprints
+        ]
+
+        fingerprint_matrix = zeros(
+            shape=(len(packed_fingerprints), -(-fingerprint_size // 64), ),
+            dtype=uint64
+        )
+
+        for reaction_index, packed_fingerprint in enumerate(packed_fingerprints):
+            fingerprint_matrix[reaction_index] = packed_fingerprint
+
+        return cls(
+            fingerprint_matrix=fingerprint_matrix,
+            fingerprint_size=fingerprint_size
+        )
+
+    def _search_block(
+            self,
+            packed_query_fingerprint: ndarray,
+            query_fingerprint_bit_count: int,
+            block_start_index: int,
+            block_size: int,
+            k: int
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Get the top-k most similar chemical reactions of a block of the index.
+
+        :parameter packed_query_fingerprint: The packed query fingerprint.
+        :parameter query_fingerprint_bit_count: The number of the on bits of the query fingerprint.
+        :parameter block_start_index: The index of the first chemical reaction of the block.
+        :parameter block_size: The number of chemical reactions of the block.
+        :parameter k: The number of the most similar chemical reactions.
+
+        :returns: The indices and Tanimoto similarities of the top-k most similar chemical reactions of the block.
+        """
+
+        intersection_bit_counts = self._get_bit_counts(
+            packed_fingerprints=self.fingerprint_matrix[
+                block_start_index:block_start_index + block_size
+            ] & packed_query_fingerprint
+        )
+
+        union_bit_counts = (
+            self.fingerprint_bit_counts[block_start_index:block_start_index + block_size] +
+            query_fingerprint_bit_count - intersection_bit_counts
+        )
+
+        similarities = intersection_bit_counts / union_bit_counts.clip(
+            min=1
+        )
+
+        if len(similarities) > k:
+            # All chemical reactions that tie with the k-th most similar chemical reaction are kept as candidates, as
+            # the partition alone would select the tied chemical reactions in an arbitrary order.
+            candidate_block_indices = flatnonzero(
+                similarities >= partition(similarities, len(similarities) - k)[len(similarities) - k]
+            )
+
+            block_indices = candidate_block_indices[
+                lexsort((candidate_block_indices, -similarities[candidate_block_indices], ))[:k]
+            ]
+
+        else:
+            block_indices = arange(len(similarities))
+
+        return block_indices.astype(int64) + block_start_index, similarities[block_indices]
+
+    def search(
+            self,
+            query_fingerprint: ndarray,
+            k: int = 10,
+            block_size: int = 65536,
+            max_workers: Optional[int] = None
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Search the chemical reactions with the most similar reaction centers by the Tanimoto similarity.
+
+        :parameter query_fingerprint: The bit or count fingerprint of the query chemical reaction center.
+        :parameter k: The number of the most similar chemical reactions.
+        :parameter block_size: The number of chemical reactions that should be compared at once.
+        :parameter max_workers: The number of threads that scan the blocks of the index. The value `None` indicates that
+            the blocks should be scanned in the current thread.
+
+        :returns: The indices and Tanimoto similarities of the top-k most similar chemical reactions in the descending
+            order of the similarity, where the ties are resolved by the ascending order of the index.
+        """
+
+        packed_query_fingerprint = self.pack_fingerprint(
+            fingerprint=query_fingerprint
+        )
+
+        query_fingerprint_bit_count = int(self._get_bit_counts(
+            packed_fingerprints=packed_query_fingerprint
+        ))
+
+        block_start_indices = range(0, len(self.fingerprint_matrix), block_size)
+
+        def search_block(
+                block_start_index: int
+        ) -> Tuple[ndarray, ndarray]:
+            return self._search_block(
+                packed_query_fingerprint=packed_query_fingerprint,
+                query_fingerprint_bit_count=query_fingerprint_bit_count,
+                block_start_index=block_start_index,
+                block_size=block_size,
+                k=k
+            )
+
+        if max_workers is None or max_workers < 2 or len(block_start_indices) < 2:
+            block_results = [search_block(block_start_index) for block_start_index in block_start_indices]
+
+        else:
+            with ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as thread_pool_executor:
+                block_results = list(thread_pool_executor.map(search_block, block_start_indices))
+
+        indices = concatenate([zeros(0, dtype=int64), ] + [
+            block_indices for block_indices, _ in block_results
+        ])
+
+        similarities = concatenate([zeros(0, dtype=float64), ] + [
+            block_similarities for _, block_similarities in block_results
+        ])
+
+        top_k_order = lexsort((indices, -similarities, ))[:k]
+
+        return indices[top_k_order], similarities[top_k_order]
+
+    def save(
+            self,
+            directory_path: str
+    ) -> None:
+        """
+        Save the index to a directory.
+
+        :parameter directory_path: The path to the directory.
+        """
+
+        makedirs(
+            name=directory_path,
+            exist_ok=True
+        )
+
+        save(
+            file=join(directory_path, "fingerprint_matrix.npy"),
+            arr=self.fingerprint_matrix
+        )
+
+        save(
+            file=join(directory_path, "fingerprint_bit_counts.npy"),
+            arr=self.fingerprint_bit_counts
+        )
+
+        with open(join(directory_path, "metadata.json"), mode="w") as file_handle:
+            dump(
+                obj={
+                    "fingerprint_size": self.fingerprint_size,
+                },
+                fp=file_handle
+            )
+
+    @classmethod
+    def load(
+            cls,
+            directory_path: str,
+            memory_map: bool = True
+    ) -> "ReactionCenterSimilarityIndex":
+        """
+        Load the index from a directory.
+
+        :parameter directory_path: The path to the directory.
+        :parameter memory_map: The indicator of whether the packed bit matrix should be memory-mapped instead of read
+            into memory.
+
+        :returns: The chemical reaction center similarity index.
+        """
+
+        with open(join(directory_path, "metadata.json")) as file_handle:
+            metadata = load(
+                fp=file_handle
+            )
+
+        return cls(
+            fingerprint_matrix=np_load(
+                file=join(directory_path, "fingerprint_matrix.npy"),
+                mmap_mode="r" if memory_map else None
+            ),
+            fingerprint_size=metadata["fingerprint_size"],
+            fingerprint_bit_counts=np_load(
+                file=join(directory_path, "fingerprint_bit_counts.npy")
+            )
+        )
@@ -0,0 +1,320 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``soaking`` module. """
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ncsw_chemistry.compound.utility.formatting import CompoundFormattingUtility
+from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
+from ncsw_chemistry.compound.utility.substructure import CompoundSubstructureUtility
+from ncsw_chemistry.execution.soaking import SoakTestHarness
+from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
+from ncsw_chemistry.reaction.utility.reactivity import ReactionReactivityUtility
+from ncsw_chemistry.reaction.utility.standardization import ReactionStandardizationUtility
+
+
+class ReactionSoakTestUtility:
+    """ The chemical reaction soak test utility class. """
+
+    # The bundled corpus of the mapped chemical reactions covers the common reaction classes, which keeps the soak tests
+    # independent of the network and the external data sets.
+    mapped_reaction_smiles_strings = (
+        "[CH3:1][C:2](=[O:3])[OH:4].[NH2:5][CH2:6][c:7]1[cH:8][cH:9][cH:10][cH:11][cH:12]1>>"
+        "[CH3:1][C:2](=[O:3])[NH:5][CH2:6][c:7]1[cH:8][cH:9][cH:10][cH:11][cH:12]1",
+        "[CH3:1][OH:2].[O:3]=[C:4]([OH:5])[c:6]1[cH:7][cH:8][cH:9][cH:10][cH:11]1>>"
+        "[CH3:1][O:2][C:4](=[O:3])[c:6]1[cH:7][cH:8][cH:9][cH:10][cH:11]1",
+        "[CH3:1][C:2]([CH3:3])([CH3:4])[O:5][C:6](=[O:7])[NH:8][CH2:9][CH2:10][OH:11]>>[NH2:8][CH2:9][CH2:10][OH:11]",
+        "[Br:1][c:2]1[cH:3][cH:4][c:5]([CH3:6])[cH:7][cH:8]1.[OH:9][B:10]([OH:11])[c:12]1[cH:13][cH:14][cH:15][cH:16]"
+        "[cH:17]1>>[c:2]1(-[c:12]2[cH:13][cH:14][cH:15][cH:16][cH:17]2)[cH:3][cH:4][c:5]([CH3:6])[cH:7][cH:8]1",
+        "[O:1]=[CH:2][c:3]1[cH:4][cH:5][cH:6][cH:7][cH:8]1.[NH2:9][CH:10]1[CH2:11][CH2:12][CH2:13][CH2:14][CH2:15]1>>"
+        "[c:3]1([CH2:2][NH:9][CH:10]2[CH2:11][CH2:12][CH2:13][CH2:14][CH2:15]2)[cH:4][cH:5][cH:6][cH:7][cH:8]1",
+        "[OH:1][c:2]1[cH:3][cH:4][cH:5][cH:6][cH:7]1.[Br:8][CH2:9][CH3:10]>>"
+        "[CH3:10][CH2:9][O:1][c:2]1[cH:3][cH:4][cH:5][cH:6][cH:7]1",
+        "[F:1][c:2]1[cH:3][cH:4][c:5]([N+:6](=[O:7])[O-:8])[cH:9][cH:10]1."
+        "[NH:11]1[CH2:12][CH2:13][O:14][CH2:15][CH2:16]1>>"
+        "[N:11]1([c:2]2[cH:3][cH:4][c:5]([N+:6](=[O:7])[O-:8])[cH:9][cH:10]2)[CH2:12][CH2:13][O:14][CH2:15][CH2:16]1",
+        "[O-:1][N+:2](=[O:3])[c:4]1[cH:5][cH:6][c:7]([Cl:8])[cH:9][cH:10]1>>"
+        "[NH2:2][c:4]1[cH:5][cH:6][c:7]([Cl:8])[cH:9][cH:10]1",
+    )
+
+    workload_mixes = {
+        "all": {
+            "compound_formatting": 1.0,
+            "compound_standardization": 1.0,
+            "reaction_formatting": 1.0,
+            "reaction_standardization": 1.0,
+            "reactive_site_and_synthon_extraction": 1.0,
+            "retro_template_extraction": 1.0,
+            "substructure_hashing": 1.0,
+        },
+        "formatting_and_standardization": {
+            "compound_formatting": 1.0,
+            "compound_standardization": 1.0,
+            "reaction_formatting": 1.0,
+            "reaction_standardization": 1.0,
+        },
+        "reactivity_and_substructure": {
+            "reactive_site_and_synthon_extraction": 1.0,
+            "retro_template_extraction": 1.0,
+            "substructure_hashing": 1.0,
+        },
+    }
+
+    @staticmethod
+    def _get_compound_mols(
+            mapped_reaction_smiles: str
+    ) -> List[List[Any]]:
+        """
+        Get the RDKit Mol objects of the chemical reaction reactant and product compounds.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The RDKit Mol objects of the chemical reaction reactant compounds and product compounds.
+        """
+
+        mapped_reactant_compounds_smiles, _, mapped_product_compounds_smiles = mapped_reaction_smiles.split(">")
+
+        return [
+            [
+                CompoundFormattingUtility.convert_compound_smiles_to_mol(
+                    compound_smiles=mapped_compound_smiles
+                ) for mapped_compound_smiles in mapped_compounds_smiles.split(".")
+            ] for mapped_compounds_smiles in (mapped_reactant_compounds_smiles, mapped_product_compounds_smiles, )
+        ]
+
+    @staticmethod
+    def run_compound_formatting_workload(
+            mapped_reaction_smiles: str
+    ) -> List[str]:
+        """
+        Run the chemical compound formatting workload, which converts the chemical reaction compounds to the RDKit Mol
+        objects and back to the SMILES and SMARTS strings.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The SMILES and SMARTS strings of the chemical reaction compounds.
+        """
+
+        compound_strings = list()
+
+        for compound_mols in ReactionSoakTestUtility._get_compound_mols(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        ):
+            for compound_mol in compound_mols:
+                compound_strings.append(
+                    CompoundFormattingUtility.convert_compound_mol_to_smiles(
+                        compound_mol=compound_mol
+                    )
+                )
+
+                compound_strings.append(
+                    CompoundFormattingUtility.convert_compound_mol_to_smarts(
+                        compound_mol=compound_mol
+                    )
+                )
+
+        return compound_strings
+
+    @staticmethod
+    def run_compound_standardization_workload(
+            mapped_reaction_smiles: str
+    ) -> List[Optional[str]]:
+        """
+        Run the chemical compound standardization workload, which standardizes the chemical reaction compound SMILES
+        strings.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The SMILES strings of the standardized chemical reaction compounds.
+        """
+
+        return [
+            CompoundStandardizationUtility.standardize_compound_smiles(
+                compound_smiles=mapped_compound_smiles,
+                remove_compound_atom_map_numbers=True
+            ) for mapped_compound_smiles in mapped_reaction_smiles.replace(">>", ".").split(".")
+        ]
+
+    @staticmethod
+    def run_reaction_formatting_workload(
+            mapped_reaction_smiles: str
+    ) -> List[str]:
+        """
+        Run the chemical reaction formatting workload, which converts the chemical reaction to the RDKit
+        ChemicalReaction object and back to the SMILES and SMARTS strings.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The SMILES and SMARTS strings of the chemical reaction.
+        """
+
+        reaction_rxn = ReactionFormattingUtility.convert_reaction_smiles_to_rxn(
+            reaction_smiles=mapped_reaction_smiles,
+            useSmiles=True
+        )
+
+        return [
+            ReactionFormattingUtility.convert_reaction_rxn_to_smiles(
+                reaction_rxn=reaction_rxn
+            ),
+            ReactionFormattingUtility.convert_reaction_rxn_to_smarts(
+                reaction_rxn=reaction_rxn
+            ),
+        ]
+
+    @staticmethod
+    def run_reaction_standardization_workload(
+            mapped_reaction_smiles: str
+    ) -> Optional[str]:
+        """
+        Run the chemical reaction standardization workload, which standardizes the chemical reaction SMILES string.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The SMILES string of the standardized chemical reaction.
+        """
+
+        return ReactionStandardizationUtility.standardize_reaction_smiles(
+            reaction_smiles=mapped_reaction_smiles,
+            remove_reaction_compound_atom_map_numbers=True
+        )
+
+    @staticmethod
+    def run_reactive_site_and_synthon_extraction_workload(
+            mapped_reaction_smiles: str
+    ) -> Dict[int, Any]:
+        """
+        Run the chemical reaction reactive site and synthon extraction workload.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The reactive sites and synthons of the chemical reaction.
+        """
+
+        mapped_reactant_compound_mols, mapped_product_compound_mols = ReactionSoakTestUtility._get_compound_mols(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        )
+
+        return ReactionReactivityUtility.extract_reactive_sites_and_synthons(
+            mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+            mapped_product_compound_mols=mapped_product_compound_mols
+        )
+
+    @staticmethod
+    def run_retro_template_extraction_workload(
+            mapped_reaction_smiles: str
+    ) -> Dict[str, Optional[str]]:
+        """
+        Run the chemical reaction retro template extraction workload at all specificity levels.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The chemical reaction retro template SMARTS strings per specificity level.
+        """
+
+        mapped_reactant_compound_mols, mapped_product_compound_mols = ReactionSoakTestUtility._get_compound_mols(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        )
+
+        return ReactionReactivityUtility.extract_retro_templates_at_specificity_levels(
+            mapped_reactant_compound_mols=mapped_reactant_compound_mols,
+            mapped_product_compound_mols=mapped_product_compound_mols
+        )
+
+    @staticmethod
+    def run_substructure_hashing_workload(
+            mapped_reaction_smiles: str
+    ) -> List[int]:
+        """
+        Run the chemical compound substructure hashing workload, which hashes the property IDs of the first-order
+        environments of the chemical reaction product compound atoms.
+
+        :parameter mapped_reaction_smiles: The SMILES string of the mapped chemical reaction.
+
+        :returns: The 64-bit hashes of the property IDs of the chemical compound substructures.
+        """
+
+        substructure_property_id_hashes = list()
+
+        for product_compound_mol in ReactionSoakTestUtility._get_compound_mols(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        )[1]:
+            for atom in product_compound_mol.GetAtoms():
+                substructure_property_id_hashes.append(
+                    CompoundSubstructureUtility.get_substructure_property_id_hash(
+                        compound_mol=product_compound_mol,
+                        substructure_atom_indices={
+                            atom.GetIdx(),
+                            *(neighbor_atom.GetIdx() for neighbor_atom in atom.GetNeighbors()),
+                        },
+                        substructure_atom_property_keys="reaction_center",
+                        substructure_bond_property_keys="reaction_center"
+                    )
+                )
+
+        return substructure_property_id_hashes
+
+    @staticmethod
+    def get_workloads() -> Dict[str, Callable[[str], Any]]:
+        """
+        Get the soak test workloads.
+
+        :returns: The functions of the soak test workloads per workload name, which are called with a single mapped
+            chemical reaction SMILES string.
+        """
+
+        return {
+            "compound_formatting": ReactionSoakTestUtility.run_compound_formatting_workload,
+            "compound_standardization": ReactionSoakTestUtility.run_compound_standardization_workload,
+            "reaction_formatting": ReactionSoakTestUtility.run_reaction_formatting_workload,
+            "reaction_standardization": ReactionSoakTestUtility.run_reaction_standardization_workload,
+            "reactive_site_and_synthon_extraction":
+                ReactionSoakTestUtility.run_reactive_site_and_synthon_extraction_workload,
+            "retro_template_extraction": ReactionSoakTestUtility.run_retro_template_extraction_workload,
+            "substructure_hashing": ReactionSoakTestUtility.run_substructure_hashing_workload,
+        }
+
+    @staticmethod
+    def run_soak_test(
+            workload_mix: str = "all",
+            workload_weights: Optional[Dict[str, float]] = None,
+            mapped_reaction_smiles_strings: Optional[Sequence[str]] = None,
+            duration: float = 3600.0,
+            sampling_interval: float = 10.0,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run a soak test of the chemical compound and reaction utilities in the current process.
+
+        :parameter workload_mix: The name of the workload mix, which is one of the keys of the ``workload_mixes`` class
+            attribute.
+        :parameter workload_weights: The relative weights of the workloads per workload name. The value `None` indicates
+            that the weights of the workload mix should be utilized.
+        :parameter mapped_reaction_smiles_strings: The SMILES strings of the mapped chemical reactions of the corpus.
+            The value `None` indicates that the bundled corpus should be utilized.
+        :parameter duration: The duration of the soak test in seconds.
+        :parameter sampling_interval: The interval in seconds at which the throughput and the resident set size are
+            sampled.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying classes:
+            { ``ncsw_chemistry.execution.soaking.SoakTestHarness`` }.
+
+        :returns: The report of the soak test.
+        """
+
+        if workload_weights is None:
+            if workload_mix not in ReactionSoakTestUtility.workload_mixes.keys():
+                raise ValueError(
+                    "The workload mix should be one of {workload_mixes}.".format(
+                        workload_mixes=tuple(ReactionSoakTestUtility.workload_mixes.keys())
+                    )
+                )
+
+            workload_weights = ReactionSoakTestUtility.workload_mixes[workload_mix]
+
+        return SoakTestHarness(
+            workloads=ReactionSoakTestUtility.get_workloads(),
+            items=ReactionSoakTestUtility.mapped_reaction_smiles_strings
+            if mapped_reaction_smiles_strings is None else mapped_reaction_smiles_strings,
+            workload_weights=workload_weights,
+            duration=duration,
+            sampling_interval=sampling_interval,
+            **kwargs
+        ).run()
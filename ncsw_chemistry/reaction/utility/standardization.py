@@ -1,11 +1,12 @@
 """ The ``ncsw_chemistry.reaction.utility`` package ``standardization`` module. """
 
 from functools import reduce
-from typing import Collection, Dict
+from typing import Collection, Dict, Optional
 
 from rdkit.Chem.rdChemReactions import ChemicalReaction, SanitizeFlags, SanitizeRxn
 
 from ncsw_chemistry.compound.utility.standardization import CompoundStandardizationUtility
+from ncsw_chemistry.reaction.utility.formatting import ReactionFormattingUtility
 
 
 class ReactionStandardizationUtility:
@@ -109,7 +110,49 @@ class ReactionStandardizationUtility:
             for reaction_compound_mol in reaction_compound_mols:
                 CompoundStandardizationUtility.sanitize_compound(
                     compound_mol=reaction_compound_mol,
-                    compound_sanitization_operation_keys=reaction_compound_sanitization_operation_keys
+                    compound_sanitization_operation_keys=reaction_compound_sanitization_operation_keys,
+                    deep_copy=False
                 )
 
         return reaction_rxn
+
+    @staticmethod
+    def standardize_reaction_smiles(
+            reaction_smiles: str,
+            reaction_sanitization_operation_keys: Collection[str] = None,
+            remove_reaction_compound_atom_map_numbers: bool = False
+    ) -> Optional[str]:
+        """
+        Standardize a chemical reaction SMILES string by parsing, sanitizing and canonicalizing the chemical reaction.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+        :parameter reaction_sanitization_operation_keys: The keys of the chemical reaction sanitization operations that
+            should be performed. The value `None` indicates that all chemical compound sanitization operations should be
+            performed.
+        :parameter remove_reaction_compound_atom_map_numbers: The indicator of whether the chemical reaction compound
+            atom map numbers should be removed.
+
+        :returns: The SMILES string of the standardized chemical reaction, or the value `None` if the chemical reaction
+            could not be standardized.
+        """
+
+        try:
+            reaction_rxn = ReactionFormattingUtility.convert_reaction_smiles_to_rxn(
+                reaction_smiles=reaction_smiles,
+                useSmiles=True
+            )
+
+            if reaction_rxn is None:
+                return None
+
+            return ReactionFormattingUtility.convert_reaction_rxn_to_smiles(
+                reaction_rxn=ReactionStandardizationUtility.sanitize_reaction(
+                    reaction_rxn=reaction_rxn,
+                    reaction_sanitization_operation_keys=reaction_sanitization_operation_keys,
+                    deep_copy=False
+                ),
+                remove_reaction_compound_atom_map_numbers=remove_reaction_compound_atom_map_numbers
+            )
+
+        except Exception:
+            return None
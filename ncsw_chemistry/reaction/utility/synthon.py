@@ -0,0 +1,617 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``synthon`` module. """
+
+from typing import Dict, Iterable, Iterator, Mapping, Set, Tuple
+
+from numpy import array, array_equal, concatenate, cumsum, dtype, frombuffer, int64, ndarray, zeros
+
+
+# The unsigned integer data types are constructed once per item size, as their construction dominates the
+# deserialization of the small chemical reactions.
+_unsigned_integer_dtypes = {
+    item_size: dtype("<u{item_size:d}".format(
+        item_size=item_size
+    )) for item_size in (1, 2, 4, 8, )
+}
+
+def _get_unsigned_integer_dtype(
+        max_value: int
+) -> dtype:
+    """
+    Get the narrowest little-endian unsigned integer data type that can represent a value.
+
+    :parameter max_value: The maximum value that should be represented.
+
+    :returns: The narrowest little-endian unsigned integer data type.
+    """
+
+    for item_size, unsigned_integer_dtype in _unsigned_integer_dtypes.items():
+        if max_value < 256 ** item_size:
+            return unsigned_integer_dtype
+
+    raise ValueError(
+        "The maximum value should be representable as a 64-bit unsigned integer."
+    )
+
+
+class ReactionReactiveSitesAndSynthons:
+    """ The compact chemical reaction reactive sites and synthons class. """
+
+    __slots__ = ("data", )
+
+    _header = b"NRSS"
+
+    def __init__(
+            self,
+            data: ndarray
+    ) -> None:
+        """
+        The constructor method of the class. The data is a single unsigned integer array of the narrowest sufficient
+        width that consists of the number of the chemical reaction reactant and product compounds, the offsets of the
+        reactive site atom indices and synthon atom index pairs of each pair of the chemical reaction product and
+        reactant compounds in the product-major order, the offsets of the reactive site atom indices of each chemical
+        reaction product compound, and the concatenated segments that are delimited by the offsets.
+
+        :parameter data: The data of the compact chemical reaction reactive sites and synthons.
+        """
+
+        self.data = data
+
+    def __eq__(
+            self,
+            other: object
+    ) -> bool:
+        """
+        Check whether the compact chemical reaction reactive sites and synthons are equal to another object.
+
+        :parameter other: The other object.
+
+        :returns: The indicator of whether the compact chemical reaction reactive sites and synthons are equal.
+        """
+
+        if not isinstance(other, ReactionReactiveSitesAndSynthons):
+            return NotImplemented
+
+        return array_equal(self.data, other.data)
+
+    def __getstate__(
+            self
+    ) -> bytes:
+        """
+        Get the pickling state, which is the compact byte representation.
+
+        :returns: The pickling state.
+        """
+
+        return self.to_bytes()
+
+    def __setstate__(
+            self,
+            state: bytes
+    ) -> None:
+        """
+        Set the pickling state.
+
+        :parameter state: The pickling state.
+        """
+
+        self.data = self.from_bytes(state).data
+
+    @property
+    def number_of_reactant_compounds(
+            self
+    ) -> int:
+        """
+        Get the number of the chemical reaction reactant compounds.
+
+        :returns: The number of the chemical reaction reactant compounds.
+        """
+
+        return int(self.data[0])
+
+    @property
+    def number_of_product_compounds(
+            self
+    ) -> int:
+        """
+        Get the number of the chemical reaction product compounds.
+
+        :returns: The number of the chemical reaction product compounds.
+        """
+
+        return int(self.data[1])
+
+    @property
+    def nbytes(
+            self
+    ) -> int:
+        """
+        Get the number of bytes of the data.
+
+        :returns: The number of bytes of the data.
+        """
+
+        return self.data.nbytes
+
+    @classmethod
+    def from_reactive_sites_and_synthons(
+            cls,
+            reactive_sites_and_synthons: Mapping[int, Tuple[Mapping[int, Tuple[Set[int], Mapping[int, int]]], Set[int]]]
+    ) -> "ReactionReactiveSitesAndSynthons":
+        """
+        Construct the compact chemical reaction reactive sites and synthons from the nested structure.
+
+        :parameter reactive_sites_and_synthons: The reactive sites and synthons of the chemical reaction reactant and
+            product compounds as returned by the ``ReactionReactivityUtility.extract_reactive_sites_and_synthons``
+            method.
+
+        :returns: The compact chemical reaction reactive sites and synthons.
+        """
+
+        number_of_product_compounds = len(reactive_sites_and_synthons)
+
+        number_of_reactant_compounds = len(
+            reactive_sites_and_synthons[0][0]
+        ) if number_of_product_compounds > 0 else 0
+
+        segments = list()
+
+        # The reactant compound reactive sites, synthons and product compound reactive sites are collected separately
+        # to keep each kind of segment contiguous.
+        reactant_compound_synthon_segments = list()
+        product_compound_reactive_site_segments = list()
+
+        for product_compound_index in range(number_of_product_compounds):
+            reactant_compound_reactive_sites_and_synthons, product_compound_reactive_site_atom_indices = (
+                reactive_sites_and_synthons[product_compound_index]
+            )
+
+            if len(reactant_compound_reactive_sites_and_synthons) != number_of_reactant_compounds:
+                raise ValueError(
+                    "The number of chemical reaction reactant compounds should be the same for each chemical reaction "
+                    "product compound."
+                )
+
+            for reactant_compound_index in range(number_of_reactant_compounds):
+                reactant_compound_reactive_site_atom_indices, reactant_compound_synthon_atom_indices = (
+                    reactant_compound_reactive_sites_and_synthons[reactant_compound_index]
+                )
+
+                segments.append(
+                    sorted(reactant_compound_reactive_site_atom_indices)
+                )
+
+                reactant_compound_synthon_segments.append([
+                    atom_index
+                    for atom_index_pair in sorted(reactant_compound_synthon_atom_indices.items())
+                    for atom_index in atom_index_pair
+                ])
+
+            product_compound_reactive_site_segments.append(
+                sorted(product_compound_reactive_site_atom_indices)
+            )
+
+        segments.extend(
+            reactant_compound_synthon_segments
+        )
+
+        segments.extend(
+            product_compound_reactive_site_segments
+        )
+
+        segment_lengths = [len(segment) for segment in segments]
+
+        number_of_pairs = number_of_reactant_compounds * number_of_product_compounds
+
+        header_length = 2 + 2 * (number_of_pairs + 1) + number_of_product_compounds + 1
+
+        # Each kind of segment is delimited by its own offsets, which include the end offset.
+        segment_offsets = list()
+
+        segment_start_offset = header_length
+
+        for segment_kind_start_index, segment_kind_stop_index in (
+            (0, number_of_pairs, ),
+            (number_of_pairs, 2 * number_of_pairs, ),
+            (2 * number_of_pairs, 2 * number_of_pairs + number_of_product_compounds, ),
+        ):
+            segment_offsets.append(
+                segment_start_offset
+            )
+
+            segment_offsets.extend(
+                (
+                    segment_start_offset + cumsum(
+                        segment_lengths[segment_kind_start_index:segment_kind_stop_index]
+                    )
+                ).tolist()
+            )
+
+            segment_start_offset = segment_offsets[-1]
+
+        data = [number_of_reactant_compounds, number_of_product_compounds, ] + segment_offsets + [
+            atom_index
+            for segment in segments
+            for atom_index in segment
+        ]
+
+        return cls(
+            data=array(
+                data,
+                dtype=_get_unsigned_integer_dtype(
+                    max_value=max(data)
+                )
+            )
+        )
+
+    def _get_segment(
+            self,
+            offset_index: int
+    ) -> ndarray:
+        """
+        Get a segment of the data.
+
+        :parameter offset_index: The index of the start offset of the segment in the data.
+
+        :returns: The segment of the data.
+        """
+
+        return self.data[self.data[offset_index]:self.data[offset_index + 1]]
+
+    def get_reactant_compound_reactive_site_atom_indices(
+            self,
+            product_compound_index: int,
+            reactant_compound_index: int
+    ) -> ndarray:
+        """
+        Get the reactive site atom indices of a chemical reaction reactant compound.
+
+        :parameter product_compound_index: The index of the chemical reaction product compound.
+        :parameter reactant_compound_index: The index of the chemical reaction reactant compound.
+
+        :returns: The sorted reactive site atom indices of the chemical reaction reactant compound.
+        """
+
+        return self._get_segment(
+            offset_index=2 + product_compound_index * self.number_of_reactant_compounds + reactant_compound_index
+        )
+
+    def get_reactant_compound_synthon_atom_index_pairs(
+            self,
+            product_compound_index: int,
+            reactant_compound_index: int
+    ) -> ndarray:
+        """
+        Get the synthon atom index pairs of a chemical reaction reactant compound.
+
+        :parameter product_compound_index: The index of the chemical reaction product compound.
+        :parameter reactant_compound_index: The index of the chemical reaction reactant compound.
+
+        :returns: The pairs of the chemical reaction reactant and product compound synthon atom indices sorted by the
+            chemical reaction reactant compound atom indices.
+        """
+
+        number_of_pairs = self.number_of_reactant_compounds * self.number_of_product_compounds
+
+        return self._get_segment(
+            offset_index=3 + number_of_pairs + product_compound_index * self.number_of_reactant_compounds +
+            reactant_compound_index
+        ).reshape(-1, 2)
+
+    def get_product_compound_reactive_site_atom_indices(
+            self,
+            product_compound_index: int
+    ) -> ndarray:
+        """
+        Get the reactive site atom indices of a chemical reaction product compound.
+
+        :parameter product_compound_index: The index of the chemical reaction product compound.
+
+        :returns: The sorted reactive site atom indices of the chemical reaction product compound.
+        """
+
+        number_of_pairs = self.number_of_reactant_compounds * self.number_of_product_compounds
+
+        return self._get_segment(
+            offset_index=4 + 2 * number_of_pairs + product_compound_index
+        )
+
+    def to_reactive_sites_and_synthons(
+            self
+    ) -> Dict[int, Tuple[Dict[int, Tuple[Set[int], Dict[int, int]]], Set[int]]]:
+        """
+        Convert the compact chemical reaction reactive sites and synthons to the nested structure.
+
+        :returns: The reactive sites and synthons of the chemical reaction reactant and product compounds in the format
+            of the ``ReactionReactivityUtility.extract_reactive_sites_and_synthons`` method.
+        """
+
+        return {
+            product_compound_index: (
+                {
+                    reactant_compound_index: (
+                        set(self.get_reactant_compound_reactive_site_atom_indices(
+                            product_compound_index=product_compound_index,
+                            reactant_compound_index=reactant_compound_index
+                        ).tolist()),
+                        dict(self.get_reactant_compound_synthon_atom_index_pairs(
+                            product_compound_index=product_compound_index,
+                            reactant_compound_index=reactant_compound_index
+                        ).tolist()),
+                    ) for reactant_compound_index in range(self.number_of_reactant_compounds)
+                },
+                set(self.get_product_compound_reactive_site_atom_indices(
+                    product_compound_index=product_compound_index
+                ).tolist()),
+            ) for product_compound_index in range(self.number_of_product_compounds)
+        }
+
+    def to_bytes(
+            self
+    ) -> bytes:
+        """
+        Serialize the compact chemical reaction reactive sites and synthons to bytes, which consist of the header, the
+        item size of the data and the data.
+
+        :returns: The bytes of the compact chemical reaction reactive sites and synthons.
+        """
+
+        data_dtype = self.data.dtype.newbyteorder("<")
+
+        return self._header + bytes((data_dtype.itemsize, )) + self.data.astype(data_dtype, copy=False).tobytes()
+
+    @classmethod
+    def from_bytes(
+            cls,
+            reactive_sites_and_synthons_bytes: bytes
+    ) -> "ReactionReactiveSitesAndSynthons":
+        """
+        Deserialize the compact chemical reaction reactive sites and synthons from bytes without copying the data, which
+        is a read-only view of the bytes.
+
+        :parameter reactive_sites_and_synthons_bytes: The bytes of the compact chemical reaction reactive sites and
+            synthons.
+
+        :returns: The compact chemical reaction reactive sites and synthons.
+        """
+
+        if reactive_sites_and_synthons_bytes[:len(cls._header)] != cls._header:
+            raise ValueError(
+                "The bytes do not represent compact chemical reaction reactive sites and synthons."
+            )
+
+        return cls(
+            data=frombuffer(
+                reactive_sites_and_synthons_bytes,
+                dtype=_unsigned_integer_dtypes[reactive_sites_and_synthons_bytes[len(cls._header)]],
+                offset=len(cls._header) + 1
+            )
+        )
+
+
+class ReactionReactiveSitesAndSynthonsBatch:
+    """ The batch of compact chemical reaction reactive sites and synthons class. """
+
+    __slots__ = ("data", "offsets", )
+
+    _header = b"NRSB"
+
+    def __init__(
+            self,
+            data: ndarray,
+            offsets: ndarray
+    ) -> None:
+        """
+        The constructor method of the class. The data of the compact chemical reaction reactive sites and synthons of
+        the chemical reactions are concatenated in a single unsigned integer array, which is delimited by the offsets,
+        including the end offset. A batch is pickled as a single buffer, which avoids the per-object pickling overhead
+        of the individual compact chemical reaction reactive sites and synthons.
+
+        :parameter data: The concatenated data of the compact chemical reaction reactive sites and synthons.
+        :parameter offsets: The offsets of the data of the compact chemical reaction reactive sites and synthons.
+        """
+
+        self.data = data
+        self.offsets = offsets
+
+    def __eq__(
+            self,
+            other: object
+    ) -> bool:
+        """
+        Check whether the batch of compact chemical reaction reactive sites and synthons is equal to another object.
+
+        :parameter other: The other object.
+
+        :returns: The indicator of whether the batches of compact chemical reaction reactive sites and synthons are
+            equal.
+        """
+
+        if not isinstance(other, ReactionReactiveSitesAndSynthonsBatch):
+            return NotImplemented
+
+        return array_equal(self.offsets, other.offsets) and array_equal(self.data, other.data)
+
+    def __getstate__(
+            self
+    ) -> bytes:
+        """
+        Get the pickling state, which is the compact byte representation.
+
+        :returns: The pickling state.
+        """
+
+        return self.to_bytes()
+
+    def __setstate__(
+            self,
+            state: bytes
+    ) -> None:
+        """
+        Set the pickling state.
+
+        :parameter state: The pickling state.
+        """
+
+        batch = self.from_bytes(state)
+
+        self.data = batch.data
+        self.offsets = batch.offsets
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        Get the number of the compact chemical reaction reactive sites and synthons in the batch.
+
+        :returns: The number of the compact chemical reaction reactive sites and synthons in the batch.
+        """
+
+        return len(self.offsets) - 1
+
+    def __getitem__(
+            self,
+            index: int
+    ) -> ReactionReactiveSitesAndSynthons:
+        """
+        Get the compact chemical reaction reactive sites and synthons of a chemical reaction without copying the data.
+
+        :parameter index: The index of the chemical reaction.
+
+        :returns: The compact chemical reaction reactive sites and synthons, whose data is a view of the batch data.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(
+                "The index should be within the range of the batch."
+            )
+
+        index %= len(self)
+
+        return ReactionReactiveSitesAndSynthons(
+            data=self.data[self.offsets[index]:self.offsets[index + 1]]
+        )
+
+    def __iter__(
+            self
+    ) -> Iterator[ReactionReactiveSitesAndSynthons]:
+        """
+        Iterate over the compact chemical reaction reactive sites and synthons of the batch.
+
+        :returns: The iterator over the compact chemical reaction reactive sites and synthons.
+        """
+
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(
+            self
+    ) -> int:
+        """
+        Get the number of bytes of the data and offsets.
+
+        :returns: The number of bytes of the data and offsets.
+        """
+
+        return self.data.nbytes + self.offsets.nbytes
+
+    @classmethod
+    def from_items(
+            cls,
+            reactive_sites_and_synthons: Iterable[ReactionReactiveSitesAndSynthons]
+    ) -> "ReactionReactiveSitesAndSynthonsBatch":
+        """
+        Construct the batch from the compact chemical reaction reactive sites and synthons.
+
+        :parameter reactive_sites_and_synthons: The compact chemical reaction reactive sites and synthons.
+
+        :returns: The batch of compact chemical reaction reactive sites and synthons.
+        """
+
+        item_datas = [item.data for item in reactive_sites_and_synthons]
+
+        offsets = zeros(
+            shape=len(item_datas) + 1,
+            dtype=int64
+        )
+
+        offsets[1:] = cumsum([len(item_data) for item_data in item_datas], dtype=int64)
+
+        # The data of the items is promoted to the widest data type of the items.
+        return cls(
+            data=concatenate(item_datas) if len(item_datas) > 0 else zeros(
+                shape=0,
+                dtype="<u1"
+            ),
+            offsets=offsets
+        )
+
+    def to_bytes(
+            self
+    ) -> bytes:
+        """
+        Serialize the batch of compact chemical reaction reactive sites and synthons to bytes, which consist of the
+        header, the item sizes of the data and offsets, the number of chemical reactions, the offsets and the data.
+
+        :returns: The bytes of the batch of compact chemical reaction reactive sites and synthons.
+        """
+
+        data_dtype = self.data.dtype.newbyteorder("<")
+
+        offsets_dtype = _get_unsigned_integer_dtype(
+            max_value=int(self.offsets[-1])
+        )
+
+        return b"".join((
+            self._header,
+            bytes((data_dtype.itemsize, offsets_dtype.itemsize, )),
+            len(self).to_bytes(8, byteorder="little"),
+            self.offsets.astype(offsets_dtype).tobytes(),
+            self.data.astype(data_dtype, copy=False).tobytes(),
+        ))
+
+    @classmethod
+    def from_bytes(
+            cls,
+            reactive_sites_and_synthons_batch_bytes: bytes
+    ) -> "ReactionReactiveSitesAndSynthonsBatch":
+        """
+        Deserialize the batch of compact chemical reaction reactive sites and synthons from bytes without copying the
+        data, which is a read-only view of the bytes.
+
+        :parameter reactive_sites_and_synthons_batch_bytes: The bytes of the batch of compact chemical reaction
+            reactive sites and synthons.
+
+        :returns: The batch of compact chemical reaction reactive sites and synthons.
+        """
+
+        if reactive_sites_and_synthons_batch_bytes[:len(cls._header)] != cls._header:
+            raise ValueError(
+                "The bytes do not represent a batch of compact chemical reaction reactive sites and synthons."
+            )
+
+        data_item_size, offsets_item_size = reactive_sites_and_synthons_batch_bytes[
+            len(cls._header):len(cls._header) + 2
+        ]
+
+        number_of_items = int.from_bytes(
+            reactive_sites_and_synthons_batch_bytes[len(cls._header) + 2:len(cls._header) + 10],
+            byteorder="little"
+        )
+
+        offsets_start = len(cls._header) + 10
+
+        # The offsets are widened once, as they are small compared to the data.
+        return cls(
+            data=frombuffer(
+                reactive_sites_and_synthons_batch_bytes,
+                dtype=_unsigned_integer_dtypes[data_item_size],
+                offset=offsets_start + offsets_item_size * (number_of_items + 1)
+            ),
+            offsets=frombuffer(
+                reactive_sites_and_synthons_batch_bytes,
+                dtype=_unsigned_integer_dtypes[offsets_item_size],
+                count=number_of_items + 1,
+                offset=offsets_start
+            ).astype(int64)
+        )
@@ -0,0 +1,6 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``typing_`` module. """
+
+from typing import Tuple
+
+
+ReactionRetrosynthesisExpansionTuple = Tuple[Tuple[int, Tuple[str, ...]], ...]
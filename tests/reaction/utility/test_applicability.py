@@ -0,0 +1,156 @@
+""" The ``ncsw_chemistry.reaction.utility`` package ``applicability`` module tests. """
+
+from typing import Set
+
+from pytest import fixture, mark
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdChemReactions import ReactionFromSmarts
+from rdkit.Chem.rdmolfiles import MolFromSmiles
+
+from ncsw_chemistry.reaction.utility.applicability import (
+    ReactionCenterEnvironmentIndex,
+    ReactionTemplateApplicabilityIndex,
+)
+
+
+retro_template_smarts_strings = [
+    "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:3])-[NH;D2;+0:5]-[c:6]>>"
+    "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:3])-[OH;D1;+0:4].[NH2;D1;+0:5]-[c:6]",
+    "[c:9]:[c;H0;D3;+0:8](-[c;H0;D3;+0:2](:[c:3]):[c:4]):[c:10]>>"
+    "[Br;H0;D1;+0:1]-[c;H0;D3;+0:2](:[c:3]):[c:4].[OH;D1;+0:5]-[B;H0;D3;+0:6](-[OH;D1;+0:7])-[c;H0;D3;+0:8](:[c:9]):"
+    "[c:10]",
+    "[#8:1]-[C:2](=[O;D1;H0:3])-[C:4]-[CH2;D2;+0:5]-[N;H0;D3;+0:8](-[C:7])-[C:9]>>"
+    "[#8:1]-[C:2](=[O;D1;H0:3])-[C:4]-[CH2;D2;+0:5]-[Cl;H0;D1;+0:6].[C:7]-[NH;D2;+0:8]-[C:9]",
+    "[C:1]-[NH2;D1;+0:2]>>"
+    "[C:1]-[NH;D2;+0:2]-[C;H0;D3;+0:3](=[O;H0;D1;+0:4])-[O;H0;D2;+0:5]-[C;H0;D4;+0:6](-[CH3;D1;+0:7])(-[CH3;D1;+0:8])-"
+    "[CH3;D1;+0:9]",
+    "[O;H0;D1;+0:1]=[CH;D2;+0:2]-[c:3]>>[OH;D1;+0:1]-[CH2;D2;+0:2]-[c:3]",
+    "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:4])-[NH;D2;+0:6]-[C;D1;H3:5]>>"
+    "[C;D1;H3:1]-[C;H0;D3;+0:2](-[Cl;H0;D1;+0:3])=[O;D1;H0:4].[C;D1;H3:5]-[NH2;D1;+0:6]",
+    "[Br;H0;D1;+0:1]-[c;H0;D3;+0:4](:[c:3]):[c:5]>>[Br;H0;D1;+0:1]-[Br;H0;D1;+0:2].[c:3]:[cH;D2;+0:4]:[c:5]",
+    "[C:5]-[O;H0;D2;+0:6]-[C;H0;D3;+0:2](-[C;D1;H3:1])=[O;D1;H0:3]>>"
+    "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:3])-[OH;D1;+0:4].[C:5]-[OH;D1;+0:6]",
+    "[c:12]:[c;H0;D3;+0:11](-[c;H0;D3;+0:2]1:[c:3]:[c:4]:[#7;a:5]:[c:6]:[c:7]:1):[c:13]>>"
+    "[Br;H0;D1;+0:1]-[c;H0;D3;+0:2]1:[c:3]:[c:4]:[#7;a:5]:[c:6]:[c:7]:1.[OH;D1;+0:8]-[B;H0;D3;+0:9](-[OH;D1;+0:10])-"
+    "[c;H0;D3;+0:11](:[c:12]):[c:13]",
+    "[OH;D1;+0:1]-[CH2;D2;+0:2]-[c:3]>>[O;H0;D1;+0:1]=[CH;D2;+0:2]-[c:3]",
+    "[C:1]-[OH;D1;+0:2]>>[C:1]-[O;H0;D2;+0:2]-[Si;H0;D4;+0:3](-[CH3;D1;+0:4])(-[CH3;D1;+0:5])-[CH3;D1;+0:6]",
+    "[c:2]-[N;H0;D3;+0:1](-[C:3])-[C:4]>>[Br;H0;D1;+0:5]-[c:2].[C:3]-[NH;D2;+0:1]-[C:4]",
+]
+
+compound_smiles_strings = [
+    "CC(=O)Nc1ccc(Cl)cc1",
+    "CC(=O)NC",
+    "CC(=O)Nc1ccccc1C(=O)NC",
+    "c1ccc(-c2ccncc2)cc1",
+    "COc1ccc(-c2ccncc2)cc1",
+    "c1ccc2c(c1)cccc2-c1ccccc1",
+    "COC(=O)CCN1CCOCC1",
+    "NCCO",
+    "NCCC",
+    "O=Cc1ccncc1",
+    "OCc1ccccc1",
+    "Brc1ccccc1",
+    "CCOC(C)=O",
+    "CN(C)c1ccccc1",
+    "c1ccc(N2CCOCC2)cc1",
+    "CCCCCC",
+    "O=C(NC1CC1)c1ccco1",
+]
+
+
+def get_applicable_retro_template_indices(
+        compound_mol: Mol
+) -> Set[int]:
+    """
+    Get the indices of the chemical reaction retro templates that produce at least one outcome on a chemical compound.
+
+    :parameter compound_mol: The RDKit Mol object of the chemical compound.
+
+    :returns: The indices of the applicable chemical reaction retro templates.
+    """
+
+    applicable_retro_template_indices = set()
+
+    for retro_template_index, retro_template_smarts in enumerate(retro_template_smarts_strings):
+        if len(ReactionFromSmarts(retro_template_smarts).RunReactants((compound_mol, ))) > 0:
+            applicable_retro_template_indices.add(
+                retro_template_index
+            )
+
+    return applicable_retro_template_indices
+
+
+@fixture(scope="module")
+def retro_template_applicability_index() -> ReactionTemplateApplicabilityIndex:
+    """ The chemical reaction template applicability index of the chemical reaction retro templates. """
+
+    return ReactionTemplateApplicabilityIndex.from_retro_templates(
+        retro_template_smarts_strings=retro_template_smarts_strings
+    )
+
+
+@fixture(scope="module")
+def reaction_center_environment_index() -> ReactionCenterEnvironmentIndex:
+    """ The chemical reaction retro template reaction center environment index. """
+
+    return ReactionCenterEnvironmentIndex.from_retro_templates(
+        retro_template_smarts_strings=retro_template_smarts_strings
+    )
+
+
+def test_retro_template_library_is_applicable() -> None:
+    """ Test whether the chemical reaction retro templates are applicable on most of the chemical compounds. """
+
+    assert sum(
+        len(get_applicable_retro_template_indices(
+            compound_mol=MolFromSmiles(compound_smiles)
+        )) > 0 for compound_smiles in compound_smiles_strings
+    ) >= len(compound_smiles_strings) // 2
+
+
+@mark.parametrize("compound_smiles", compound_smiles_strings)
+def test_applicability_index_does_not_drop_applicable_retro_templates(
+        compound_smiles: str,
+        retro_template_applicability_index: ReactionTemplateApplicabilityIndex
+) -> None:
+    """ Test whether the applicability index keeps all of the applicable chemical reaction retro templates. """
+
+    compound_mol = MolFromSmiles(compound_smiles)
+
+    assert get_applicable_retro_template_indices(
+        compound_mol=compound_mol
+    ) <= set(retro_template_applicability_index.get_candidate_retro_template_indices(
+        compound_mol=compound_mol
+    ).tolist())
+
+
+@mark.parametrize("compound_smiles", compound_smiles_strings)
+def test_environment_index_does_not_drop_applicable_retro_templates(
+        compound_smiles: str,
+        retro_template_applicability_index: ReactionTemplateApplicabilityIndex,
+        reaction_center_environment_index: ReactionCenterEnvironmentIndex
+) -> None:
+    """ Test whether the environment index keeps all of the applicable chemical reaction retro templates. """
+
+    compound_mol = MolFromSmiles(compound_smiles)
+
+    applicable_retro_template_indices = get_applicable_retro_template_indices(
+        compound_mol=compound_mol
+    )
+
+    candidate_retro_template_indices = reaction_center_environment_index.get_candidate_retro_template_indices(
+        compound_mol=compound_mol
+    )
+
+    assert applicable_retro_template_indices <= set(candidate_retro_template_indices.tolist())
+
+    candidate_retro_template_indices = reaction_center_environment_index.get_candidate_retro_template_indices(
+        compound_mol=compound_mol,
+        retro_template_indices=retro_template_applicability_index.get_candidate_retro_template_indices(
+            compound_mol=compound_mol
+        )
+    )
+
+    assert applicable_retro_template_indices <= set(candidate_retro_template_indices.tolist())